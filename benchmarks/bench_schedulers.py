@@ -0,0 +1,174 @@
+"""
+Scheduler benchmark suite.
+
+Times run() and compute_metrics() of every algorithm over synthetic
+workloads of growing size, records the peak memory of run() with
+tracemalloc and writes the results as JSON, so two commits can be compared:
+
+    python -m benchmarks.bench_schedulers run -o before.json
+    python -m benchmarks.bench_schedulers run -o after.json
+    python -m benchmarks.bench_schedulers compare before.json after.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from schedulers.registry import create_scheduler
+from workloads.generator import WorkloadGenerator
+from workloads.workload import Workload
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000)
+DEFAULT_ALGORITHMS = ("fcfs", "sjf", "rr", "srtf", "priority", "mlfq", "smp")
+DEFAULT_QUANTA = (1, 4, 16)
+
+# Mean burst and arrival rate keep the CPU about 90% busy
+MEAN_BURST = 10.0
+UTILIZATION = 0.9
+
+
+def bench_cases(algorithms, quanta):
+    """
+    Yield (algorithm, params) pairs, one per RR quantum for Round Robin
+    """
+    for algorithm in algorithms:
+        if algorithm == "rr":
+            for quantum in quanta:
+                yield algorithm, {"quantum": quantum}
+        else:
+            yield algorithm, {}
+
+
+def build_workload(size:int, seed:int) -> Workload:
+    """
+    Synthetic workload parsed once and shared by every algorithm of a size
+    """
+    generator = WorkloadGenerator(seed=seed, rate=UTILIZATION / MEAN_BURST, mean_burst=MEAN_BURST)
+    return Workload.from_rows(generator.rows(size))
+
+
+def bench_one(algorithm:str, params:dict, workload:Workload, backend:str, measure_memory:bool) -> dict:
+    """
+    Time one scheduler run; peak memory is measured in a second traced run
+    so tracemalloc does not slow down the timed one.
+    """
+    scheduler = create_scheduler(algorithm, workload.process_manager(backend), **params)
+    start = time.perf_counter()
+    scheduler.run()
+    run_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scheduler.compute_metrics()
+    metrics_seconds = time.perf_counter() - start
+
+    result = {
+        "algorithm": algorithm,
+        "params": params,
+        "size": len(workload),
+        "backend": backend,
+        "run_s": run_seconds,
+        "metrics_s": metrics_seconds,
+        "slices": len(scheduler.timeline),
+        "peak_mb": None,
+    }
+
+    if measure_memory:
+        scheduler = create_scheduler(algorithm, workload.process_manager(backend), **params)
+        tracemalloc.start()
+        try:
+            scheduler.run()
+            result["peak_mb"] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        finally:
+            tracemalloc.stop()
+
+    return result
+
+
+def case_key(result:dict) -> str:
+    params = ",".join(f"{k}={v}" for k, v in sorted(result["params"].items()))
+    return f"{result['algorithm']}[{params}] n={result['size']} {result['backend']}"
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(args) -> None:
+    results = []
+    for size in args.sizes:
+        workload = build_workload(size, args.seed)
+        for algorithm, params in bench_cases(args.algorithms, args.quanta):
+            result = bench_one(algorithm, params, workload, args.backend, not args.no_memory)
+            results.append(result)
+            peak = f"{result['peak_mb']:.1f} MB" if result["peak_mb"] is not None else "-"
+            print(f"{case_key(result):45} run={result['run_s']:.3f}s metrics={result['metrics_s']:.3f}s peak={peak}", flush=True)
+
+    report = {
+        "commit": git_commit(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"[OK] Resultados guardados en {args.output}")
+
+
+def compare(args) -> int:
+    """
+    Print the run() time ratio of every case present in both files.
+    Returns 1 if any case got slower than the threshold.
+    """
+    with open(args.baseline) as f:
+        baseline = {case_key(r): r for r in json.load(f)["results"]}
+    with open(args.current) as f:
+        current = {case_key(r): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    for key, result in current.items():
+        if key not in baseline:
+            continue
+        ratio = result["run_s"] / baseline[key]["run_s"] if baseline[key]["run_s"] > 0 else 1.0
+        flag = ""
+        if ratio > args.threshold:
+            flag = "  <-- REGRESIÓN"
+            regressions += 1
+        print(f"{key:45} {baseline[key]['run_s']:.3f}s -> {result['run_s']:.3f}s (x{ratio:.2f}){flag}")
+
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de los schedulers")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Ejecuta la suite y guarda un JSON")
+    run_parser.add_argument("-o", "--output", default="bench_results.json")
+    run_parser.add_argument("--sizes", type=lambda v: [int(x) for x in v.split(",")], default=list(DEFAULT_SIZES))
+    run_parser.add_argument("--algorithms", type=lambda v: v.split(","), default=list(DEFAULT_ALGORITHMS))
+    run_parser.add_argument("--quanta", type=lambda v: [int(x) for x in v.split(",")], default=list(DEFAULT_QUANTA))
+    run_parser.add_argument("--backend", choices=("objects", "table"), default="objects")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--no-memory", action="store_true", help="No medir memoria con tracemalloc")
+
+    compare_parser = commands.add_parser("compare", help="Compara dos JSON de resultados")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=1.2, help="Razón de tiempo considerada regresión")
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        run_suite(args)
+        return 0
+    return compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,10 @@ from ui.console import ConsoleUI
 from schedulers.fcfs import FCFSScheduler
 from schedulers.sjf import SJFScheduler
 from schedulers.round_robin import RoundRobinScheduler
+from schedulers.srtf import SRTFScheduler
+from schedulers.priority import PriorityScheduler
+from schedulers.mlfq import MLFQScheduler
+from schedulers.smp import SMPScheduler
 from filesystem.commands import FileSystemCLI, create_demo_filesystem
 
 def clear_screen():
@@ -34,13 +38,21 @@ def run_scheduler_module():
     schedulers = {
         "1": FCFSScheduler,
         "2": SJFScheduler,
-        "3": RoundRobinScheduler
+        "3": RoundRobinScheduler,
+        "4": SRTFScheduler,
+        "5": PriorityScheduler,
+        "6": MLFQScheduler,
+        "7": SMPScheduler
     }
     
     scheduler_names = {
         "1": "FCFS (First Come First Served)",
         "2": "SJF (Shortest Job First)",
-        "3": "Round Robin"
+        "3": "Round Robin",
+        "4": "SRTF (Shortest Remaining Time First)",
+        "5": "Prioridades (con aging)",
+        "6": "MLFQ (Multilevel Feedback Queue)",
+        "7": "SMP (multiprocesador)"
     }
     
     while True:
@@ -49,10 +61,14 @@ def run_scheduler_module():
         print("  1. FCFS (First Come First Served)")
         print("  2. SJF (Shortest Job First)")
         print("  3. Round Robin")
+        print("  4. SRTF (Shortest Remaining Time First)")
+        print("  5. Prioridades (con aging)")
+        print("  6. MLFQ (Multilevel Feedback Queue)")
+        print("  7. SMP (multiprocesador)")
         print()
         print("-" * 60)
         
-        choice = input("\nIngrese su opción (1-3): ").strip()
+        choice = input("\nIngrese su opción (1-7): ").strip()
         
         if choice in schedulers:
             selected_scheduler_class = schedulers[choice]
@@ -70,6 +86,50 @@ def run_scheduler_module():
                             print("[ERROR] El quantum debe ser mayor a 0")
                     except ValueError:
                         print("[ERROR] Ingrese un número entero válido")
+            elif choice == "5":
+                print()
+                preemptive = input("¿Expropiativo? (s/N): ").strip().lower() == "s"
+                while True:
+                    try:
+                        aging_interval = int(input("Intervalo de aging, 0 = sin aging (default: 0): ").strip() or "0")
+                        if aging_interval >= 0:
+                            selected_scheduler = lambda process_manager: selected_scheduler_class(process_manager=process_manager, preemptive=preemptive, aging_interval=aging_interval)
+                            break
+                        else:
+                            print("[ERROR] El intervalo no puede ser negativo")
+                    except ValueError:
+                        print("[ERROR] Ingrese un número entero válido")
+            elif choice == "6":
+                while True:
+                    try:
+                        print()
+                        quanta = input("Quantum de cada nivel separados por coma (default: 2,4,8): ").strip() or "2,4,8"
+                        quanta = tuple(int(q) for q in quanta.split(","))
+                        boost_interval = int(input("Intervalo de boost, 0 = sin boost (default: 0): ").strip() or "0")
+                        if all(q > 0 for q in quanta) and boost_interval >= 0:
+                            selected_scheduler = lambda process_manager: selected_scheduler_class(process_manager=process_manager, quanta=quanta, boost_interval=boost_interval)
+                            break
+                        else:
+                            print("[ERROR] Los quantum deben ser mayores a 0 y el intervalo no negativo")
+                    except ValueError:
+                        print("[ERROR] Ingrese números enteros válidos")
+            elif choice == "7":
+                while True:
+                    try:
+                        print()
+                        cpus = int(input("Número de CPUs (default: 2): ").strip() or "2")
+                        policy = input("Política por CPU: fcfs, sjf o rr (default: fcfs): ").strip().lower() or "fcfs"
+                        quantum = int(input("Quantum de Round Robin (default: 2): ").strip() or "2") if policy == "rr" else 2
+                        work_stealing = input("¿Robo de trabajo en CPUs ociosas? (S/n): ").strip().lower() != "n"
+                        balance_interval = int(input("Intervalo de balanceo, 0 = sin balanceo (default: 0): ").strip() or "0")
+                        migration_cost = int(input("Costo de migración (default: 0): ").strip() or "0")
+                        if cpus > 0 and policy in ("fcfs", "sjf", "rr") and quantum > 0 and balance_interval >= 0 and migration_cost >= 0:
+                            selected_scheduler = lambda process_manager: selected_scheduler_class(process_manager=process_manager, cpus=cpus, policy=policy, quantum=quantum, work_stealing=work_stealing, balance_interval=balance_interval, migration_cost=migration_cost)
+                            break
+                        else:
+                            print("[ERROR] Valores inválidos: CPUs y quantum mayores a 0, política fcfs/sjf/rr, intervalo y costo no negativos")
+                    except ValueError:
+                        print("[ERROR] Ingrese números enteros válidos")
             else:
                 selected_scheduler = selected_scheduler_class
             
@@ -103,6 +163,9 @@ def run_scheduler_module():
             ui.show_metrics()
 
         elif option == "5":
+            ui.show_gantt_gui()
+
+        elif option == "6":
             clear_screen()
             print("\n[INFO] Volviendo al menú principal...\n")
             break
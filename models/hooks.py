@@ -0,0 +1,66 @@
+EVENTS = ("dispatch", "preempt", "block", "unblock", "complete", "idle")
+
+
+def _noop(subject, time) -> None:
+    pass
+
+
+class Hooks:
+    """
+    Observer surface shared by a ProcessManager and its Scheduler.
+    Every event is a plain attribute holding one callable with the
+    signature callback(subject, time): the process for dispatch, preempt,
+    block, unblock and complete, the CPU number for idle. While an event
+    has no subscribers its attribute is bound to a shared no-op, so an
+    unobserved run only pays for an empty call; with one subscriber the
+    attribute is the callback itself.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0
+        self._subscribers = {event: [] for event in EVENTS}
+        for event in EVENTS:
+            setattr(self, event, _noop)
+
+    def subscribe(self, event:str, callback) -> None:
+        if event not in self._subscribers:
+            raise ValueError(f"Evento desconocido: {event} (opciones: {', '.join(EVENTS)})")
+        self._subscribers[event].append(callback)
+        self._bind(event)
+
+    def unsubscribe(self, event:str, callback) -> None:
+        self._subscribers[event].remove(callback)
+        self._bind(event)
+
+    def attach(self, observer) -> None:
+        """
+        Subscribe every on_<event> method the observer defines
+        """
+        for event in EVENTS:
+            callback = getattr(observer, f"on_{event}", None)
+            if callback is not None:
+                self.subscribe(event, callback)
+
+    def detach(self, observer) -> None:
+        for event in EVENTS:
+            callback = getattr(observer, f"on_{event}", None)
+            if callback is not None and callback in self._subscribers[event]:
+                self.unsubscribe(event, callback)
+
+    def observed(self, *events:str) -> bool:
+        """
+        Checks if any of the events (any event by default) has subscribers
+        """
+        return any(self._subscribers[event] for event in events or EVENTS)
+
+    def _bind(self, event:str) -> None:
+        subscribers = tuple(self._subscribers[event])
+        if not subscribers:
+            setattr(self, event, _noop)
+        elif len(subscribers) == 1:
+            setattr(self, event, subscribers[0])
+        else:
+            def fan_out(subject, time):
+                for callback in subscribers:
+                    callback(subject, time)
+            setattr(self, event, fan_out)
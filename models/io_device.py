@@ -0,0 +1,50 @@
+from collections import deque
+
+# I/O steps on this pseudo-device are sleeps timed by the ProcessManager's
+# timing wheel instead of requests queued on a device
+SLEEP = "sleep"
+
+
+class IODevice:
+    """
+    Simulated I/O device that serves one request at a time in FIFO order.
+    The scheduler times the request being served with an IO_WAKEUP event.
+    """
+
+    def __init__(self, name:str) -> None:
+        self.name = name
+        self.queue = deque()
+        self.current = None
+        self.busy_time = 0
+        self.served = 0
+
+    def request(self, process):
+        """
+        Queue an I/O request.
+
+        Returns:
+            The process if the device was idle and starts serving it now, None otherwise
+        """
+        if self.current is None:
+            self.current = process
+            return process
+        self.queue.append(process)
+        return None
+
+    def finish(self, io_time:int):
+        """
+        The request being served is done.
+
+        Returns:
+            The next queued process, which the device starts serving now, or None
+        """
+        self.busy_time += io_time
+        self.served += 1
+        self.current = self.queue.popleft() if self.queue else None
+        return self.current
+
+    def __len__(self) -> int:
+        """
+        Requests in the device, the one being served included
+        """
+        return len(self.queue) + (self.current is not None)
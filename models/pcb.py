@@ -37,6 +37,10 @@ class PCB:
         self.arrival_time = arrival_time
         self.priority = priority
 
+        #I/O info: pending (device, io_time, cpu_time) steps after the current CPU burst
+        self.io_bursts = ()
+        self.io_time = 0
+
         #Scheduling metrics
         self.waiting_time = 0
         self.turnaround_time = 0
@@ -1,3 +1,4 @@
+from collections import deque
 from models.pcb import PCB, ProcessState
 
 class Process:
@@ -5,8 +6,20 @@ class Process:
     High_level representation of a process that wraps its PCB.
     """
 
-    def __init__(self, pid:int, burst_time:int, arrival_time:int=0, priority:int=0, user:str="") -> None:
-        self.pcb = PCB(pid, burst_time, arrival_time, priority)
+    def __init__(self, pid:int, burst_time:int, arrival_time:int=0, priority:int=0, user:str="", io=()) -> None:
+        """
+        Args:
+            burst_time: First CPU burst (the only one without io)
+            io: (device, io_time, cpu_time) steps that follow the first CPU burst:
+                each I/O burst on a device is followed by another CPU burst
+        """
+        if io:
+            self.pcb = PCB(pid, burst_time + sum(cpu_time for _, _, cpu_time in io), arrival_time, priority)
+            self.pcb.remaining_time = burst_time
+            self.pcb.io_bursts = deque(io)
+            self.pcb.io_time = sum(io_time for _, io_time, _ in io)
+        else:
+            self.pcb = PCB(pid, burst_time, arrival_time, priority)
         self.user = user
     
     
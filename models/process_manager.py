@@ -1,6 +1,396 @@
+import heapq
+import itertools
 from collections import deque
+from models.hooks import Hooks
 from models.process import Process
 from models.pcb import ProcessState
+from models.timing_wheel import TimingWheel
+from workloads.loader import TraceReader
+
+
+def by_burst_time(process:Process) -> int:
+    return process.pcb.burst_time
+
+
+def by_remaining_time(process:Process) -> int:
+    return process.pcb.remaining_time
+
+
+def by_priority(process:Process) -> int:
+    return process.pcb.priority
+
+
+class ReadyQueue:
+    """
+    Interface of the READY queue used by ProcessManager.
+    popleft() always returns the process that should run next.
+    """
+
+    def append(self, process:Process) -> None:
+        raise NotImplementedError
+
+    def popleft(self) -> Process:
+        raise NotImplementedError
+
+    def pop(self) -> Process:
+        """
+        Remove and return the process that would run last
+        """
+        raise NotImplementedError
+
+    def peek(self) -> Process:
+        raise NotImplementedError
+
+    def remove(self, process:Process) -> None:
+        raise NotImplementedError
+
+    def remove_pid(self, pid:int) -> Process | None:
+        """
+        Remove and return the queued process with this PID, None if it is not queued
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __iter__(self):
+        raise NotImplementedError
+
+
+class FIFOReadyQueue(ReadyQueue):
+    """
+    First-in first-out ready queue backed by a deque.
+    """
+
+    def __init__(self) -> None:
+        self._queue = deque()
+
+    def append(self, process:Process) -> None:
+        self._queue.append(process)
+
+    def appendleft(self, process:Process) -> None:
+        self._queue.appendleft(process)
+
+    def popleft(self) -> Process:
+        return self._queue.popleft()
+
+    def pop(self) -> Process:
+        return self._queue.pop()
+
+    def peek(self) -> Process:
+        return self._queue[0]
+
+    def remove(self, process:Process) -> None:
+        self._queue.remove(process)
+
+    def remove_pid(self, pid:int) -> Process | None:
+        for index, process in enumerate(self._queue):
+            if process.pcb.pid == pid:
+                del self._queue[index]
+                return process
+        return None
+
+    def clear(self) -> None:
+        self._queue.clear()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self):
+        return iter(self._queue)
+
+
+class HeapReadyQueue(ReadyQueue):
+    """
+    Binary heap ready queue ordered by key(process).
+    The key is evaluated when the process is appended; ties keep insertion order.
+    """
+
+    def __init__(self, key=by_burst_time) -> None:
+        self.key = key
+        self._heap = []
+        self._seq = itertools.count()
+
+    def append(self, process:Process) -> None:
+        heapq.heappush(self._heap, (self.key(process), next(self._seq), process))
+
+    def popleft(self) -> Process:
+        return heapq.heappop(self._heap)[2]
+
+    def pop(self) -> Process:
+        """
+        O(n): the last entry is one of the leaves
+        """
+        heap = self._heap
+        index = max(range(len(heap) // 2, len(heap)), key=lambda i: heap[i][:2])
+        process = heap[index][2]
+        heap[index] = heap[-1]
+        heap.pop()
+        heapq.heapify(heap)
+        return process
+
+    def peek(self) -> Process:
+        return self._heap[0][2]
+
+    def remove(self, process:Process) -> None:
+        """
+        O(n) removal, use IndexedHeapReadyQueue when removals are frequent
+        """
+        for i, entry in enumerate(self._heap):
+            if entry[2] is process:
+                self._heap[i] = self._heap[-1]
+                self._heap.pop()
+                heapq.heapify(self._heap)
+                return
+        raise ValueError(f"Process {process.pcb.pid} is not in the ready queue")
+
+    def remove_pid(self, pid:int) -> Process | None:
+        """
+        O(n), like remove()
+        """
+        for i, entry in enumerate(self._heap):
+            if entry[2].pcb.pid == pid:
+                self._heap[i] = self._heap[-1]
+                self._heap.pop()
+                heapq.heapify(self._heap)
+                return entry[2]
+        return None
+
+    def clear(self) -> None:
+        self._heap.clear()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self):
+        """
+        Iterate in dispatch order (O(n log n), meant for display)
+        """
+        return (entry[2] for entry in sorted(self._heap, key=lambda entry: entry[:2]))
+
+
+class IndexedHeapReadyQueue(ReadyQueue):
+    """
+    Binary heap ready queue with a PID -> position index.
+    Supports O(log n) remove() and update() (decrease/increase key).
+    """
+
+    def __init__(self, key=by_priority) -> None:
+        self.key = key
+        self._heap = []
+        self._position = {}
+        self._seq = itertools.count()
+
+    def append(self, process:Process) -> None:
+        self._heap.append([self.key(process), next(self._seq), process])
+        self._position[process.pcb.pid] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def popleft(self) -> Process:
+        process = self._heap[0][2]
+        self._delete(0)
+        return process
+
+    def pop(self) -> Process:
+        """
+        O(n): the last entry is one of the leaves
+        """
+        heap = self._heap
+        index = max(range(len(heap) // 2, len(heap)), key=lambda i: heap[i][:2])
+        process = heap[index][2]
+        self._delete(index)
+        return process
+
+    def peek(self) -> Process:
+        return self._heap[0][2]
+
+    def remove(self, process:Process) -> None:
+        index = self._position.get(process.pcb.pid)
+        if index is None:
+            raise ValueError(f"Process {process.pcb.pid} is not in the ready queue")
+        self._delete(index)
+
+    def remove_pid(self, pid:int) -> Process | None:
+        """
+        O(log n) through the PID index
+        """
+        index = self._position.get(pid)
+        if index is None:
+            return None
+        process = self._heap[index][2]
+        self._delete(index)
+        return process
+
+    def update(self, process:Process, key=None) -> None:
+        """
+        Re-key a queued process, key(process) is used when no key is given
+        """
+        index = self._position[process.pcb.pid]
+        entry = self._heap[index]
+        old_key = entry[0]
+        entry[0] = self.key(process) if key is None else key
+        if entry[0] < old_key:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def key_of(self, process:Process):
+        """
+        Current key of a queued process
+        """
+        return self._heap[self._position[process.pcb.pid]][0]
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._position.clear()
+
+    def __contains__(self, process:Process) -> bool:
+        return process.pcb.pid in self._position
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self):
+        """
+        Iterate in dispatch order (O(n log n), meant for display)
+        """
+        return (entry[2] for entry in sorted(self._heap, key=lambda entry: entry[:2]))
+
+    def _delete(self, index:int) -> None:
+        heap = self._heap
+        del self._position[heap[index][2].pcb.pid]
+        last = heap.pop()
+        if index < len(heap):
+            heap[index] = last
+            self._position[last[2].pcb.pid] = index
+            self._sift_up(index)
+            self._sift_down(self._position[last[2].pcb.pid])
+
+    def _swap(self, i:int, j:int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._position[heap[i][2].pcb.pid] = i
+        self._position[heap[j][2].pcb.pid] = j
+
+    def _sift_up(self, index:int) -> None:
+        heap = self._heap
+        while index > 0:
+            parent = (index - 1) >> 1
+            if heap[index][:2] < heap[parent][:2]:
+                self._swap(index, parent)
+                index = parent
+            else:
+                break
+
+    def _sift_down(self, index:int) -> None:
+        heap = self._heap
+        size = len(heap)
+        while True:
+            smallest = index
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < size and heap[child][:2] < heap[smallest][:2]:
+                    smallest = child
+            if smallest == index:
+                break
+            self._swap(index, smallest)
+            index = smallest
+
+
+class MultilevelReadyQueue(ReadyQueue):
+    """
+    Ready queue with several FIFO levels, level 0 being the highest.
+    Each level is a deque of segments (deques of processes), so boost() can
+    splice every lower level into level 0 by moving segment references in
+    O(levels) instead of moving every process. Levels are stored per PID
+    together with a boost epoch: a level assigned before the last boost
+    reads as level 0.
+    """
+
+    def __init__(self, levels:int) -> None:
+        self._levels = [deque() for _ in range(levels)]
+        self._assigned = {}
+        self._epoch = 0
+        self._size = 0
+
+    def level_of(self, process:Process) -> int:
+        level, epoch = self._assigned.get(process.pcb.pid, (0, self._epoch))
+        return level if epoch == self._epoch else 0
+
+    def set_level(self, process:Process, level:int) -> None:
+        self._assigned[process.pcb.pid] = (level, self._epoch)
+
+    def forget(self, process:Process) -> None:
+        """
+        Drop the level of a finished process
+        """
+        self._assigned.pop(process.pcb.pid, None)
+
+    def boost(self) -> None:
+        """
+        Move every process to level 0 keeping their relative order
+        """
+        top = self._levels[0]
+        for segments in self._levels[1:]:
+            top.extend(segments)
+            segments.clear()
+        self._epoch += 1
+
+    def append(self, process:Process) -> None:
+        segments = self._levels[self.level_of(process)]
+        if not segments:
+            segments.append(deque())
+        segments[-1].append(process)
+        self._size += 1
+
+    def popleft(self) -> Process:
+        for segments in self._levels:
+            if segments:
+                segment = segments[0]
+                process = segment.popleft()
+                if not segment:
+                    segments.popleft()
+                self._size -= 1
+                return process
+        raise IndexError("pop from an empty ready queue")
+
+    def peek(self) -> Process:
+        for segments in self._levels:
+            if segments:
+                return segments[0][0]
+        raise IndexError("peek from an empty ready queue")
+
+    def remove(self, process:Process) -> None:
+        for segments in self._levels:
+            for segment in segments:
+                if process in segment:
+                    segment.remove(process)
+                    if not segment:
+                        segments.remove(segment)
+                    self._size -= 1
+                    return
+        raise ValueError(f"Process {process.pcb.pid} is not in the ready queue")
+
+    def remove_pid(self, pid:int) -> Process | None:
+        for process in self:
+            if process.pcb.pid == pid:
+                self.remove(process)
+                return process
+        return None
+
+    def clear(self) -> None:
+        for segments in self._levels:
+            segments.clear()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return (process for segments in self._levels for segment in segments for process in segment)
+
 
 class ProcessManager:
     """
@@ -8,23 +398,58 @@ class ProcessManager:
     It is responsible for creating, scheduling and tracking processes throughout their lifecycle.
     """
     
-    def __init__(self):
-        self.ready_queue = deque()
-        self.blocked_queue = deque()
+    def __init__(self, ready_queue:ReadyQueue=None):
+        self.ready_queue = ready_queue if ready_queue is not None else FIFOReadyQueue()
+        # Blocked processes by PID, so unblocking is O(1)
+        self.blocked = {}
+        # Wakeup timers of sleeping and timed-blocked processes, by PID
+        self.timers = TimingWheel()
         self.terminated_list = []
+        self.terminated_count = 0
+        self.retire = False
+        self.record = None
         self.current_process = None
         self._context_switch_count = 0
+        self.table = None
+        self.arrival_source = None
+        self.load_diagnostics = []
+        self.hooks = Hooks()
+        # Scheduler running these processes, it accounts the slice of a running process put to sleep
+        self.scheduler = None
     
-    def create_process(self, pid:int, burst_time:int, arrival_time:int=0, priority:int=0, user:str="system") -> Process:
+    def create_process(self, pid:int, burst_time:int, arrival_time:int=0, priority:int=0, user:str="system", io=()) -> Process:
         """
         Creates a new process, initializes its PCB and appends it to the READY queue.
         """
         
-        process = Process(pid, burst_time, arrival_time, priority, user)
+        process = Process(pid, burst_time, arrival_time, priority, user, io)
         process.change_state(ProcessState.READY)
         self.ready_queue.append(process)
         return process
+
+    def admit_process(self, process:Process) -> None:
+        """
+        Puts an already created process in the READY queue when it arrives.
+        """
+        process.change_state(ProcessState.READY)
+        self.ready_queue.append(process)
     
+    def load_table(self, table) -> None:
+        """
+        Uses a columnar ProcessTable as the source of processes.
+        Schedulers admit its rows as lightweight ProcessView objects when
+        they arrive instead of creating a Process per row up front.
+        """
+        self.table = table
+
+    def set_ready_queue(self, ready_queue:ReadyQueue) -> None:
+        """
+        Replaces the READY queue implementation, keeping the queued processes.
+        """
+        for process in self.ready_queue:
+            ready_queue.append(process)
+        self.ready_queue = ready_queue
+
     def get_current_process(self) -> Process | None:
         """
         Returns the actual process in CPU
@@ -40,11 +465,13 @@ class ProcessManager:
             if self.current_process.pcb.state != ProcessState.TERMINATED:
                 self.current_process.change_state(ProcessState.READY)
                 self.ready_queue.append(self.current_process)
-        
+                self.hooks.preempt(self.current_process, self.hooks.now)
+
         if self.ready_queue:
             self.current_process = self.ready_queue.popleft()
             self.current_process.change_state(ProcessState.RUNNING)
             self._context_switch_count += 1
+            self.hooks.dispatch(self.current_process, self.hooks.now)
         else:
             self.current_process = None
 
@@ -67,54 +494,149 @@ class ProcessManager:
         """
         return self._context_switch_count
 
+    def add_context_switches(self, count:int) -> None:
+        """
+        Accounts context switches applied in bulk by a scheduler.
+        """
+        self._context_switch_count += count
+
+    def retire_terminated(self, record=None) -> None:
+        """
+        Retire mode: finished processes are only counted (and written to the
+        optional ProcessRecord) instead of kept in terminated_list, so long
+        runs keep flat memory. Their metrics still reach the scheduler's
+        MetricsAccumulator when they complete.
+        """
+        self.retire = True
+        self.record = record
+
     def terminate_current_process(self, current_time:int):
         """
-        Finishes the actual process and append it to terminated_list
+        Finishes the actual process and append it to terminated_list (or retires it)
         """
 
         if self.current_process:
             self.current_process.change_state(ProcessState.TERMINATED, current_time)
-            self.terminated_list.append(self.current_process)
+            self.terminated_count += 1
+            if not self.retire:
+                self.terminated_list.append(self.current_process)
+            elif self.record is not None:
+                self.record.write(self.current_process)
+            self.hooks.complete(self.current_process, current_time)
             self.current_process = None
     
-    def block_current_process(self):
+    def preempt_current_process(self):
+        """
+        Takes the CPU away from the actual process and sends it back to READY
+        """
+        if self.current_process:
+            self.current_process.change_state(ProcessState.READY)
+            self.ready_queue.append(self.current_process)
+            self.hooks.preempt(self.current_process, self.hooks.now)
+            self.current_process = None
+
+    def block_current_process(self, timeout:int | None=None, step=None):
         """
-        Blocks the actual process
+        Blocks the actual process. With a timeout it is also woken after that
+        many ticks unless unblock_process() wakes it first (timed block).
+        The scheduler calls it once the slice is accounted; use sleep() to
+        block a running process in the middle of a run.
+
+        Args:
+            step: Sleep step of the trace timed by the timeout, handed back by expire_timers()
         """
         if self.current_process:
-            self.current_process.change_state(ProcessState.BLOCKED)
-            self.blocked_queue.append(self.current_process)
+            self._block(self.current_process, timeout, step)
             self.current_process = None
 
+    def sleep(self, pid:int, ticks:int) -> bool:
+        """
+        Blocks the running or a READY process for `ticks` time units.
+        The running process goes through the scheduler, which accounts the
+        slice it ran so far; a READY process is taken out of the ready queue.
+
+        Returns:
+            False if the process is neither running nor READY
+        """
+        if self.current_process and self.current_process.pcb.pid == pid:
+            if self.scheduler is not None:
+                self.scheduler.sleep_running(self, ticks)
+            else:
+                self.block_current_process(ticks)
+            return True
+        process = self.ready_queue.remove_pid(pid)
+        if process is None:
+            return False
+        self._block(process, ticks)
+        return True
+
+    def expire_timers(self, time:int) -> list:
+        """
+        Advance the timing wheel to `time` and return a (process, step) pair
+        for every sleep or timed block that expired, in expiry order. The
+        processes are still BLOCKED; step is the trace sleep step that armed
+        the timer, None for sleep() and timed blocks.
+        """
+        return self.timers.advance(time)
+
+    def _block(self, process:Process, timeout:int | None, step=None) -> None:
+        process.change_state(ProcessState.BLOCKED)
+        self.blocked[process.pcb.pid] = process
+        if timeout is not None:
+            self.timers.arm(process.pcb.pid, self.timers.now + timeout, (process, step))
+        self.hooks.block(process, self.hooks.now)
+
     def unblock_process(self, process:Process):
         """
-        Moves a blocked process to READY again
+        Moves a blocked process to READY again, in O(1) through the PID
+        index, cancelling its wakeup timer if it has one
         """
 
-        if process in self.blocked_queue:
-            self.blocked_queue.remove(process)
+        if self.blocked.pop(process.pcb.pid, None) is not None:
+            if self.timers:
+                self.timers.cancel(process.pcb.pid)
             process.change_state(ProcessState.READY)
             self.ready_queue.append(process)
+            self.hooks.unblock(process, self.hooks.now)
     
-    def load_from_file(self, filepath:str):
-
+    def load_from_file(self, filepath:str, error_budget:int | None=None):
+        """
+        Loads every process of a trace (plain, gzip/bz2/xz or binary workload)
+        into the READY queue. Invalid lines are reported and skipped; loading
+        stops if there are more than error_budget of them.
+        """
+        reader = TraceReader(filepath, error_budget=error_budget)
         try:
-            with open(filepath, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-
-                    parts = line.split(",")
-                    if len(parts) < 5:
-                        raise ValueError(f"[ERROR] Formato de línea inválido: {line}")
-
-                    pid = int(parts[0])
-                    arrival = int(parts[1])
-                    burst = int(parts[2])
-                    priority = int(parts[3])
-                    user = parts[4]
-
-                    self.create_process(pid, burst, arrival, priority, user)
-        except Exception as e:
-            print(f"[ERROR] No se pudieron cargar los procesos: {e}")
\ No newline at end of file
+            for pid, arrival, burst, priority, user, io in reader.records():
+                self.create_process(pid, burst, arrival, priority, user, io)
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] No se pudieron cargar los procesos: {e}")
+        finally:
+            self.load_diagnostics = reader.diagnostics
+            for diagnostic in reader.diagnostics:
+                print(f"[WARN] {diagnostic}")
+            if reader.invalid_lines > len(reader.diagnostics):
+                print(f"[WARN] ... y {reader.invalid_lines - len(reader.diagnostics)} líneas inválidas más")
+
+    def stream_from_file(self, filepath:str, error_budget:int | None=None, reorder_window:int | None=None):
+        """
+        Lazily feeds the processes of a trace to the next scheduler run.
+        Processes are created as the scheduler reaches their arrival time, so
+        the trace never has to fit in memory. Diagnostics are collected in
+        load_diagnostics while the run reads the file.
+
+        Args:
+            reorder_window: Rows buffered to sort a nearly sorted trace; rows
+                            still out of order are reported and skipped. With
+                            None the trace must be sorted and the run raises
+                            ValueError at the first out-of-order row.
+        """
+        reader = TraceReader(filepath, error_budget=error_budget, reorder_window=reorder_window, sorted_input=True)
+        self.stream_processes(reader.processes())
+        self.load_diagnostics = reader.diagnostics
+
+    def stream_processes(self, processes):
+        """
+        Lazily feeds processes, already sorted by arrival, to the next scheduler run.
+        """
+        self.arrival_source = processes
@@ -0,0 +1,195 @@
+import numpy as np
+from models.pcb import ProcessState
+from models.process import Process
+from workloads.binary import BinaryWorkload, is_binary_workload
+from workloads.loader import TraceReader
+
+STATES = tuple(ProcessState)
+STATE_CODES = {state: code for code, state in enumerate(STATES)}
+
+
+def _column(name:str):
+    """
+    Property that reads and writes one element of a table column
+    """
+
+    def getter(view):
+        return int(getattr(view.table, name)[view.index])
+
+    def setter(view, value):
+        column = getattr(view.table, name)
+        if not column.flags.writeable:
+            column = view.table.own_column(name)
+        column[view.index] = value
+
+    return property(getter, setter)
+
+
+class ProcessView:
+    """
+    Lightweight Process backed by one row of a ProcessTable.
+    It behaves as both the Process and its PCB (view.pcb is the view
+    itself), so schedulers, ProcessManager and the UI can use it unchanged.
+    """
+
+    __slots__ = ("table", "index")
+
+    pid = _column("pid")
+    arrival_time = _column("arrival")
+    burst_time = _column("burst")
+    remaining_time = _column("remaining")
+    priority = _column("priority")
+    program_counter = _column("program_counter")
+    start_time = _column("start")
+    completion_time = _column("completion")
+    response_time = _column("response")
+    waiting_time = _column("waiting")
+    turnaround_time = _column("turnaround")
+    # Table rows are CPU-only processes
+    io_bursts = ()
+    io_time = 0
+
+    change_state = Process.change_state
+    execute = Process.execute
+    update_times = Process.update_times
+    is_completed = Process.is_completed
+    __str__ = Process.__str__
+
+    def __init__(self, table, index:int) -> None:
+        self.table = table
+        self.index = index
+
+    @property
+    def pcb(self):
+        return self
+
+    @property
+    def state(self) -> ProcessState:
+        return STATES[self.table.state[self.index]]
+
+    @state.setter
+    def state(self, value:ProcessState) -> None:
+        self.table.state[self.index] = STATE_CODES[value]
+
+    @property
+    def user(self) -> str:
+        return self.table.users[self.table.user[self.index]]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ProcessView) and other.table is self.table and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.table), self.index))
+
+
+class ProcessViews:
+    """
+    Read-only sequence of ProcessView objects for a list of table rows.
+    Views are created on access, so a finished run over millions of rows
+    does not need one object per process.
+    """
+
+    def __init__(self, table, rows) -> None:
+        self.table = table
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index:int) -> ProcessView:
+        return ProcessView(self.table, int(self.rows[index]))
+
+    def __iter__(self):
+        return (ProcessView(self.table, row) for row in self.rows.tolist())
+
+
+class ProcessTable:
+    """
+    Struct-of-arrays process table for very large workloads.
+    Every PCB field is a NumPy column and states are stored as int8 codes
+    (index in STATES). User names are interned in `users` and referenced
+    by index from the `user` column.
+    The static columns (pid, arrival, burst, priority, user) may be shared
+    read-only arrays; they are copied only if a run writes to them.
+    """
+
+    def __init__(self, pid, arrival, burst, priority=None, user=None, users=None) -> None:
+        self.pid = np.asarray(pid, dtype=np.int64)
+        n = len(self.pid)
+        self.arrival = np.asarray(arrival, dtype=np.int64)
+        self.burst = np.asarray(burst, dtype=np.int64)
+        self.priority = np.zeros(n, dtype=np.int32) if priority is None else np.asarray(priority, dtype=np.int32)
+        self.user = np.zeros(n, dtype=np.int32) if user is None else np.asarray(user, dtype=np.int32)
+        self.users = list(users) if users is not None else ["system"]
+
+        self.remaining = self.burst.copy()
+        self.program_counter = np.zeros(n, dtype=np.int64)
+        self.start = np.full(n, -1, dtype=np.int64)
+        self.completion = np.zeros(n, dtype=np.int64)
+        self.response = np.full(n, -1, dtype=np.int64)
+        self.waiting = np.zeros(n, dtype=np.int64)
+        self.turnaround = np.zeros(n, dtype=np.int64)
+        self.state = np.full(n, STATE_CODES[ProcessState.NEW], dtype=np.int8)
+
+    def own_column(self, name:str):
+        """
+        Replace a shared read-only column (memory-mapped or owned by a
+        Workload) with a private writable copy, on its first write
+        """
+        column = np.array(getattr(self, name))
+        setattr(self, name, column)
+        return column
+
+    @classmethod
+    def from_rows(cls, rows) -> "ProcessTable":
+        """
+        Build a table from (pid, arrival, burst, priority, user) rows
+        """
+        pids, arrivals, bursts, priorities, user_ids = [], [], [], [], []
+        users = {}
+        for pid, arrival, burst, priority, user in rows:
+            pids.append(pid)
+            arrivals.append(arrival)
+            bursts.append(burst)
+            priorities.append(priority)
+            user_ids.append(users.setdefault(user, len(users)))
+        return cls(pids, arrivals, bursts, priorities, user_ids, users)
+
+    @classmethod
+    def from_file(cls, filepath:str, error_budget:int | None=None) -> "ProcessTable":
+        """
+        Load a table from a pid,arrival,burst,priority,user trace (plain,
+        compressed or binary workload). The columns of a binary workload are
+        views of its mapping, which is released with the table.
+        """
+        if is_binary_workload(filepath):
+            return cls.from_binary(BinaryWorkload(filepath))
+        return cls.from_rows(TraceReader(filepath, error_budget=error_budget).rows())
+
+    @classmethod
+    def from_binary(cls, workload:BinaryWorkload) -> "ProcessTable":
+        """
+        Build a table over a memory-mapped binary workload.
+        The static columns are zero-copy views of the mapped records, only
+        the per-run columns (remaining, start, completion...) are allocated.
+        """
+        records = workload.records()
+        return cls(records["pid"], records["arrival"], records["burst"], records["priority"], records["user"], workload.users)
+
+    def __len__(self) -> int:
+        return len(self.pid)
+
+    def view(self, index:int) -> ProcessView:
+        return ProcessView(self, index)
+
+    def views(self):
+        return (ProcessView(self, index) for index in range(len(self)))
+
+    def views_in(self, rows) -> ProcessViews:
+        return ProcessViews(self, rows)
+
+    def arrival_order(self):
+        """
+        Row indexes sorted by arrival time, ties keep table order
+        """
+        return np.argsort(self.arrival, kind="stable")
@@ -0,0 +1,74 @@
+from models.pcb import ProcessState
+
+
+class ContextSwitchCounter:
+    """
+    Times each process was given the CPU, fed by the dispatch hook.
+    Attach it before the run: hooks.attach(ContextSwitchCounter()).
+    """
+
+    def __init__(self) -> None:
+        self.counts = {}
+
+    def on_dispatch(self, process, time:int) -> None:
+        pid = process.pcb.pid
+        self.counts[pid] = self.counts.get(pid, 0) + 1
+
+    def __getitem__(self, pid:int) -> int:
+        return self.counts.get(pid, 0)
+
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+class StateTransitionHistogram:
+    """
+    Counts of every (from, to) state transition and how long processes
+    stayed in the state they left. Dwell times are kept in power-of-two
+    buckets (bucket b holds times in [2^(b-1), 2^b), bucket 0 holds 0), so
+    memory only grows with the log of the longest dwell time. A process
+    enters READY at its arrival time.
+    """
+
+    def __init__(self) -> None:
+        self.transitions = {}
+        self.dwell = {}
+        # pid -> (state, time it was entered), only for processes still alive
+        self._entered = {}
+
+    def on_dispatch(self, process, time:int) -> None:
+        self._record(process, ProcessState.RUNNING, time)
+
+    def on_preempt(self, process, time:int) -> None:
+        self._record(process, ProcessState.READY, time)
+
+    def on_block(self, process, time:int) -> None:
+        self._record(process, ProcessState.BLOCKED, time)
+
+    def on_unblock(self, process, time:int) -> None:
+        self._record(process, ProcessState.READY, time)
+
+    def on_complete(self, process, time:int) -> None:
+        self._record(process, ProcessState.TERMINATED, time)
+        self._entered.pop(process.pcb.pid, None)
+
+    def count(self, source:ProcessState, target:ProcessState) -> int:
+        return self.transitions.get((source, target), 0)
+
+    def dwell_histogram(self, state:ProcessState) -> dict:
+        """
+        {bucket upper bound: transitions} of the time spent in `state` before leaving it
+        """
+        buckets = self.dwell.get(state, {})
+        return {(1 << bucket) if bucket else 0: count for bucket, count in sorted(buckets.items())}
+
+    def _record(self, process, target:ProcessState, time:int) -> None:
+        pcb = process.pcb
+        source, entered = self._entered.get(pcb.pid, (ProcessState.READY, pcb.arrival_time))
+        key = (source, target)
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+
+        buckets = self.dwell.setdefault(source, {})
+        bucket = max(0, time - entered).bit_length()
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+        self._entered[pcb.pid] = (target, time)
@@ -0,0 +1,147 @@
+class TimingWheel:
+    """
+    Hierarchical timing wheel for timers on integer ticks.
+    Level L has 2^bits slots of 2^(bits*L) ticks each. A timer is stored at
+    the level of the highest bit group in which its expiry differs from the
+    current time, in the slot given by that group of its expiry, so arming
+    and cancelling are O(1) dictionary operations. A bitmap of the non-empty
+    slots of every level finds the next expiry without scanning. advance()
+    jumps straight to the next expiry, cascading only the one slot per level
+    that the jump enters, so idle gaps cost nothing however long they are.
+    Timers beyond the span of the wheel wait in an overflow table.
+    """
+
+    def __init__(self, levels:int=4, bits:int=6, now:int=0) -> None:
+        self.levels = levels
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.now = now
+        self._slots = [[{} for _ in range(1 << bits)] for _ in range(levels)]
+        self._occupied = [0] * levels
+        self._overflow = {}
+        # key -> (level, slot) of every armed timer, level == levels for the overflow
+        self._where = {}
+        self._next = None
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key) -> bool:
+        return key in self._where
+
+    def arm(self, key, expires:int, value=None) -> None:
+        """
+        Arm (or re-arm) the timer `key` to fire at tick `expires` with `value`
+        """
+        if key in self._where:
+            self.cancel(key)
+        expires = max(expires, self.now)
+        self._place(key, expires, value)
+        if self._next is not None and expires < self._next:
+            self._next = expires
+
+    def cancel(self, key) -> bool:
+        """
+        Disarm a timer, returns False if it was not armed
+        """
+        where = self._where.pop(key, None)
+        if where is None:
+            return False
+        level, slot = where
+        if level == self.levels:
+            expires, _ = self._overflow.pop(key)
+        else:
+            entries = self._slots[level][slot]
+            expires, _ = entries.pop(key)
+            if not entries:
+                self._occupied[level] &= ~(1 << slot)
+        if expires == self._next:
+            self._next = None
+        return True
+
+    def next_expiry(self) -> int | None:
+        """
+        Tick of the earliest armed timer
+        """
+        if not self._where:
+            return None
+        if self._next is None:
+            self._next = self._find_next()
+        return self._next
+
+    def advance(self, time:int) -> list:
+        """
+        Move the wheel to `time` and return the values of every timer expired
+        on the way, in expiry order
+        """
+        expired = []
+        while self._where:
+            expires = self.next_expiry()
+            if expires > time:
+                break
+            self._move_to(expires)
+            entries = self._slots[0][expires & self.mask]
+            for key, (_, value) in entries.items():
+                del self._where[key]
+                expired.append(value)
+            entries.clear()
+            self._occupied[0] &= ~(1 << (expires & self.mask))
+            self._next = None
+        if time > self.now:
+            self._move_to(time)
+        return expired
+
+    def _level_of(self, expires:int) -> int:
+        return ((expires ^ self.now).bit_length() - 1) // self.bits if expires != self.now else 0
+
+    def _place(self, key, expires:int, value) -> None:
+        level = self._level_of(expires)
+        if level >= self.levels:
+            self._overflow[key] = (expires, value)
+            self._where[key] = (self.levels, 0)
+            return
+        slot = (expires >> (self.bits * level)) & self.mask
+        self._slots[level][slot][key] = (expires, value)
+        self._occupied[level] |= 1 << slot
+        self._where[key] = (level, slot)
+
+    def _move_to(self, time:int) -> None:
+        """
+        Set the current tick (never past an armed timer) and cascade the
+        slot of the highest level whose bit group changed down to the
+        levels below, where its timers now belong
+        """
+        if time == self.now:
+            return
+        level = ((time ^ self.now).bit_length() - 1) // self.bits
+        self.now = time
+        if level >= self.levels:
+            cascade = list(self._overflow.items())
+            self._overflow.clear()
+        elif level > 0:
+            slot = (time >> (self.bits * level)) & self.mask
+            entries = self._slots[level][slot]
+            cascade = list(entries.items())
+            entries.clear()
+            self._occupied[level] &= ~(1 << slot)
+        else:
+            return
+        for key, (expires, value) in cascade:
+            self._place(key, expires, value)
+
+    def _find_next(self) -> int:
+        """
+        Earliest expiry: the first non-empty slot after the current one on the lowest non-empty level
+        """
+        for level in range(self.levels):
+            shift = self.bits * level
+            position = (self.now >> shift) & self.mask
+            # Level 0 keeps timers due now; higher levels only hold later groups
+            pending = self._occupied[level] >> (position if level == 0 else position + 1)
+            if not pending:
+                continue
+            slot = (pending & -pending).bit_length() - 1 + (position if level == 0 else position + 1)
+            if level == 0:
+                return (self.now & ~self.mask) | slot
+            return min(expires for expires, _ in self._slots[level][slot].values())
+        return min(expires for expires, _ in self._overflow.values())
@@ -0,0 +1,230 @@
+import math
+
+QUANTILES = (50, 95, 99)
+TIMES = ("waiting", "turnaround", "response")
+
+
+class LogLinearSketch:
+    """
+    Bounded, mergeable histogram of non-negative integers for quantiles
+    (the log-linear bucketing of HDR histograms).
+    Values below 2^precision get a bucket each; above that every power of
+    two is split into 2^(precision-1) equal buckets, so a quantile is off
+    by less than 2^(1-precision) of its value (under 1% with the default)
+    and there are at most a few thousand buckets whatever the values.
+    Two sketches of the same precision merge by adding their counts.
+    """
+
+    def __init__(self, precision:int=8) -> None:
+        self.precision = precision
+        self.counts = {}
+        self.count = 0
+        self.min = None
+        self.max = None
+
+    def bucket(self, value:int) -> int:
+        precision = self.precision
+        if value < 1 << precision:
+            return value
+        shift = value.bit_length() - precision
+        half = 1 << (precision - 1)
+        return (1 << precision) + (shift - 1) * half + (value >> shift) - half
+
+    def bounds(self, bucket:int) -> tuple:
+        """
+        (lowest value, width) of a bucket
+        """
+        precision = self.precision
+        if bucket < 1 << precision:
+            return bucket, 1
+        half = 1 << (precision - 1)
+        shift, mantissa = divmod(bucket - (1 << precision), half)
+        shift += 1
+        return (mantissa + half) << shift, 1 << shift
+
+    def add(self, value:int, count:int=1) -> None:
+        value = max(0, value)
+        bucket = self.bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += count
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def add_many(self, values) -> None:
+        """
+        Add a NumPy integer array in one pass
+        """
+        import numpy as np
+
+        values = np.maximum(np.asarray(values, dtype=np.int64), 0)
+        if not len(values):
+            return
+        precision = self.precision
+        half = 1 << (precision - 1)
+        _, bit_length = np.frexp(values.astype(np.float64))
+        shift = np.maximum(bit_length - precision, 0)
+        buckets = np.where(values < (1 << precision), values,
+                           (1 << precision) + (shift - 1) * half + (values >> shift) - half)
+        for bucket, count in zip(*(column.tolist() for column in np.unique(buckets, return_counts=True))):
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += len(values)
+        low, high = int(values.min()), int(values.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    def merge(self, other:"LogLinearSketch") -> None:
+        if other.precision != self.precision:
+            raise ValueError("Solo se pueden combinar sketches de la misma precisión")
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def quantile(self, q:float) -> float:
+        """
+        Value at quantile q (0-1): the middle of the bucket holding that rank, within [min, max]
+        """
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                low, width = self.bounds(bucket)
+                return min(max(low + (width - 1) / 2, self.min), self.max)
+        return self.max
+
+
+class MetricsAccumulator:
+    """
+    Online metrics of a run, updated once per finished process.
+    Keeps the sums for the means, one LogLinearSketch per time metric for
+    the percentiles and one nested accumulator per user, so its memory does
+    not grow with the number of processes. Accumulators of separate runs
+    (or of shards of one run) combine with merge().
+
+    waiting = turnaround - CPU time - I/O time (the time spent ready,
+    migrating or queued for a device), response = first dispatch - arrival.
+    """
+
+    def __init__(self, per_user:bool=True) -> None:
+        self.count = 0
+        self.busy_time = 0
+        self.makespan = 0
+        self.sums = dict.fromkeys(TIMES, 0)
+        self.sketches = {name: LogLinearSketch() for name in TIMES}
+        self.users = {} if per_user else None
+
+    def add(self, arrival:int, burst:int, start:int, completion:int, user:str | None=None, io_time:int=0) -> None:
+        """
+        Account one finished process (burst is its total CPU time, io_time its total I/O time)
+        """
+        turnaround = completion - arrival
+        waiting = turnaround - burst - io_time
+        self._add_times(burst, completion, waiting, turnaround, start - arrival)
+        if self.users is not None:
+            stats = self.users.get(user)
+            if stats is None:
+                stats = self.users[user] = MetricsAccumulator(per_user=False)
+            stats._add_times(burst, completion, waiting, turnaround, start - arrival)
+
+    def add_process(self, process) -> None:
+        pcb = process.pcb
+        self.add(pcb.arrival_time, pcb.burst_time, pcb.start_time, pcb.completion_time, process.user, pcb.io_time)
+
+    def add_batch(self, arrival, burst, start, completion, user=None, users=None) -> None:
+        """
+        Account many finished processes from NumPy columns (vectorized runs).
+
+        Args:
+            user: Optional column of user ids, indexes into `users`
+            users: Names of the user ids
+        """
+        turnaround = completion - arrival
+        waiting = turnaround - burst
+        response = start - arrival
+        self._add_columns(burst, completion, waiting, turnaround, response)
+        if self.users is None or user is None:
+            return
+        for user_id in sorted(set(user.tolist())):
+            rows = user == user_id
+            name = users[user_id]
+            stats = self.users.get(name)
+            if stats is None:
+                stats = self.users[name] = MetricsAccumulator(per_user=False)
+            stats._add_columns(burst[rows], completion[rows], waiting[rows], turnaround[rows], response[rows])
+
+    def merge(self, other:"MetricsAccumulator") -> None:
+        self.count += other.count
+        self.busy_time += other.busy_time
+        self.makespan = max(self.makespan, other.makespan)
+        for name in TIMES:
+            self.sums[name] += other.sums[name]
+            self.sketches[name].merge(other.sketches[name])
+        if self.users is not None and other.users is not None:
+            for user, stats in other.users.items():
+                if user not in self.users:
+                    self.users[user] = MetricsAccumulator(per_user=False)
+                self.users[user].merge(stats)
+
+    def fairness(self) -> float:
+        """
+        Jain's fairness index over users of their share of time on the CPU
+        (busy time / turnaround of their processes): 1.0 when every user's
+        processes progress at the same rate, 1/users at worst
+        """
+        if not self.users:
+            return 1.0
+        rates = []
+        for user in sorted(self.users, key=str):
+            stats = self.users[user]
+            rates.append(stats.busy_time / stats.sums["turnaround"] if stats.sums["turnaround"] else 1.0)
+        squares = sum(rate * rate for rate in rates)
+        return sum(rates) ** 2 / (len(rates) * squares) if squares else 1.0
+
+    def metrics(self) -> dict:
+        """
+        avg_*, p50_*, p95_* and p99_* of the waiting, turnaround and response
+        times, throughput, CPU utilization and, at the top level, the
+        fairness index and the same metrics per user
+        """
+        n = self.count
+        result = {}
+        for name in TIMES:
+            result[f"avg_{name}"] = self.sums[name] / n if n else 0
+            for q in QUANTILES:
+                result[f"p{q}_{name}"] = self.sketches[name].quantile(q / 100)
+        result["throughput"] = n / self.makespan if self.makespan > 0 else 0
+        result["cpu_utilization"] = self.busy_time / self.makespan if self.makespan > 0 else 0.0
+        if self.users is not None:
+            result["fairness"] = self.fairness()
+            result["per_user"] = {user: stats.metrics() for user, stats in self.users.items()}
+        return result
+
+    def _add_times(self, burst:int, completion:int, waiting:int, turnaround:int, response:int) -> None:
+        self.count += 1
+        self.busy_time += burst
+        if completion > self.makespan:
+            self.makespan = completion
+        sums, sketches = self.sums, self.sketches
+        sums["waiting"] += waiting
+        sums["turnaround"] += turnaround
+        sums["response"] += response
+        sketches["waiting"].add(waiting)
+        sketches["turnaround"].add(turnaround)
+        sketches["response"].add(response)
+
+    def _add_columns(self, burst, completion, waiting, turnaround, response) -> None:
+        if not len(burst):
+            return
+        self.count += len(burst)
+        self.busy_time += int(burst.sum())
+        self.makespan = max(self.makespan, int(completion.max()))
+        for name, column in (("waiting", waiting), ("turnaround", turnaround), ("response", response)):
+            self.sums[name] += int(column.sum())
+            self.sketches[name].add_many(column)
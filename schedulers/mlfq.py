@@ -0,0 +1,65 @@
+from schedulers.round_robin import RoundRobinScheduler
+from models.process_manager import MultilevelReadyQueue
+
+class MLFQScheduler(RoundRobinScheduler):
+    """
+    Multilevel Feedback Queue
+    Round Robin over several levels, each with its own quantum. The highest
+    non-empty level always runs first. A process that uses its whole slice
+    is demoted one level, and every boost_interval time units all processes
+    go back to the top level.
+    """
+
+    def __init__(self, process_manager, quanta=(2, 4, 8), boost_interval=0, **timeline_options):
+        """
+        Initialize the MLFQ scheduler.
+
+        Args:
+            process_manager: ProcessManager instance
+            quanta (tuple): Quantum of each level, from highest to lowest priority
+            boost_interval (int): Time between priority boosts (0 disables boosting)
+            timeline_options: timeline_sink and merge_timeline, see Scheduler
+        """
+        self.quanta = tuple(quanta)
+        self.boost_interval = boost_interval
+        self._next_boost = boost_interval
+        super().__init__(process_manager, quantum=self.quanta[0], fast_forward=False, **timeline_options)
+
+    def create_ready_queue(self):
+        return MultilevelReadyQueue(len(self.quanta))
+
+    def time_slice(self, process):
+        """
+        Run for the quantum of the process level or its remaining time
+        """
+        level = self.pm.ready_queue.level_of(process)
+        return min(self.quanta[level], process.pcb.remaining_time)
+
+    def dispatch(self):
+        self._apply_boost()
+        super().dispatch()
+
+    def on_slice_end(self, process):
+        """
+        The process used its whole quantum and is demoted one level
+        """
+        self._apply_boost()
+        queue = self.pm.ready_queue
+        queue.set_level(process, min(queue.level_of(process) + 1, len(self.quanta) - 1))
+        super().on_slice_end(process)
+
+    def on_completion(self, process):
+        """
+        A process that blocks for I/O before its quantum ends keeps its level
+        """
+        super().on_completion(process)
+        if not process.pcb.io_bursts:
+            self.pm.ready_queue.forget(process)
+
+    def _apply_boost(self):
+        """
+        Apply the boost that became due since the last decision
+        """
+        if self.boost_interval and self.current_time >= self._next_boost:
+            self.pm.ready_queue.boost()
+            self._next_boost = (self.current_time // self.boost_interval + 1) * self.boost_interval
@@ -0,0 +1,102 @@
+from schedulers.scheduler_base import Scheduler
+from models.process_manager import IndexedHeapReadyQueue
+
+class PriorityScheduler(Scheduler):
+    """
+    Priority Scheduling (preemptive or non-preemptive) with aging.
+    Runs the ready process with the lowest priority number.
+
+    Aging improves a waiting process by one priority level every
+    aging_interval time units. Instead of rescanning the queue, each process
+    is queued with the static key priority * aging_interval + enqueue_time:
+    the term every waiting process shares (the current time) is left out,
+    so the heap order matches the aged priorities at any instant.
+    The running process keeps the key it was dispatched with: preemption
+    compares it with the key of the newcomer, and a preempted process is
+    re-queued with it, so the levels it gained are not lost.
+    """
+
+    def __init__(self, process_manager, preemptive=False, aging_interval=0, **timeline_options):
+        """
+        Initialize the Priority scheduler.
+
+        Args:
+            process_manager: ProcessManager instance
+            preemptive (bool): Arrivals with higher priority preempt the running process
+            aging_interval (int): Time units to gain one priority level (0 disables aging)
+            timeline_options: timeline_sink and merge_timeline, see Scheduler
+        """
+        self.preemptive = preemptive
+        self.aging_interval = aging_interval
+        self._running_key = None
+        super().__init__(process_manager, **timeline_options)
+
+    def create_ready_queue(self):
+        """
+        Indexed heap keyed by aged priority, supports O(log n) set_priority()
+        """
+        return IndexedHeapReadyQueue(key=self.aging_key)
+
+    def aging_key(self, process):
+        """
+        Heap key of a process entering the ready queue now
+        """
+        if not self.aging_interval:
+            return process.pcb.priority
+        return process.pcb.priority * self.aging_interval + self.current_time
+
+    def effective_priority(self, process):
+        """
+        Priority of a process including the levels gained while waiting
+        """
+        if not self.aging_interval or process not in self.pm.ready_queue:
+            return process.pcb.priority
+        return process.pcb.priority - (self.current_time - self._enqueue_time(process)) // self.aging_interval
+
+    def set_priority(self, process, priority):
+        """
+        Change the base priority of a process, re-keying it in O(log n) if it is waiting
+        """
+        if process not in self.pm.ready_queue:
+            process.pcb.priority = priority
+            return
+
+        if self.aging_interval:
+            key = priority * self.aging_interval + self._enqueue_time(process)
+        else:
+            key = priority
+        process.pcb.priority = priority
+        self.pm.ready_queue.update(process, key)
+
+    def _enqueue_time(self, process):
+        return self.pm.ready_queue.key_of(process) - process.pcb.priority * self.aging_interval
+
+    def dispatch(self):
+        self._running_key = self.pm.ready_queue.key_of(self.pm.ready_queue.peek())
+        super().dispatch()
+
+    def preempt(self):
+        """
+        Send the running process back to the queue with its aged key
+        """
+        process = self.pm.current_process
+        super().preempt()
+        self.pm.ready_queue.update(process, self._running_key)
+
+    def on_arrival(self, process):
+        """
+        Admit the process and, if preemptive, preempt a lower priority running process
+        """
+        super().on_arrival(process)
+        self._preempt_if_higher(process)
+
+    def wake(self, process):
+        """
+        A process back from I/O or a sleep preempts like an arrival
+        """
+        super().wake(process)
+        self._preempt_if_higher(process)
+
+    def _preempt_if_higher(self, process):
+        if self.preemptive and self.pm.current_process and self.pm.ready_queue.key_of(process) < self._running_key:
+            self.preempt()
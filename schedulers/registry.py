@@ -0,0 +1,26 @@
+from schedulers.fcfs import FCFSScheduler
+from schedulers.sjf import SJFScheduler
+from schedulers.round_robin import RoundRobinScheduler
+from schedulers.srtf import SRTFScheduler
+from schedulers.priority import PriorityScheduler
+from schedulers.mlfq import MLFQScheduler
+from schedulers.smp import SMPScheduler
+
+ALGORITHMS = {
+    "fcfs": FCFSScheduler,
+    "sjf": SJFScheduler,
+    "rr": RoundRobinScheduler,
+    "srtf": SRTFScheduler,
+    "priority": PriorityScheduler,
+    "mlfq": MLFQScheduler,
+    "smp": SMPScheduler,
+}
+
+
+def create_scheduler(name:str, process_manager, **params):
+    """
+    Build a scheduler by its short name, passing extra parameters (quantum, aging_interval...)
+    """
+    if name not in ALGORITHMS:
+        raise ValueError(f"Algoritmo desconocido: {name} (opciones: {', '.join(ALGORITHMS)})")
+    return ALGORITHMS[name](process_manager, **params)
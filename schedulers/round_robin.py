@@ -1,115 +1,76 @@
 from schedulers.scheduler_base import Scheduler
-from models.pcb import ProcessState
 
 class RoundRobinScheduler(Scheduler):
     """
     Round Robin (Preemptive)
     Runs processes in a circular queue with a fixed time quantum.
-    Uses ProcessManager and context_switch for preemptive scheduling.
-    This is the ideal use case for context_switch demonstration.
+    When a slice ends the process goes back to the tail of the ready_queue,
+    behind any process that arrived at that same instant.
     """
 
-    def __init__(self, process_manager, quantum=2):
+    def __init__(self, process_manager, quantum=2, fast_forward=False, **timeline_options):
         """
         Initialize Round Robin scheduler with a time quantum.
         
         Args:
             process_manager: ProcessManager instance
             quantum (int): Time quantum for each process slice (default: 2)
+            fast_forward (bool): Apply full rounds in bulk while no event is pending
+                (skipped while dispatch/preempt hooks are subscribed)
+            timeline_options: timeline_sink and merge_timeline, see Scheduler
         """
-        super().__init__(process_manager)
+        super().__init__(process_manager, **timeline_options)
         self.quantum = quantum
+        self.fast_forward = fast_forward
+        self._dispatches_until_check = 0
 
-    def run(self):
+    def time_slice(self, process):
         """
-        Execute Round Robin using ProcessManager's context_switch
+        Run for the quantum or the remaining time, whichever is smaller
         """
-        # Sort processes by arrival time
-        processes = list(self.pm.ready_queue)
-        processes.sort(key=lambda p: p.pcb.arrival_time)
-        
-        # Clear and repopulate ready_queue in sorted order
-        self.pm.ready_queue.clear()
-        for process in processes:
-            self.pm.ready_queue.append(process)
-        
-        current_time = 0
-        total_processes = len(processes)
-        completed = 0
-        
-        # Track first start time for each process
-        first_start = {}
-        
-        while completed < total_processes:
-            # If no current process, context switch to next
-            if not self.pm.current_process:
-                if not self.pm.has_ready_processes():
-                    # No process ready, should not happen but handle gracefully
-                    break
-                
-                # Check if we need to wait for next arrival
-                next_process = list(self.pm.ready_queue)[0]
-                if next_process.pcb.arrival_time > current_time:
-                    current_time = next_process.pcb.arrival_time
-                
-                # Perform context switch
-                self.pm.context_switch()
-            
-            if self.pm.current_process:
-                process = self.pm.current_process
-                
-                # Record first start time
-                if process.pcb.pid not in first_start:
-                    first_start[process.pcb.pid] = current_time
-                    process.pcb.start_time = current_time
-                
-                # Execute for quantum or remaining time, whichever is smaller
-                execution_time = min(self.quantum, process.pcb.remaining_time)
-                start = current_time
-                end = start + execution_time
-                
-                # Record timeline
-                self.timeline.append((process.pcb.pid, start, end))
-                
-                # Execute the process
-                self.pm.execute_current(execution_time)
-                current_time = end
-                
-                # Check if process completed
-                if process.is_completed():
-                    process.pcb.completion_time = current_time
-                    self.pm.terminate_current_process(current_time)
-                    completed += 1
-                else:
-                    # Process not completed - context switch will move it to back of queue
-                    # This is where context_switch really shines!
-                    self.pm.context_switch()
-    
-    def compute_metrics(self):
+        return min(self.quantum, process.pcb.remaining_time)
+
+    def dispatch(self):
+        if self.fast_forward and not self.hooks.observed("dispatch", "preempt"):
+            self._dispatches_until_check -= 1
+            if self._dispatches_until_check <= 0:
+                self._collapse_rounds()
+        super().dispatch()
+
+    def _collapse_rounds(self):
         """
-        Compute waiting time, turnaround time and throughput
+        Fast-forward mode.
+        While no other event or arrival is pending, the k ready processes just rotate:
+        after m full rounds every process has m * quantum less remaining time
+        and the queue is back in the same order. The number of rounds is
+        limited by the shortest remaining time (nobody may finish inside the
+        collapsed rounds) and by the next pending event, which must happen
+        strictly after the last collapsed round. The check is O(k), so it
+        is only repeated once per rotation of the queue.
         """
-        processes = self.pm.terminated_list
-        n = len(processes)
-        
-        if n == 0:
-            return {
-                "avg_waiting": 0,
-                "avg_turnaround": 0,
-                "throughput": 0
-            }
+        queue = self.pm.ready_queue
+        k = len(queue)
+        self._dispatches_until_check = k
 
-        # Waiting time = start_time - arrival_time
-        waiting = sum(p.pcb.start_time - p.pcb.arrival_time for p in processes) / n
-        
-        # Turnaround time = completion_time - arrival_time
-        turnaround = sum(p.pcb.completion_time - p.pcb.arrival_time for p in processes) / n
+        rounds = min(p.pcb.remaining_time for p in queue) - 1
+        rounds //= self.quantum
+        round_length = k * self.quantum
+        next_time = self.next_event_time()
+        if next_time is not None:
+            rounds = min(rounds, (next_time - self.current_time - 1) // round_length)
+        if rounds <= 0:
+            return
 
-        total_time = max(p.pcb.completion_time for p in processes)
-        throughput = n / total_time if total_time > 0 else 0
+        pids = []
+        for i, process in enumerate(queue):
+            if process.pcb.start_time == -1:
+                process.pcb.start_time = self.current_time + i * self.quantum
+                process.pcb.response_time = process.pcb.start_time - process.pcb.arrival_time
+            process.execute(rounds * self.quantum)
+            pids.append(process.pcb.pid)
 
-        return {
-            "avg_waiting": waiting,
-            "avg_turnaround": turnaround,
-            "throughput": throughput
-        }
+        self.timeline.append_rounds(pids, self.current_time, self.quantum, rounds)
+        self.pm.add_context_switches(rounds * k)
+        self.current_time += rounds * round_length
+        # No timer is due before the next event, this only moves the wheel
+        self.pm.expire_timers(self.current_time)
@@ -1,21 +1,425 @@
+import heapq
+import itertools
+from enum import IntEnum
+from models.io_device import SLEEP, IODevice
+from models.process_manager import FIFOReadyQueue
+from schedulers.metrics import MetricsAccumulator
+from schedulers.timeline import Timeline
+
+
+class EventType(IntEnum):
+    """
+    Kinds of events handled by the simulation core.
+    The value orders events that happen at the same time.
+    """
+
+    COMPLETION = 0
+    IO_WAKEUP = 1
+    ARRIVAL = 2
+    SLICE_END = 3
+    BALANCE = 4
+
+
+class PendingArrivals:
+    """
+    Processes that have not arrived yet, sorted by arrival time.
+    A cursor walks the sorted list, so admitting a process is O(1) and the
+    event heap only holds the events of processes already in the system.
+    """
+
+    def __init__(self, processes) -> None:
+        self._processes = sorted(processes, key=lambda p: p.pcb.arrival_time)
+        self._cursor = 0
+
+    def next_time(self) -> int | None:
+        """
+        Arrival time of the next pending process
+        """
+        if self._cursor < len(self._processes):
+            return self._processes[self._cursor].pcb.arrival_time
+        return None
+
+    def due(self, time:int) -> bool:
+        """
+        Checks if the next pending process arrives at or before `time`
+        """
+        return self._cursor < len(self._processes) and self._processes[self._cursor].pcb.arrival_time <= time
+
+    def pop(self):
+        process = self._processes[self._cursor]
+        self._processes[self._cursor] = None
+        self._cursor += 1
+        return process
+
+    def __len__(self) -> int:
+        return len(self._processes) - self._cursor
+
+
+class TableArrivals(PendingArrivals):
+    """
+    Pending arrivals of a ProcessTable.
+    Rows are walked in arrival order and a ProcessView is only created
+    when its process arrives.
+    """
+
+    def __init__(self, table) -> None:
+        self._table = table
+        self._order = table.arrival_order()
+        self._cursor = 0
+
+    def next_time(self) -> int | None:
+        if self._cursor < len(self._order):
+            return int(self._table.arrival[self._order[self._cursor]])
+        return None
+
+    def due(self, time:int) -> bool:
+        return self._cursor < len(self._order) and self._table.arrival[self._order[self._cursor]] <= time
+
+    def pop(self):
+        process = self._table.view(int(self._order[self._cursor]))
+        self._cursor += 1
+        return process
+
+    def __len__(self) -> int:
+        return len(self._order) - self._cursor
+
+
+class StreamArrivals(PendingArrivals):
+    """
+    Pending arrivals read lazily from an iterator already in arrival order.
+    Only the next process to arrive is held in memory.
+    """
+
+    def __init__(self, processes) -> None:
+        self._source = iter(processes)
+        self._next = next(self._source, None)
+
+    def next_time(self) -> int | None:
+        return self._next.pcb.arrival_time if self._next is not None else None
+
+    def due(self, time:int) -> bool:
+        return self._next is not None and self._next.pcb.arrival_time <= time
+
+    def pop(self):
+        process = self._next
+        self._next = next(self._source, None)
+        return process
+
+    def __len__(self) -> int:
+        """
+        Only the lookahead process is known
+        """
+        return 0 if self._next is None else 1
+
+
 class Scheduler:
     """
     Base Scheduler class.
-    Provides common structures for all scheduling algorithms.
+    Provides common structures for all scheduling algorithms and a shared
+    discrete-event simulation core: the clock jumps straight to the next
+    event in the heap, and subclasses only decide which process runs next
+    and for how long.
     """
-    def __init__(self, process_manager) -> None:
+    def __init__(self, process_manager, timeline_sink=None, merge_timeline:bool=True) -> None:
+        """
+        Args:
+            process_manager: ProcessManager instance
+            timeline_sink: Optional path or binary file where the timeline spills full chunks
+            merge_timeline: Merge slices that continue the previous one (False keeps every dispatch)
+        """
         self.pm = process_manager
-        self.timeline = []
+        self.timeline = Timeline(sink=timeline_sink, merge=merge_timeline)
+        self.metrics = MetricsAccumulator()
+        self.devices = {}
+        self.current_time = 0
+        self._events = []
+        self.pending = PendingArrivals([])
+        self._event_seq = itertools.count()
+        self._dispatch_id = 0
+        self._slice_start = 0
+        # Shared with the ProcessManager, the CPU starts idle so idle is only reported after work
+        self.hooks = self.pm.hooks
+        self.pm.scheduler = self
+        self._cpu_idle = True
+        self.pm.set_ready_queue(self.create_ready_queue())
+
+    def schedule_event(self, time:int, event_type:EventType, process=None) -> None:
+        """
+        Push an event into the event heap.
+        COMPLETION and SLICE_END events are tied to the current dispatch and
+        are discarded if the running process is preempted before they fire.
+        """
+        heapq.heappush(self._events, (time, event_type, next(self._event_seq), process, self._dispatch_id))
 
     def run(self):
         """
-        Must be implemented by subclasses.
+        Execute the scheduling algorithm until every event has been handled
         """
-        raise NotImplementedError
-    
-    def compute_metrics(self):
+        if self.pm.table is not None:
+            self.pending = TableArrivals(self.pm.table)
+        elif self.pm.arrival_source is not None:
+            self.pending = StreamArrivals(self.pm.arrival_source)
+            self.pm.arrival_source = None
+        else:
+            self.pending = PendingArrivals(self._take_loaded_processes())
+
+        timers = self.pm.timers
+        while True:
+            next_time = self.next_event_time()
+            if next_time is None:
+                break
+            self.current_time = next_time
+            self.hooks.now = next_time
+
+            # Expired sleeps wake up right after the completions of this
+            # instant, like IO_WAKEUP events. The wheel moves first so that
+            # processes blocked by those completions sleep from now
+            if timers:
+                expired = self.pm.expire_timers(next_time)
+                while self._handle_next_event(before=EventType.IO_WAKEUP):
+                    pass
+                for process, step in expired:
+                    self.on_timer(process, step)
+            else:
+                timers.now = next_time
+
+            # Handle every event at this instant before picking a process
+            while self._handle_next_event():
+                pass
+
+            self.schedule()
+
+    def schedule(self) -> None:
+        """
+        Called once every event of the current instant has been handled:
+        give the CPU to a ready process if it is idle
+        """
+        if not self.pm.current_process:
+            if self.pm.has_ready_processes():
+                self.dispatch()
+                self._cpu_idle = False
+            elif not self._cpu_idle:
+                self._cpu_idle = True
+                self.hooks.idle(0, self.current_time)
+
+    def next_event_time(self) -> int | None:
         """
-        Must be implemented by subclasses.
+        Time of the next pending event, arrival or timer
         """
-        raise NotImplementedError
+        next_time = self.pending.next_time()
+        if self._events:
+            event_time = self._events[0][0]
+            if next_time is None or event_time < next_time:
+                next_time = event_time
+        if self.pm.timers:
+            timer_time = self.pm.timers.next_expiry()
+            if next_time is None or timer_time < next_time:
+                next_time = timer_time
+        return next_time
+
+    def _handle_next_event(self, before:EventType | None=None) -> bool:
+        """
+        Handle one event scheduled at the current time, arrivals ordered as EventType.ARRIVAL
+
+        Args:
+            before: Only handle queued events of a lower type than this one (no arrivals)
+        """
+        now = self.current_time
+        if before is not None:
+            if not (self._events and self._events[0][0] == now and self._events[0][1] < before):
+                return False
+            arrival_due = False
+        else:
+            arrival_due = self.pending.due(now)
+
+        if self._events and self._events[0][0] == now and (self._events[0][1] < EventType.ARRIVAL or not arrival_due):
+            _, event_type, _, process, dispatch_id = heapq.heappop(self._events)
+            if event_type in (EventType.COMPLETION, EventType.SLICE_END) and not self.is_current_dispatch(process, dispatch_id):
+                return True
+            self.handle_event(event_type, process)
+            return True
+
+        if arrival_due:
+            self.on_arrival(self.pending.pop())
+            return True
+
+        return False
 
+    def is_current_dispatch(self, process, dispatch_id:int) -> bool:
+        """
+        Checks if a COMPLETION/SLICE_END event belongs to the dispatch still running
+        """
+        return dispatch_id == self._dispatch_id
+
+    def handle_event(self, event_type:EventType, process) -> None:
+        """
+        Route an event to its handler
+        """
+        if event_type == EventType.ARRIVAL:
+            self.on_arrival(process)
+        elif event_type == EventType.COMPLETION:
+            self.on_completion(process)
+        elif event_type == EventType.SLICE_END:
+            self.on_slice_end(process)
+        elif event_type == EventType.IO_WAKEUP:
+            self.on_io_wakeup(process)
+
+    def on_arrival(self, process) -> None:
+        """
+        A process enters the system and joins the ready queue
+        """
+        self.pm.admit_process(process)
+
+    def on_completion(self, process) -> None:
+        """
+        The running process finished its CPU burst: it blocks on its next I/O burst or terminates
+        """
+        self._end_slice()
+        if process.pcb.io_bursts:
+            self.block_for_io(self.pm, process)
+            return
+        process.pcb.completion_time = self.current_time
+        self.pm.terminate_current_process(self.current_time)
+        self.metrics.add_process(process)
+
+    def on_slice_end(self, process) -> None:
+        """
+        The running process used its whole time slice and goes back to READY
+        """
+        self._end_slice()
+        self.pm.preempt_current_process()
+
+    def on_io_wakeup(self, process) -> None:
+        """
+        A blocked process finished its I/O burst and becomes READY for its next
+        CPU burst; the device starts serving its next queued request
+        """
+        self.finish_io(process)
+        self.wake(process)
+
+    def on_timer(self, process, step=None) -> None:
+        """
+        The sleep or timed block of a process expired and it becomes READY
+        again. If the timer timed a sleep step of its trace (step), that step
+        is done and its next CPU burst loaded.
+        """
+        if step is not None:
+            pcb = process.pcb
+            pcb.io_bursts.popleft()
+            pcb.remaining_time = step[2]
+        self.wake(process)
+
+    def sleep_running(self, pm, ticks:int) -> None:
+        """
+        Put the running process of pm to sleep (pm.sleep() during a run):
+        account its slice so far and discard the events of its dispatch
+        """
+        self._dispatch_id += 1
+        self._end_slice()
+        pm.block_current_process(timeout=ticks)
+
+    def wake(self, process) -> None:
+        """
+        A blocked process becomes READY
+        """
+        self.pm.unblock_process(process)
+
+    def block_for_io(self, pm, process) -> None:
+        """
+        Block the running process of pm on its next I/O step: sleep steps
+        arm a wakeup timer, the others queue on their device
+        """
+        step = process.pcb.io_bursts[0]
+        name, io_time, _ = step
+        if name == SLEEP:
+            pm.block_current_process(timeout=io_time, step=step)
+        else:
+            pm.block_current_process()
+            self.request_io(process)
+
+    def request_io(self, process) -> None:
+        """
+        Queue the next I/O burst of a blocked process on its device (created on first use)
+        """
+        name, io_time, _ = process.pcb.io_bursts[0]
+        device = self.devices.get(name)
+        if device is None:
+            device = self.devices[name] = IODevice(name)
+        if device.request(process) is not None:
+            self.schedule_event(self.current_time + io_time, EventType.IO_WAKEUP, process)
+
+    def finish_io(self, process) -> None:
+        """
+        Complete the I/O burst of a process and load its next CPU burst
+        """
+        name, io_time, cpu_time = process.pcb.io_bursts.popleft()
+        following = self.devices[name].finish(io_time)
+        if following is not None:
+            self.schedule_event(self.current_time + following.pcb.io_bursts[0][1], EventType.IO_WAKEUP, following)
+        process.pcb.remaining_time = cpu_time
+
+    def create_ready_queue(self):
+        """
+        Ready queue implementation used by this algorithm.
+        popleft() decides which process is dispatched next.
+        """
+        return FIFOReadyQueue()
+
+    def time_slice(self, process) -> int:
+        """
+        CPU time granted to a process when it is dispatched.
+        By default processes run until their burst completes.
+        """
+        return process.pcb.remaining_time
+
+    def dispatch(self) -> None:
+        """
+        Give the CPU to the next ready process and schedule the end of its slice
+        """
+        self.pm.context_switch()
+
+        process = self.pm.current_process
+        pcb = process.pcb
+        if pcb.start_time == -1:
+            pcb.start_time = self.current_time
+            pcb.response_time = self.current_time - pcb.arrival_time
+
+        self._dispatch_id += 1
+        self._slice_start = self.current_time
+
+        length = self.time_slice(process)
+        if length >= pcb.remaining_time:
+            self.schedule_event(self.current_time + pcb.remaining_time, EventType.COMPLETION, process)
+        else:
+            self.schedule_event(self.current_time + length, EventType.SLICE_END, process)
+
+    def preempt(self) -> None:
+        """
+        Take the CPU away from the running process before its slice ends.
+        The pending COMPLETION/SLICE_END event of that dispatch is discarded.
+        """
+        self._dispatch_id += 1
+        self._end_slice()
+        self.pm.preempt_current_process()
+
+    def _take_loaded_processes(self) -> list:
+        """
+        Move the loaded processes out of the ready queue, they are admitted on arrival
+        """
+        processes = list(self.pm.ready_queue)
+        self.pm.ready_queue.clear()
+        return processes
+
+    def _end_slice(self) -> None:
+        """
+        Account the CPU time used by the running process since its dispatch
+        """
+        process = self.pm.current_process
+        self.timeline.append((process.pcb.pid, self._slice_start, self.current_time))
+        self.pm.execute_current(self.current_time - self._slice_start)
+
+    def compute_metrics(self) -> dict:
+        """
+        Metrics of the processes finished so far, see MetricsAccumulator.metrics()
+        """
+        return self.metrics.metrics()
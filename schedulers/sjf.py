@@ -1,87 +1,32 @@
 from schedulers.scheduler_base import Scheduler
-from models.pcb import ProcessState
+from models.process_manager import HeapReadyQueue, by_remaining_time
 
 class SJFScheduler(Scheduler):
     """
     Shortest Job First (Non-preemptive)
     Runs processes in order of shortest burst time.
-    Uses ProcessManager and context_switch for process management.
+    Only processes that have already arrived are in the ready_queue,
+    so the choice is made among them every time the CPU becomes free.
+    With I/O the key is the next CPU burst (the remaining time at enqueue,
+    as in SRTF), not the total CPU time of the job.
     """
 
-    def run(self):
+    vectorized = True
+
+    def create_ready_queue(self):
         """
-        Execute SJF on the list of processes using ProcessManager
+        Heap keyed by the next CPU burst, the shortest job is popped in O(log n)
         """
-        current_time = 0
-        
-        while self.pm.has_ready_processes() or self.pm.current_process:
-            # If no current process, do context switch to shortest job
-            if not self.pm.current_process:
-                if not self.pm.has_ready_processes():
-                    break
-                
-                # Find processes that have arrived
-                available = [p for p in self.pm.ready_queue if p.pcb.arrival_time <= current_time]
-                
-                # If no process has arrived yet, jump to next arrival time
-                if not available:
-                    current_time = min(p.pcb.arrival_time for p in self.pm.ready_queue)
-                    available = [p for p in self.pm.ready_queue if p.pcb.arrival_time <= current_time]
-                
-                # Sort by burst time (shortest first) and select the shortest
-                available.sort(key=lambda p: p.pcb.burst_time)
-                shortest = available[0]
-                
-                # Move shortest to front of ready_queue
-                self.pm.ready_queue.remove(shortest)
-                self.pm.ready_queue.appendleft(shortest)
-                
-                # Context switch to shortest job
-                self.pm.context_switch()
-            
-            if self.pm.current_process:
-                process = self.pm.current_process
-                start = max(current_time, process.pcb.arrival_time)
-                burst = process.pcb.remaining_time
-                end = start + burst
-                
-                # Record timeline
-                self.timeline.append((process.pcb.pid, start, end))
-                
-                # Set start time if first execution
-                if process.pcb.start_time == -1:
-                    process.pcb.start_time = start
-                
-                # Execute process to completion
-                self.pm.execute_current(burst)
-                current_time = end
-                
-                # Set completion time and terminate
-                process.pcb.completion_time = end
-                self.pm.terminate_current_process(current_time)
-    
-    def compute_metrics(self):
+        return HeapReadyQueue(key=by_remaining_time)
+
+    def run(self):
         """
-        Compute waiting time, turnaround time and throughput
+        Execute SJF. Workloads loaded as a ProcessTable go through the
+        vectorized engine, which gives the same timeline and metrics,
+        unless hooks are subscribed: those runs need the per-event loop.
         """
-        processes = self.pm.terminated_list
-        n = len(processes)
-        
-        if n == 0:
-            return {
-                "avg_waiting": 0,
-                "avg_turnaround": 0,
-                "throughput": 0
-            }
-
-        waiting = sum(p.pcb.start_time - p.pcb.arrival_time for p in processes) / n
-        turnaround = sum(p.pcb.completion_time - p.pcb.arrival_time for p in processes) / n
-
-        total_time = max(p.pcb.completion_time for p in processes)
-        throughput = n / total_time if total_time > 0 else 0
-
-        return {
-            "avg_waiting": waiting,
-            "avg_turnaround": turnaround,
-            "throughput": throughput
-        }
+        if self.vectorized and self.pm.table is not None and not self.hooks.observed():
+            from schedulers.vectorized import sjf_schedule, run_vectorized
+            run_vectorized(self, sjf_schedule)
+        else:
+            super().run()
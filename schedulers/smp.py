@@ -0,0 +1,296 @@
+import heapq
+import itertools
+from models.process_manager import FIFOReadyQueue, HeapReadyQueue, ProcessManager, by_remaining_time
+from schedulers.scheduler_base import EventType, Scheduler
+from schedulers.timeline import Timeline
+
+POLICIES = ("fcfs", "sjf", "rr")
+
+
+class CPU:
+    """
+    One simulated processor: its own run queue (a per-CPU ProcessManager),
+    its running slice and its accounting
+    """
+
+    def __init__(self, index:int, ready_queue, terminated_list:list, merge_timeline:bool=True) -> None:
+        self.index = index
+        self.pm = ProcessManager(ready_queue)
+        self.pm.terminated_list = terminated_list
+        self.timeline = Timeline(merge=merge_timeline)
+        self.dispatch_id = 0
+        self.slice_start = 0
+        self.overhead = 0
+        self.busy_time = 0
+        self.completed = 0
+
+    @property
+    def load(self) -> int:
+        """
+        Processes waiting in this CPU's run queue
+        """
+        return len(self.pm.ready_queue)
+
+
+class SMPScheduler(Scheduler):
+    """
+    Symmetric multiprocessor simulation.
+    Every CPU has its own run queue and applies FCFS, SJF or Round Robin to
+    it. Arrivals are spread over the CPUs in turn; load balancing can push
+    processes from busy to idle queues every balance_interval (push
+    migration) and let an idle CPU with an empty queue steal the next
+    process of the longest queue (work stealing). A process that runs on
+    a different CPU than its last slice pays migration_cost time units of
+    CPU overhead (cold cache) before doing useful work.
+    """
+
+    def __init__(self, process_manager, cpus:int=2, policy:str="fcfs", quantum:int=2,
+                 work_stealing:bool=True, balance_interval:int=0, migration_cost:int=0, **timeline_options):
+        """
+        Args:
+            process_manager (ProcessManager): Source of the processes and their terminated_list
+            cpus (int): Number of CPUs
+            policy (str): Per-CPU policy, "fcfs", "sjf" or "rr"
+            quantum (int): Round Robin quantum
+            work_stealing (bool): Idle CPUs steal from the longest run queue
+            balance_interval (int): Time between push migration passes (0 disables it)
+            migration_cost (int): CPU overhead of running on a different CPU than the last slice
+            timeline_options: timeline_sink and merge_timeline of the combined timeline, see
+                Scheduler (per-CPU timelines stay in memory and follow merge_timeline)
+        """
+        if cpus < 1:
+            raise ValueError("Se necesita al menos una CPU")
+        if policy not in POLICIES:
+            raise ValueError(f"Política desconocida: {policy} (opciones: {', '.join(POLICIES)})")
+        self.policy = policy
+        self.quantum = quantum
+        self.work_stealing = work_stealing
+        self.balance_interval = balance_interval
+        self.migration_cost = migration_cost
+        super().__init__(process_manager, **timeline_options)
+
+        self.cpus = [CPU(index, self.create_ready_queue(), self.pm.terminated_list, self.timeline.merge)
+                     for index in range(cpus)]
+        for cpu in self.cpus:
+            cpu.pm.hooks = self.hooks
+            cpu.pm.timers = self.pm.timers
+            cpu.pm.scheduler = self
+        self._placement = itertools.cycle(self.cpus)
+        self._idle = set(range(cpus))
+        self._idle_reported = set(range(cpus))
+        self._running_on = {}
+        self._last_cpu = {}
+        self._balance_armed = False
+        self.migrations = 0
+        self.steals = 0
+        self.pushes = 0
+
+    def create_ready_queue(self):
+        if self.policy == "sjf":
+            return HeapReadyQueue(key=by_remaining_time)
+        return FIFOReadyQueue()
+
+    def time_slice(self, process) -> int:
+        if self.policy == "rr":
+            return min(self.quantum, process.pcb.remaining_time)
+        return process.pcb.remaining_time
+
+    def run(self):
+        for cpu in self.cpus:
+            cpu.pm.retire = self.pm.retire
+            cpu.pm.record = self.pm.record
+        super().run()
+        self.pm.add_context_switches(sum(cpu.pm.context_switch_count() for cpu in self.cpus))
+        self.pm.terminated_count += sum(cpu.pm.terminated_count for cpu in self.cpus)
+
+    def schedule(self) -> None:
+        """
+        Dispatch on every idle CPU, stealing work first if its queue is empty
+        """
+        for index in sorted(self._idle):
+            cpu = self.cpus[index]
+            if not cpu.pm.has_ready_processes() and self.work_stealing and self._queued:
+                self._steal(cpu)
+            if cpu.pm.has_ready_processes():
+                self.dispatch_on(cpu)
+            elif index not in self._idle_reported:
+                self._idle_reported.add(index)
+                self.hooks.idle(index, self.current_time)
+
+    @property
+    def _queued(self) -> int:
+        """
+        Processes waiting in any run queue, counted from the queues so that
+        processes blocked or removed outside the scheduler are never miscounted
+        """
+        return sum(cpu.load for cpu in self.cpus)
+
+    def dispatch_on(self, cpu:CPU) -> None:
+        """
+        Give the CPU to the next process of its run queue
+        """
+        cpu.pm.context_switch()
+        self._idle.discard(cpu.index)
+        self._idle_reported.discard(cpu.index)
+
+        process = cpu.pm.current_process
+        pcb = process.pcb
+        if pcb.start_time == -1:
+            pcb.start_time = self.current_time
+            pcb.response_time = self.current_time - pcb.arrival_time
+
+        last_cpu = self._last_cpu.get(pcb.pid, cpu.index)
+        cpu.overhead = self.migration_cost if last_cpu != cpu.index else 0
+        if last_cpu != cpu.index:
+            self.migrations += 1
+
+        self._dispatch_id += 1
+        cpu.dispatch_id = self._dispatch_id
+        cpu.slice_start = self.current_time
+        self._running_on[pcb.pid] = cpu
+
+        length = self.time_slice(process)
+        start = self.current_time + cpu.overhead
+        if length >= pcb.remaining_time:
+            self.schedule_event(start + pcb.remaining_time, EventType.COMPLETION, process)
+        else:
+            self.schedule_event(start + length, EventType.SLICE_END, process)
+
+    def is_current_dispatch(self, process, dispatch_id:int) -> bool:
+        cpu = self._running_on.get(process.pcb.pid)
+        return cpu is not None and cpu.dispatch_id == dispatch_id
+
+    def handle_event(self, event_type:EventType, process) -> None:
+        if event_type == EventType.BALANCE:
+            self.on_balance()
+        else:
+            super().handle_event(event_type, process)
+
+    def on_arrival(self, process) -> None:
+        """
+        The new process joins the run queue of the next CPU in turn
+        """
+        next(self._placement).pm.admit_process(process)
+        self._arm_balance()
+
+    def on_completion(self, process) -> None:
+        cpu = self._end_slice_on(process)
+        if process.pcb.io_bursts:
+            self._last_cpu[process.pcb.pid] = cpu.index
+            self.block_for_io(cpu.pm, process)
+        else:
+            process.pcb.completion_time = self.current_time
+            cpu.pm.terminate_current_process(self.current_time)
+            self.metrics.add_process(process)
+            cpu.completed += 1
+            self._last_cpu.pop(process.pcb.pid, None)
+        self._disarm_balance()
+
+    def on_slice_end(self, process) -> None:
+        cpu = self._end_slice_on(process)
+        self._last_cpu[process.pcb.pid] = cpu.index
+        cpu.pm.preempt_current_process()
+
+    def sleep_running(self, pm, ticks:int) -> None:
+        """
+        Account the slice of the process put to sleep and free its CPU
+        """
+        process = pm.current_process
+        cpu = self._end_slice_on(process)
+        self._last_cpu[process.pcb.pid] = cpu.index
+        pm.block_current_process(timeout=ticks)
+        self._disarm_balance()
+
+    def wake(self, process) -> None:
+        """
+        A process back from I/O or a sleep rejoins the run queue of the CPU it blocked on.
+        One put to sleep through a ProcessManager (pm.sleep()) may have no such CPU: it
+        is placed on the next CPU in turn, like an arrival.
+        """
+        index = self._last_cpu.get(process.pcb.pid)
+        if index is not None:
+            cpu = self.cpus[index]
+        else:
+            cpu = next(self._placement)
+            owner = next((other.pm for other in self.cpus if process.pcb.pid in other.pm.blocked), self.pm)
+            if owner is not cpu.pm:
+                cpu.pm.blocked[process.pcb.pid] = owner.blocked.pop(process.pcb.pid)
+        cpu.pm.unblock_process(process)
+        self._arm_balance()
+
+    def on_balance(self) -> None:
+        """
+        Push migration: even out the run queue lengths, then re-arm while there is work.
+        Overloaded CPUs give away the processes they would run last, keeping their best jobs.
+        """
+        self._balance_armed = False
+        cpus = sorted(self.cpus, key=lambda cpu: cpu.load, reverse=True)
+        share, extra = divmod(self._queued, len(cpus))
+        targets = [share + 1 if rank < extra else share for rank in range(len(cpus))]
+
+        surplus = []
+        for cpu, target in zip(cpus, targets):
+            while cpu.load > target:
+                surplus.append(cpu.pm.ready_queue.pop())
+        for cpu, target in zip(cpus, targets):
+            while cpu.load < target and surplus:
+                cpu.pm.ready_queue.append(surplus.pop())
+                self.pushes += 1
+
+        if self._queued or self._running_on:
+            self._balance_armed = True
+            self.schedule_event(self.current_time + self.balance_interval, EventType.BALANCE)
+
+    def _arm_balance(self) -> None:
+        """
+        Schedule the next push migration pass if balancing is on and none is pending
+        """
+        if self.balance_interval and not self._balance_armed:
+            self._balance_armed = True
+            self.schedule_event(self.current_time + self.balance_interval, EventType.BALANCE)
+
+    def _disarm_balance(self) -> None:
+        """
+        Drop the pending push migration pass once no process is queued or
+        running, so it cannot move the clock past the last completion.
+        Arrivals and wakeups arm it again.
+        """
+        if self._balance_armed and not self._queued and not self._running_on:
+            self._events = [event for event in self._events if event[1] != EventType.BALANCE]
+            heapq.heapify(self._events)
+            self._balance_armed = False
+
+    def _steal(self, cpu:CPU) -> None:
+        """
+        Move the next process of the longest run queue to an idle CPU
+        """
+        victim = max(self.cpus, key=lambda other: other.load)
+        if victim.load:
+            cpu.pm.ready_queue.append(victim.pm.ready_queue.popleft())
+            self.steals += 1
+
+    def _end_slice_on(self, process) -> CPU:
+        """
+        Account the slice of a running process on its CPU and free the CPU
+        """
+        cpu = self._running_on.pop(process.pcb.pid)
+        entry = (process.pcb.pid, cpu.slice_start, self.current_time)
+        self.timeline.append(entry)
+        cpu.timeline.append(entry)
+        elapsed = self.current_time - cpu.slice_start
+        cpu.busy_time += elapsed
+        cpu.pm.execute_current(elapsed - cpu.overhead)
+        self._idle.add(cpu.index)
+        return cpu
+
+    def compute_metrics(self):
+        """
+        Shared metrics plus per-CPU utilization (a list, one entry per CPU) and migrations
+        """
+        metrics = super().compute_metrics()
+        total_time = self.metrics.makespan
+        metrics["cpu_utilization"] = [cpu.busy_time / total_time if total_time > 0 else 0.0 for cpu in self.cpus]
+        metrics["migrations"] = self.migrations
+        metrics["steals"] = self.steals
+        metrics["pushes"] = self.pushes
+        return metrics
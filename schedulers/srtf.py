@@ -0,0 +1,34 @@
+from schedulers.sjf import SJFScheduler
+
+class SRTFScheduler(SJFScheduler):
+    """
+    Shortest Remaining Time First (Preemptive SJF)
+    Runs the process with the least remaining CPU time. A newly arrived
+    process preempts the running one when its remaining time is shorter.
+    Preemption is evaluated on arrivals and when a process wakes from I/O
+    or a sleep, where the remaining time is that of the next CPU burst.
+    """
+
+    vectorized = False
+
+    def on_arrival(self, process):
+        """
+        Admit the process and preempt the running one if the newcomer is shorter
+        """
+        super().on_arrival(process)
+        self._preempt_if_shorter(process)
+
+    def wake(self, process):
+        super().wake(process)
+        self._preempt_if_shorter(process)
+
+    def _preempt_if_shorter(self, process):
+        if self.pm.current_process and process.pcb.remaining_time < self.running_remaining_time():
+            self.preempt()
+
+    def running_remaining_time(self):
+        """
+        Remaining time of the running process at the current instant
+        """
+        elapsed = self.current_time - self._slice_start
+        return self.pm.current_process.pcb.remaining_time - elapsed
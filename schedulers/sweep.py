@@ -0,0 +1,214 @@
+"""
+Parallel parameter sweep.
+
+Runs every cell of a grid (workloads x algorithms x RR quanta x other
+parameters) in a process pool and collects the metrics in one table.
+Text traces are converted once to the binary workload format; workers
+memory-map each workload file instead of receiving a pickled copy, so
+every core reads the same pages from the OS cache.
+
+    python -m schedulers.sweep trace.txt.gz other.oswl -a fcfs,sjf,rr -q 1,2,4,8 \\
+        --param priority.aging_interval=0,10 --param priority.preemptive=true,false -o results.csv
+"""
+import csv
+import itertools
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from schedulers.registry import ALGORITHMS, create_scheduler
+from workloads.binary import convert_trace, is_binary_workload
+from workloads.workload import Workload
+
+COLUMNS = ("workload", "algorithm", "params", "processes", "makespan", "context_switches",
+           "avg_waiting", "p95_waiting", "avg_turnaround", "p99_turnaround", "throughput", "fairness", "wall_s")
+
+# Workloads already mapped by this worker process, by path
+_open_workloads = {}
+
+
+def expand_grid(algorithms, quanta=(2,), params=None) -> list:
+    """
+    Expand the grid into (algorithm, params) pairs.
+
+    Args:
+        algorithms: Algorithm names from schedulers.registry
+        quanta: Quanta tried with Round Robin
+        params: Optional {algorithm: {parameter: [values]}} for the other parameters
+    """
+    params = params or {}
+    cases = []
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Algoritmo desconocido: {algorithm}")
+        grid = dict(params.get(algorithm, {}))
+        if algorithm == "rr":
+            grid.setdefault("quantum", list(quanta))
+        names = list(grid)
+        for values in itertools.product(*(grid[name] for name in names)):
+            cases.append((algorithm, dict(zip(names, values))))
+    return cases
+
+
+def prepare_workloads(paths, directory:str) -> dict:
+    """
+    Map every workload label to a binary workload file, converting text traces into directory
+    """
+    prepared = {}
+    for index, path in enumerate(paths):
+        if is_binary_workload(path):
+            prepared[path] = path
+        else:
+            binary_path = os.path.join(directory, f"{index}.oswl")
+            convert_trace(path, binary_path)
+            prepared[path] = binary_path
+    return prepared
+
+
+def open_workload(path:str) -> Workload:
+    """
+    Workload mapped by this worker, opened on its first cell
+    """
+    workload = _open_workloads.get(path)
+    if workload is None:
+        workload = _open_workloads[path] = Workload.from_file(path)
+    return workload
+
+
+def run_cell(cell) -> dict:
+    """
+    Run one (label, binary path, algorithm, params) cell and return its table row
+    """
+    label, path, algorithm, params = cell
+    pm = open_workload(path).process_manager()
+    scheduler = create_scheduler(algorithm, pm, **params)
+
+    start = time.perf_counter()
+    scheduler.run()
+    metrics = scheduler.compute_metrics()
+    wall = time.perf_counter() - start
+
+    return {
+        "workload": label,
+        "algorithm": algorithm,
+        "params": " ".join(f"{name}={value}" for name, value in params.items()),
+        "processes": pm.terminated_count,
+        "makespan": scheduler.metrics.makespan,
+        "context_switches": pm.context_switch_count(),
+        "avg_waiting": metrics["avg_waiting"],
+        "p95_waiting": metrics["p95_waiting"],
+        "avg_turnaround": metrics["avg_turnaround"],
+        "p99_turnaround": metrics["p99_turnaround"],
+        "throughput": metrics["throughput"],
+        "fairness": metrics["fairness"],
+        "wall_s": wall,
+    }
+
+
+def available_cpus() -> int:
+    """
+    Cores this process may run on (respects affinity masks and container limits)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def sweep(workloads, algorithms, quanta=(2,), params=None, max_workers:int | None=None) -> list:
+    """
+    Run the whole grid in a process pool.
+
+    Args:
+        workloads: Trace files (text, compressed or binary)
+        algorithms: Algorithm names from schedulers.registry
+        quanta: Quanta tried with Round Robin
+        params: Optional {algorithm: {parameter: [values]}}
+        max_workers: Worker processes, every core by default
+
+    Returns:
+        One row dict per cell (see COLUMNS), in grid order
+    """
+    cases = expand_grid(algorithms, quanta, params)
+    with tempfile.TemporaryDirectory() as directory:
+        prepared = prepare_workloads(workloads, directory)
+        cells = [(label, path, algorithm, case_params)
+                 for label, path in prepared.items()
+                 for algorithm, case_params in cases]
+
+        workers = max_workers or available_cpus()
+        # Several cells per task amortize the IPC of large sweeps
+        chunksize = max(1, len(cells) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run_cell, cells, chunksize=chunksize))
+
+
+def format_table(rows) -> str:
+    """
+    Render the sweep rows as an aligned text table
+    """
+    def cell(value):
+        return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+    lines = [COLUMNS] + [tuple(cell(row[column]) for column in COLUMNS) for row in rows]
+    widths = [max(len(line[i]) for line in lines) for i in range(len(COLUMNS))]
+    return "\n".join("  ".join(value.ljust(width) for value, width in zip(line, widths)) for line in lines)
+
+
+def write_csv(filepath:str, rows) -> None:
+    with open(filepath, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _parse_value(text:str):
+    lowered = text.lower()
+    if lowered in ("true", "s", "si", "sí"):
+        return True
+    if lowered in ("false", "n", "no"):
+        return False
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_params(specs) -> dict:
+    """
+    Parse "algorithm.parameter=v1,v2" specs into {algorithm: {parameter: [values]}}
+    """
+    params = {}
+    for spec in specs:
+        key, _, values = spec.partition("=")
+        algorithm, _, name = key.partition(".")
+        if not name or not values:
+            raise ValueError(f"Parámetro inválido: {spec} (formato algoritmo.parametro=v1,v2)")
+        params.setdefault(algorithm, {})[name] = [_parse_value(value) for value in values.split(",")]
+    return params
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Barrido paralelo de schedulers y parámetros")
+    parser.add_argument("workloads", nargs="+", help="Trazas de procesos (texto, comprimidas o binarias)")
+    parser.add_argument("-a", "--algorithms", default=",".join(ALGORITHMS), help="Algoritmos separados por comas")
+    parser.add_argument("-q", "--quanta", default="2", help="Quantums de Round Robin, ej. 1,2,4")
+    parser.add_argument("--param", action="append", default=[], help="Otros parámetros, ej. priority.aging_interval=0,5")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Procesos de trabajo (por defecto todos los núcleos)")
+    parser.add_argument("-o", "--output", default=None, help="Guardar la tabla en CSV")
+    args = parser.parse_args()
+
+    rows = sweep(
+        args.workloads,
+        args.algorithms.split(","),
+        quanta=[int(q) for q in args.quanta.split(",")],
+        params=parse_params(args.param),
+        max_workers=args.jobs,
+    )
+    print(format_table(rows))
+    if args.output:
+        write_csv(args.output, rows)
+        print(f"[OK] {len(rows)} configuraciones guardadas en {args.output}")
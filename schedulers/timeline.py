@@ -0,0 +1,193 @@
+from array import array
+
+CHUNK_SIZE = 65536
+
+
+class RoundRobinSegment:
+    """
+    Compressed record of several full Round Robin rounds.
+    Every round runs each PID in order for exactly one quantum.
+    """
+
+    __slots__ = ("pids", "start", "quantum", "rounds")
+
+    def __init__(self, pids:tuple, start:int, quantum:int, rounds:int) -> None:
+        self.pids = pids
+        self.start = start
+        self.quantum = quantum
+        self.rounds = rounds
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.pids) * self.quantum * self.rounds
+
+    def __len__(self) -> int:
+        return len(self.pids) * self.rounds
+
+    def __iter__(self):
+        start = self.start
+        for _ in range(self.rounds):
+            for pid in self.pids:
+                yield (pid, start, start + self.quantum)
+                start += self.quantum
+
+
+class ColumnSegment:
+    """
+    Consecutive slices stored as three parallel columns (e.g. NumPy arrays)
+    """
+
+    __slots__ = ("pids", "starts", "ends")
+
+    CHUNK = CHUNK_SIZE
+
+    def __init__(self, pids, starts, ends) -> None:
+        self.pids = pids
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    def __iter__(self):
+        for i in range(0, len(self.pids), self.CHUNK):
+            j = i + self.CHUNK
+            yield from zip(self.pids[i:j].tolist(), self.starts[i:j].tolist(), self.ends[i:j].tolist())
+
+
+class SpilledChunk:
+    """
+    Slices written to the timeline sink, read back on iteration.
+    The chunk is stored as its pid, start and end columns of 8-byte integers.
+    """
+
+    __slots__ = ("sink", "offset", "count")
+
+    def __init__(self, sink, offset:int, count:int) -> None:
+        self.sink = sink
+        self.offset = offset
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        columns = []
+        for index in range(3):
+            column = array("q")
+            self.sink.seek(self.offset + index * self.count * column.itemsize)
+            column.fromfile(self.sink, self.count)
+            columns.append(column)
+        return zip(*columns)
+
+
+class Timeline:
+    """
+    Execution timeline of a scheduler as (pid, start, end) slices.
+    A slice that continues the previous one (same PID, no gap) is merged
+    into it unless merge is False. Slices are kept in array('q') pid/start/end columns of
+    chunk_size entries; with a sink, full chunks are written to disk and
+    only their offsets stay in memory. Bulk Round Robin rounds and
+    vectorized runs are kept as compressed segments. Everything is only
+    expanded to tuples while iterating.
+    """
+
+    def __init__(self, sink=None, chunk_size:int=CHUNK_SIZE, merge:bool=True) -> None:
+        """
+        Args:
+            sink: Optional path or binary file ("w+b") where full chunks are spilled
+            chunk_size: Slices per column chunk
+            merge: Merge slices that continue the previous one (False keeps every dispatch)
+        """
+        self.merge = merge
+        self._entries = []
+        self._length = 0
+        self.chunk_size = chunk_size
+        self._owns_sink = isinstance(sink, str)
+        self._sink = open(sink, "w+b") if self._owns_sink else sink
+        self._sink_offset = 0
+        self._new_chunk()
+        # Last slice, still open to merging
+        self._last = None
+
+    def append(self, entry:tuple) -> None:
+        pid, start, end = entry
+        last = self._last
+        if self.merge and last is not None and last[0] == pid and last[2] == start:
+            self._last = (pid, last[1], end)
+            return
+        if last is not None:
+            self._store(last)
+        self._last = entry
+        self._length += 1
+
+    def append_rounds(self, pids, start:int, quantum:int, rounds:int) -> None:
+        """
+        Record `rounds` full rounds of the given PIDs starting at `start`
+        """
+        if len(pids) == 1 and self.merge:
+            self.append((pids[0], start, start + quantum * rounds))
+            return
+        self._add_segment(RoundRobinSegment(tuple(pids), start, quantum, rounds))
+
+    def extend_columns(self, pids, starts, ends) -> None:
+        """
+        Record many slices at once from parallel columns
+        """
+        self._add_segment(ColumnSegment(pids, starts, ends))
+
+    def close(self) -> None:
+        """
+        Close the sink file if the timeline opened it
+        """
+        if self._owns_sink and not self._sink.closed:
+            self._sink.close()
+
+    def __iter__(self):
+        for entry in self._entries:
+            yield from entry
+        if self._pids:
+            yield from zip(self._pids, self._starts, self._ends)
+        if self._last is not None:
+            yield self._last
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _add_segment(self, segment) -> None:
+        if self._last is not None:
+            self._store(self._last)
+            self._last = None
+        self._close_chunk()
+        self._entries.append(segment)
+        self._length += len(segment)
+
+    def _store(self, entry:tuple) -> None:
+        pid, start, end = entry
+        self._pids.append(pid)
+        self._starts.append(start)
+        self._ends.append(end)
+        if len(self._pids) >= self.chunk_size:
+            self._close_chunk()
+
+    def _new_chunk(self) -> None:
+        self._pids = array("q")
+        self._starts = array("q")
+        self._ends = array("q")
+
+    def _close_chunk(self) -> None:
+        """
+        Move the open column chunk to the entries, spilling it to the sink if there is one
+        """
+        count = len(self._pids)
+        if not count:
+            return
+        if self._sink is None:
+            self._entries.append(ColumnSegment(self._pids, self._starts, self._ends))
+        else:
+            self._sink.seek(self._sink_offset)
+            for column in (self._pids, self._starts, self._ends):
+                column.tofile(self._sink)
+            self._entries.append(SpilledChunk(self._sink, self._sink_offset, count))
+            self._sink_offset += 3 * count * self._pids.itemsize
+        self._new_chunk()
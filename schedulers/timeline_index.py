@@ -0,0 +1,141 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+
+class TimelineIndex:
+    """
+    Read-only interval index over a Timeline for point and range queries.
+    Slices are stored as array('q') columns sorted by start time, with the
+    running maximum of their end times, so the first slice that can reach
+    a time is found by bisection. Each PID keeps the offsets of its own
+    slices, which never overlap. On a single CPU every query costs
+    O(log n + k) for k results; with overlapping slices (SMP) the scan may
+    also visit the slices that end inside the queried range on other CPUs.
+    """
+
+    def __init__(self, timeline) -> None:
+        """
+        Build the index with one pass over the timeline (plus a sort if slices are out of start order)
+        """
+        pids, starts, ends = array("q"), array("q"), array("q")
+        in_order = True
+        overlapping = False
+        last_start = last_end = None
+        for pid, start, end in timeline:
+            if last_start is not None:
+                in_order = in_order and start >= last_start
+                overlapping = overlapping or start < last_end
+            pids.append(pid)
+            starts.append(start)
+            ends.append(end)
+            last_start, last_end = start, end
+
+        if not in_order:
+            order = sorted(range(len(starts)), key=starts.__getitem__)
+            pids = array("q", (pids[i] for i in order))
+            starts = array("q", (starts[i] for i in order))
+            ends = array("q", (ends[i] for i in order))
+
+        self.pids = pids
+        self.starts = starts
+        self.ends = ends
+
+        # Without overlaps the ends are already sorted and are their own running maximum
+        if overlapping or not in_order:
+            reach = array("q")
+            longest = None
+            for end in ends:
+                longest = end if longest is None or end > longest else longest
+                reach.append(longest)
+            self._reach = reach
+        else:
+            self._reach = ends
+
+        self._offsets = {}
+        for offset, pid in enumerate(pids):
+            offsets = self._offsets.get(pid)
+            if offsets is None:
+                offsets = self._offsets[pid] = array("q")
+            offsets.append(offset)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, offset:int) -> tuple:
+        return (self.pids[offset], self.starts[offset], self.ends[offset])
+
+    @property
+    def start_time(self) -> int | None:
+        return self.starts[0] if self.starts else None
+
+    @property
+    def end_time(self) -> int | None:
+        return self._reach[-1] if self._reach else None
+
+    def pid_list(self) -> list:
+        """
+        PIDs with at least one slice, in order of first execution
+        """
+        return list(self._offsets)
+
+    def at(self, time:int) -> list:
+        """
+        Slices running at `time` (start <= time < end)
+        """
+        return self.between(time, time + 1)
+
+    def between(self, start:int, end:int, pid:int | None=None) -> list:
+        """
+        Slices overlapping the window [start, end), optionally of one PID only
+        """
+        if pid is not None:
+            offsets = self._offsets.get(pid, ())
+            return [self[offsets[position]] for position in self._pid_offsets(pid, start, end)]
+
+        ends = self.ends
+        return [self[offset] for offset in self.span(start, end) if ends[offset] > start]
+
+    def span(self, start:int, end:int) -> range:
+        """
+        Offsets of the slices that may overlap [start, end), found in O(log n)
+        """
+        return range(bisect_right(self._reach, start), bisect_left(self.starts, end))
+
+    def count_between(self, start:int, end:int, pid:int) -> int:
+        """
+        Number of slices of a PID overlapping [start, end), in O(log n)
+        """
+        return len(self._pid_offsets(pid, start, end))
+
+    def occupied(self, pid:int, start:float, end:float) -> bool:
+        """
+        Checks in O(log n) if a PID ran at some point of [start, end)
+        """
+        offsets = self._offsets.get(pid)
+        if not offsets:
+            return False
+        first = bisect_right(offsets, start, key=self.ends.__getitem__)
+        return first < len(offsets) and self.starts[offsets[first]] < end
+
+    def slices_of(self, pid:int) -> list:
+        """
+        Every slice of a PID in time order
+        """
+        return [self[offset] for offset in self._offsets.get(pid, ())]
+
+    def busy_time(self, pid:int, start:int, end:int) -> int:
+        """
+        CPU time a PID received inside the window [start, end)
+        """
+        return sum(min(slice_end, end) - max(slice_start, start) for _, slice_start, slice_end in self.between(start, end, pid))
+
+    def _pid_offsets(self, pid:int, start:int, end:int):
+        """
+        Offsets of the PID's slices overlapping [start, end), as a range over its offset list
+        """
+        offsets = self._offsets.get(pid)
+        if not offsets:
+            return range(0)
+        first = bisect_right(offsets, start, key=self.ends.__getitem__)
+        last = bisect_left(offsets, end, key=self.starts.__getitem__)
+        return range(first, max(first, last))
@@ -0,0 +1,115 @@
+import heapq
+import numpy as np
+from models.pcb import ProcessState
+from models.process_table import STATE_CODES
+
+
+def fcfs_schedule(arrival, burst):
+    """
+    Closed-form FCFS.
+    With jobs sorted by arrival and S the running sum of bursts, the
+    completion of job i is S[i] + max over j <= i of (arrival[j] - S[j-1]),
+    which is a cumsum plus a running maximum.
+
+    Returns:
+        (order, start, completion): row indexes in execution order and
+        their start and completion times
+    """
+    order = np.argsort(arrival, kind="stable")
+    a = arrival[order]
+    b = burst[order]
+    finished_work = np.cumsum(b)
+    completion = finished_work + np.maximum.accumulate(a - (finished_work - b))
+    return order, completion - b, completion
+
+
+def sjf_schedule(arrival, burst):
+    """
+    Non-preemptive SJF in batches between idle gaps.
+    Busy periods do not depend on the order jobs are served, so they are
+    taken from the closed-form FCFS schedule. Jobs alone in their busy
+    period start on arrival; only the periods with contention are ordered
+    with a heap keyed by (burst, arrival rank), the same tie-break as the
+    event loop.
+
+    Returns:
+        (order, start, completion) as in fcfs_schedule
+    """
+    order = np.argsort(arrival, kind="stable")
+    a = arrival[order]
+    b = burst[order]
+    n = len(order)
+    if n == 0:
+        return order, a.copy(), a.copy()
+
+    finished_work = np.cumsum(b)
+    fcfs_completion = finished_work + np.maximum.accumulate(a - (finished_work - b))
+    period_starts = np.flatnonzero(np.concatenate(([True], a[1:] > fcfs_completion[:-1])))
+    period_ends = np.append(period_starts[1:], n)
+
+    # ranks[k] is the arrival rank of the k-th job to run
+    ranks = np.arange(n)
+    start = a.copy()
+    for first, last in zip(period_starts.tolist(), period_ends.tolist()):
+        if last - first == 1:
+            continue
+        period_order, period_start = _sjf_busy_period(a[first:last].tolist(), b[first:last].tolist())
+        ranks[first:last] = np.asarray(period_order) + first
+        start[first:last] = period_start
+
+    completion = start + b[ranks]
+    return order[ranks], start, completion
+
+
+def _sjf_busy_period(arrival, burst):
+    """
+    Serve one busy period (no idle gap inside) shortest job first
+    """
+    n = len(arrival)
+    time = arrival[0]
+    ready = []
+    served, starts = [], []
+    cursor = 0
+    while len(served) < n:
+        while cursor < n and arrival[cursor] <= time:
+            heapq.heappush(ready, (burst[cursor], cursor))
+            cursor += 1
+        job_burst, job = heapq.heappop(ready)
+        served.append(job)
+        starts.append(time)
+        time += job_burst
+    return served, starts
+
+
+def run_vectorized(scheduler, schedule) -> None:
+    """
+    Run a non-preemptive scheduler over the ProcessTable of its ProcessManager.
+    Leaves the table, the timeline, terminated_list, the context switch
+    count and the metrics as the event loop would.
+    """
+    pm = scheduler.pm
+    table = pm.table
+    order, start, completion = schedule(table.arrival, table.burst)
+
+    table.start[order] = start
+    table.completion[order] = completion
+    table.response[order] = start - table.arrival[order]
+    table.waiting[order] = start - table.arrival[order]
+    table.turnaround[order] = completion - table.arrival[order]
+    table.program_counter[order] = table.burst[order]
+    table.remaining[order] = 0
+    table.state[order] = STATE_CODES[ProcessState.TERMINATED]
+
+    scheduler.timeline.extend_columns(table.pid[order], start, completion)
+    if not pm.retire:
+        pm.terminated_list = table.views_in(order)
+    elif pm.record is not None:
+        pm.record.write_columns(table.pid[order].tolist(), table.arrival[order].tolist(), table.burst[order].tolist(),
+                                table.priority[order].tolist(), [table.users[u] for u in table.user[order].tolist()],
+                                start.tolist(), completion.tolist())
+    pm.terminated_count += len(order)
+    pm.add_context_switches(len(order))
+    scheduler.metrics.add_batch(table.arrival[order], table.burst[order], start, completion,
+                                table.user[order], table.users)
+    if len(order):
+        scheduler.current_time = int(completion[-1])
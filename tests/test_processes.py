@@ -1,4 +1,6 @@
 from models.pcb import PCB, ProcessState
+from models.process import Process
+from models.process_manager import IndexedHeapReadyQueue, by_priority
 
 # === CASO 1: Proceso básica ===
 
@@ -28,6 +30,60 @@ def test_creation():
             assert pcb.remaining_time == pcb.burst_time
             assert pcb.waiting_time == 0
 
+
+# === CASO 2: Colas de listos ===
+
+def test_indexed_heap_ready_queue():
+    queue = IndexedHeapReadyQueue(key=by_priority)
+    procesos = [Process(pid, burst_time=5, priority=prioridad) for pid, prioridad in [(1, 3), (2, 1), (3, 2), (4, 1)]]
+    for process in procesos:
+        queue.append(process)
+
+    queue.remove(procesos[1])
+    queue.update(procesos[0], key=0)
+
+    assert [p.pcb.pid for p in queue] == [1, 4, 3]
+    assert queue.popleft().pcb.pid == 1
+    assert procesos[1] not in queue
+    assert len(queue) == 2
+
+def test_timing_wheel_y_sleep():
+    from models.process_manager import ProcessManager
+    from models.timing_wheel import TimingWheel
+
+    # Timers en varios niveles, cancelados y más allá del alcance de la rueda
+    rueda = TimingWheel(levels=2, bits=3)
+    for clave, vence in (("a", 5), ("b", 70), ("c", 9), ("d", 1000), ("e", 9)):
+        rueda.arm(clave, vence, clave)
+    assert rueda.cancel("c") and not rueda.cancel("c")
+    assert rueda.next_expiry() == 5
+    assert rueda.advance(9) == ["a", "e"]
+    # Un salto largo sin timers intermedios no recorre cada tick
+    assert rueda.advance(10**6) == ["b", "d"]
+    assert len(rueda) == 0 and rueda.now == 10**6
+
+    pm = ProcessManager()
+    for pid in (1, 2, 3):
+        pm.create_process(pid, 5)
+    pm.context_switch()
+    assert pm.sleep(1, 4)          # el proceso en ejecución
+    assert pm.sleep(3, 2)          # uno en READY
+    assert not pm.sleep(9, 1)
+    assert [p.pcb.pid for p in pm.ready_queue] == [2]
+
+    # Bloqueo con timeout: un unblock anticipado cancela su timer
+    pm.context_switch()
+    pm.block_current_process(timeout=10)
+    pm.unblock_process(pm.blocked[2])
+    assert 2 not in pm.timers
+
+    # Ninguno de estos timers viene de un paso "sleep" de la traza
+    despiertos = pm.expire_timers(4)
+    assert [(p.pcb.pid, paso) for p, paso in despiertos] == [(3, None), (1, None)]
+    assert all(p.pcb.state == ProcessState.BLOCKED for p, _ in despiertos)
+
 if __name__ == "__main__":
     test_creation()
-    print("Prueba completada")
\ No newline at end of file
+    test_indexed_heap_ready_queue()
+    test_timing_wheel_y_sleep()
+    print("Prueba completada")
@@ -0,0 +1,647 @@
+import os
+import pytest
+from models.process_manager import ProcessManager
+from schedulers.fcfs import FCFSScheduler
+from schedulers.sjf import SJFScheduler
+from schedulers.round_robin import RoundRobinScheduler
+from schedulers.srtf import SRTFScheduler
+from schedulers.priority import PriorityScheduler
+from schedulers.mlfq import MLFQScheduler
+from schedulers.timeline import RoundRobinSegment, Timeline
+
+# === Escenario de tests/processes_example.txt ===
+
+procesos_ejemplo = [
+    {"pid": 1, "llegada": 0, "rafaga": 5, "prioridad": 0, "usuario": "alice"},
+    {"pid": 2, "llegada": 1, "rafaga": 3, "prioridad": 1, "usuario": "bob"},
+    {"pid": 3, "llegada": 2, "rafaga": 8, "prioridad": 0, "usuario": "root"},
+]
+
+
+def cargar(procesos):
+    pm = ProcessManager()
+    for p in procesos:
+        pm.create_process(p["pid"], p["rafaga"], p["llegada"], p["prioridad"], p["usuario"])
+    return pm
+
+
+def test_fcfs():
+    pm = cargar(procesos_ejemplo)
+    scheduler = FCFSScheduler(pm)
+    scheduler.run()
+
+    assert list(scheduler.timeline) == [(1, 0, 5), (2, 5, 8), (3, 8, 16)]
+    assert pm.context_switch_count() == 3
+    assert len(pm.terminated_list) == 3
+
+
+def test_sjf_jumps_idle_gaps():
+    procesos = [
+        {"pid": 1, "llegada": 0, "rafaga": 4, "prioridad": 0, "usuario": "alice"},
+        {"pid": 2, "llegada": 1, "rafaga": 6, "prioridad": 0, "usuario": "bob"},
+        {"pid": 3, "llegada": 2, "rafaga": 1, "prioridad": 0, "usuario": "bob"},
+        {"pid": 4, "llegada": 50, "rafaga": 2, "prioridad": 0, "usuario": "root"},
+    ]
+    pm = cargar(procesos)
+    scheduler = SJFScheduler(pm)
+    scheduler.run()
+
+    assert list(scheduler.timeline) == [(1, 0, 4), (3, 4, 5), (2, 5, 11), (4, 50, 52)]
+
+
+def test_round_robin():
+    pm = cargar(procesos_ejemplo)
+    scheduler = RoundRobinScheduler(pm, quantum=2)
+    scheduler.run()
+
+    assert list(scheduler.timeline) == [
+        (1, 0, 2), (2, 2, 4), (3, 4, 6), (1, 6, 8), (2, 8, 9),
+        (3, 9, 11), (1, 11, 12), (3, 12, 16),
+    ]
+    completion = {p.pcb.pid: p.pcb.completion_time for p in pm.terminated_list}
+    assert completion == {1: 12, 2: 9, 3: 16}
+    response = {p.pcb.pid: p.pcb.response_time for p in pm.terminated_list}
+    assert response == {1: 0, 2: 1, 3: 2}
+
+
+def test_round_robin_fast_forward_matches_step_by_step():
+    procesos = procesos_ejemplo + [
+        {"pid": 4, "llegada": 3, "rafaga": 40, "prioridad": 0, "usuario": "alice"},
+        {"pid": 5, "llegada": 30, "rafaga": 25, "prioridad": 0, "usuario": "bob"},
+    ]
+
+    pm = cargar(procesos)
+    paso_a_paso = RoundRobinScheduler(pm, quantum=2)
+    paso_a_paso.run()
+
+    pm_rapido = cargar(procesos)
+    rapido = RoundRobinScheduler(pm_rapido, quantum=2, fast_forward=True)
+    rapido.run()
+
+    assert list(rapido.timeline) == list(paso_a_paso.timeline)
+    assert len(rapido.timeline) == len(paso_a_paso.timeline)
+    assert pm_rapido.context_switch_count() == pm.context_switch_count()
+    assert rapido.compute_metrics() == paso_a_paso.compute_metrics()
+
+
+def test_srtf_preempts_on_arrival():
+    procesos = [
+        {"pid": 1, "llegada": 0, "rafaga": 8, "prioridad": 0, "usuario": "alice"},
+        {"pid": 2, "llegada": 1, "rafaga": 4, "prioridad": 0, "usuario": "bob"},
+        {"pid": 3, "llegada": 2, "rafaga": 9, "prioridad": 0, "usuario": "bob"},
+        {"pid": 4, "llegada": 3, "rafaga": 5, "prioridad": 0, "usuario": "root"},
+    ]
+    pm = cargar(procesos)
+    scheduler = SRTFScheduler(pm)
+    scheduler.run()
+
+    assert list(scheduler.timeline) == [(1, 0, 1), (2, 1, 5), (4, 5, 10), (1, 10, 17), (3, 17, 26)]
+    assert scheduler.compute_metrics()["avg_turnaround"] == (17 + 4 + 24 + 7) / 4
+
+
+def test_priority_aging_prevents_starvation():
+    procesos = [{"pid": 1, "llegada": 0, "rafaga": 1, "prioridad": 3, "usuario": "bob"}]
+    procesos += [{"pid": pid, "llegada": 2 * (pid - 2), "rafaga": 2, "prioridad": 0, "usuario": "root"} for pid in range(2, 8)]
+
+    pm = cargar(procesos)
+    sin_aging = PriorityScheduler(pm)
+    sin_aging.run()
+    assert [pid for pid, _, _ in sin_aging.timeline] == [2, 3, 4, 5, 6, 7, 1]
+
+    pm = cargar(procesos)
+    con_aging = PriorityScheduler(pm, aging_interval=1)
+    con_aging.run()
+    assert [pid for pid, _, _ in con_aging.timeline] == [2, 3, 1, 4, 5, 6, 7]
+
+
+def test_priority_preemptive():
+    procesos = [
+        {"pid": 1, "llegada": 0, "rafaga": 5, "prioridad": 2, "usuario": "alice"},
+        {"pid": 2, "llegada": 2, "rafaga": 2, "prioridad": 0, "usuario": "root"},
+    ]
+    pm = cargar(procesos)
+    scheduler = PriorityScheduler(pm, preemptive=True)
+    scheduler.run()
+
+    assert list(scheduler.timeline) == [(1, 0, 2), (2, 2, 4), (1, 4, 7)]
+
+
+def test_priority_preemptive_aging_prevents_starvation():
+    # Un proceso de prioridad 0 llega en cada instante: sin aging P1 nunca vuelve
+    procesos = [{"pid": 1, "llegada": 0, "rafaga": 10, "prioridad": 5, "usuario": "bob"}]
+    procesos += [{"pid": t + 1, "llegada": t, "rafaga": 1, "prioridad": 0, "usuario": "root"} for t in range(1, 41)]
+
+    pm = cargar(procesos)
+    scheduler = PriorityScheduler(pm, preemptive=True)
+    scheduler.run()
+    assert [s for s in scheduler.timeline if s[0] == 1] == [(1, 0, 1), (1, 41, 50)]
+
+    # Con aging P1 conserva los niveles ganados al ser expropiado: en t=10 ya
+    # equivale a un recién llegado de prioridad 0 y nadie lo vuelve a expropiar
+    pm = cargar(procesos)
+    scheduler = PriorityScheduler(pm, preemptive=True, aging_interval=2)
+    scheduler.run()
+    assert [s for s in scheduler.timeline if s[0] == 1] == [(1, 0, 1), (1, 10, 19)]
+
+
+def test_mlfq_demotes_and_boosts():
+    procesos = [
+        {"pid": 1, "llegada": 0, "rafaga": 20, "prioridad": 0, "usuario": "root"},
+        {"pid": 2, "llegada": 1, "rafaga": 2, "prioridad": 0, "usuario": "alice"},
+    ]
+    pm = cargar(procesos)
+    scheduler = MLFQScheduler(pm, quanta=(1, 2, 4))
+    scheduler.run()
+
+    assert list(scheduler.timeline)[:4] == [(1, 0, 1), (2, 1, 2), (1, 2, 4), (2, 4, 5)]
+    # Los slices seguidos de P1 en el último nivel se fusionan en la timeline
+    assert list(scheduler.timeline)[4:] == [(1, 5, 22)]
+    assert pm.context_switch_count() == 9
+
+    pm = cargar(procesos)
+    scheduler = MLFQScheduler(pm, quanta=(1, 2, 4), boost_interval=10, merge_timeline=False)
+    scheduler.run()
+
+    # El boost en t=10 devuelve P1 al nivel 0, al terminar su slice en t=13 baja al nivel 1
+    assert list(scheduler.timeline)[4:] == [(1, 5, 9), (1, 9, 13), (1, 13, 15), (1, 15, 19), (1, 19, 22)]
+
+
+def test_process_table_runs_like_process_objects():
+    pytest.importorskip("numpy")
+    from models.process_table import ProcessTable
+
+    rows = [(p["pid"], p["llegada"], p["rafaga"], p["prioridad"], p["usuario"]) for p in procesos_ejemplo]
+    pm = ProcessManager()
+    pm.load_table(ProcessTable.from_rows(rows))
+    scheduler = RoundRobinScheduler(pm, quantum=2)
+    scheduler.run()
+
+    pm_objetos = cargar(procesos_ejemplo)
+    objetos = RoundRobinScheduler(pm_objetos, quantum=2)
+    objetos.run()
+
+    assert list(scheduler.timeline) == list(objetos.timeline)
+    assert scheduler.compute_metrics() == objetos.compute_metrics()
+    assert [p.user for p in pm.terminated_list] == ["bob", "alice", "root"]
+    assert pm.table.state.tolist() == [4, 4, 4]
+
+
+@pytest.mark.parametrize("scheduler_cls", [FCFSScheduler, SJFScheduler])
+def test_vectorized_engine_matches_event_loop(scheduler_cls):
+    pytest.importorskip("numpy")
+    from models.process_table import ProcessTable
+
+    procesos = procesos_ejemplo + [
+        {"pid": 4, "llegada": 3, "rafaga": 1, "prioridad": 0, "usuario": "alice"},
+        {"pid": 5, "llegada": 30, "rafaga": 2, "prioridad": 0, "usuario": "bob"},
+        {"pid": 6, "llegada": 31, "rafaga": 1, "prioridad": 0, "usuario": "bob"},
+    ]
+    rows = [(p["pid"], p["llegada"], p["rafaga"], p["prioridad"], p["usuario"]) for p in procesos]
+    pm = ProcessManager()
+    pm.load_table(ProcessTable.from_rows(rows))
+    vectorizado = scheduler_cls(pm)
+    vectorizado.run()
+
+    pm_objetos = cargar(procesos)
+    objetos = scheduler_cls(pm_objetos)
+    objetos.run()
+
+    assert list(vectorizado.timeline) == list(objetos.timeline)
+    assert vectorizado.compute_metrics() == objetos.compute_metrics()
+    assert [p.pcb.pid for p in pm.terminated_list] == [p.pcb.pid for p in pm_objetos.terminated_list]
+
+
+def test_benchmark_registry(tmp_path):
+    from benchmarks.bench_schedulers import bench_one, build_workload, main
+    from schedulers.registry import create_scheduler
+
+    assert isinstance(create_scheduler("rr", ProcessManager(), quantum=3), RoundRobinScheduler)
+    with pytest.raises(ValueError):
+        create_scheduler("lottery", ProcessManager())
+
+    resultado = bench_one("mlfq", {}, build_workload(200, 1), "objects", measure_memory=True)
+    assert resultado["slices"] >= 200
+    assert resultado["peak_mb"] > 0
+
+    # Comparar un resultado consigo mismo no marca regresiones
+    salida = str(tmp_path / "bench.json")
+    main(["run", "--sizes", "100", "--algorithms", "fcfs,rr", "--quanta", "2", "-o", salida])
+    assert main(["compare", salida, salida, "--threshold", "1000"]) == 0
+
+
+def test_parallel_sweep(tmp_path):
+    from schedulers.registry import create_scheduler
+    from schedulers.sweep import expand_grid, parse_params, sweep
+
+    params = parse_params(["priority.preemptive=true,false", "mlfq.boost_interval=0,10"])
+    casos = expand_grid(["fcfs", "rr", "priority", "mlfq"], quanta=(1, 3), params=params)
+    assert len(casos) == 1 + 2 + 2 + 2
+    assert ("priority", {"preemptive": True}) in casos
+
+    ruta = tmp_path / "procesos.txt"
+    ruta.write_text("".join(f"{p['pid']},{p['llegada']},{p['rafaga']},{p['prioridad']},{p['usuario']}\n" for p in procesos_ejemplo))
+    filas = sweep([str(ruta)], ["fcfs", "rr", "priority", "mlfq"], quanta=(1, 3), params=params, max_workers=2)
+
+    # Cada celda coincide con una ejecución directa del scheduler
+    assert len(filas) == len(casos)
+    for fila, (algoritmo, parametros) in zip(filas, casos):
+        pm = cargar(procesos_ejemplo)
+        scheduler = create_scheduler(algoritmo, pm, **parametros)
+        scheduler.run()
+        metricas = scheduler.compute_metrics()
+        assert fila["algorithm"] == algoritmo
+        assert fila["avg_waiting"] == pytest.approx(metricas["avg_waiting"])
+        assert fila["avg_turnaround"] == pytest.approx(metricas["avg_turnaround"])
+        assert fila["context_switches"] == pm.context_switch_count()
+        assert fila["makespan"] == max(p.pcb.completion_time for p in pm.terminated_list)
+
+
+def test_smp():
+    from schedulers.smp import SMPScheduler
+
+    # Una CPU con RR es el Round Robin de siempre
+    rr = RoundRobinScheduler(cargar(procesos_ejemplo), quantum=2)
+    rr.run()
+    smp = SMPScheduler(cargar(procesos_ejemplo), cpus=1, policy="rr", quantum=2, migration_cost=3)
+    smp.run()
+    assert list(smp.timeline) == list(rr.timeline)
+
+    # Dos CPUs sin balanceo: P3 espera en la cola de la CPU 0 aunque la CPU 1 quede libre
+    smp = SMPScheduler(cargar(procesos_ejemplo), cpus=2, work_stealing=False)
+    smp.run()
+    assert list(smp.cpus[0].timeline) == [(1, 0, 5), (3, 5, 13)]
+    assert list(smp.cpus[1].timeline) == [(2, 1, 4)]
+
+    # Con robo de trabajo la CPU 1 toma a P3 al quedar ociosa
+    pm = cargar(procesos_ejemplo)
+    smp = SMPScheduler(pm, cpus=2)
+    smp.run()
+    assert list(smp.cpus[0].timeline) == [(1, 0, 5)]
+    assert list(smp.cpus[1].timeline) == [(2, 1, 4), (3, 4, 12)]
+    metricas = smp.compute_metrics()
+    assert metricas["cpu_utilization"] == [5 / 12, 11 / 12]
+    assert metricas["steals"] == 1
+    assert pm.context_switch_count() == 3
+
+    # Las migraciones cuestan tiempo de CPU además de las ráfagas
+    procesos = [{"pid": i, "llegada": i % 3, "rafaga": 3 + i % 5, "prioridad": 0, "usuario": "alice"} for i in range(1, 13)]
+    smp = SMPScheduler(cargar(procesos), cpus=3, policy="rr", quantum=2, balance_interval=2, migration_cost=1)
+    smp.run()
+    metricas = smp.compute_metrics()
+    ocupado = sum(fin - inicio for _, inicio, fin in smp.timeline)
+    assert metricas["migrations"] > 0
+    assert ocupado == sum(p["rafaga"] for p in procesos) + metricas["migrations"]
+    assert len(smp.pm.terminated_list) == len(procesos)
+
+
+def test_smp_push_migra_los_peores_trabajos():
+    from schedulers.smp import SMPScheduler
+
+    # La CPU 1 queda ocupada con P2 y acumula P4 (2), P6 (4) y P8 (6) mientras la CPU 0 se vacía
+    pm = ProcessManager()
+    pm.create_process(1, 1, 0)
+    pm.create_process(2, 20, 0)
+    for pid in range(3, 9):
+        pm.create_process(pid, pid - 2, 1)
+    smp = SMPScheduler(pm, cpus=2, policy="sjf", work_stealing=False, balance_interval=2)
+    smp.run()
+
+    # Bajo SJF la CPU cargada cede sus trabajos más largos y se queda con el más corto
+    assert smp.pushes == 2
+    assert list(smp.cpus[1].timeline) == [(2, 0, 20), (4, 20, 22)]
+    assert list(smp.cpus[0].timeline) == [(1, 0, 1), (3, 1, 2), (5, 2, 5), (7, 5, 10), (8, 10, 16), (6, 16, 20)]
+
+
+def test_smp_balance_no_extiende_la_corrida():
+    from schedulers.smp import SMPScheduler
+
+    # El pase de balanceo pendiente se descarta al terminar el último proceso
+    smp = SMPScheduler(cargar(procesos_ejemplo), cpus=2, balance_interval=100)
+    smp.run()
+    fin = max(p.pcb.completion_time for p in smp.pm.terminated_list)
+    assert smp.current_time == fin < 100
+
+
+def test_timeline_merges_and_spills(tmp_path):
+    slices = [(1, 0, 2), (1, 2, 4), (2, 4, 5), (1, 5, 6), (1, 7, 8)] + [(pid % 3, pid, pid + 1) for pid in range(10, 40)]
+    esperado = [(1, 0, 4), (2, 4, 5), (1, 5, 6), (1, 7, 8)] + slices[5:]
+
+    timeline = Timeline()
+    for entrada in slices:
+        timeline.append(entrada)
+    assert list(timeline) == esperado and len(timeline) == len(esperado)
+
+    # Con sink los bloques llenos se escriben a disco y se leen al iterar
+    ruta = str(tmp_path / "timeline.bin")
+    timeline = Timeline(sink=ruta, chunk_size=4)
+    for entrada in slices[:20]:
+        timeline.append(entrada)
+    timeline.append_rounds([7, 8], 100, 2, 3)
+    for entrada in slices[20:]:
+        timeline.append(entrada)
+    assert list(timeline) == esperado[:19] + list(RoundRobinSegment((7, 8), 100, 2, 3)) + slices[20:]
+    timeline.close()
+    # Los bloques cerrados (pid, inicio, fin en 8 bytes) están en el archivo
+    assert os.path.getsize(ruta) >= 3 * 3 * 4 * 8
+
+    # El scheduler crea su timeline con sink y sin fusionar slices
+    pm = cargar(procesos_ejemplo)
+    scheduler = RoundRobinScheduler(pm, quantum=1, timeline_sink=str(tmp_path / "rr.bin"), merge_timeline=False)
+    scheduler.run()
+    referencia = RoundRobinScheduler(cargar(procesos_ejemplo), quantum=1)
+    referencia.run()
+    assert len(scheduler.timeline) == 16 > len(referencia.timeline)
+    assert sum(fin - inicio for _, inicio, fin in scheduler.timeline) == 16
+    scheduler.timeline.close()
+
+
+def test_timeline_index():
+    from schedulers.smp import SMPScheduler
+    from schedulers.timeline_index import TimelineIndex
+
+    scheduler = RoundRobinScheduler(cargar(procesos_ejemplo), quantum=2)
+    scheduler.run()
+    indice = TimelineIndex(scheduler.timeline)
+
+    assert indice.at(5) == [(3, 4, 6)]
+    assert indice.at(16) == []
+    assert indice.between(7, 12) == [(1, 6, 8), (2, 8, 9), (3, 9, 11), (1, 11, 12)]
+    assert indice.between(0, 20, pid=1) == [(1, 0, 2), (1, 6, 8), (1, 11, 12)]
+    assert indice.busy_time(3, 5, 13) == 1 + 2 + 1
+    assert (indice.start_time, indice.end_time) == (0, 16)
+
+    # Con varias CPUs los slices se solapan en el tiempo
+    smp = SMPScheduler(cargar(procesos_ejemplo), cpus=2)
+    smp.run()
+    indice = TimelineIndex(smp.timeline)
+    assert sorted(indice.at(3)) == [(1, 0, 5), (2, 1, 4)]
+    assert indice.between(4, 6) == [(1, 0, 5), (3, 4, 12)]
+
+
+def test_gantt_por_buckets(monkeypatch):
+    import ui.gantt
+    from schedulers.timeline_index import TimelineIndex
+    from ui.gantt import render_gantt
+
+    scheduler = RoundRobinScheduler(cargar(procesos_ejemplo), quantum=2)
+    scheduler.run()
+    indice = TimelineIndex(scheduler.timeline)
+
+    assert render_gantt(indice)[2:] == [
+        "  P1│██    ██   █    │",
+        "  P2│  ██    █       │",
+        "  P3│    ██   ██ ████│",
+    ]
+
+    # Dos carriles más "otros", 4 unidades por columna
+    lineas = render_gantt(indice, width=4, top=2)
+    assert lineas[0] == "[0 → 16] (4 unidades por columna)"
+    assert [linea.split("│")[0].strip() for linea in lineas[2:]] == ["P1", "P3", "otros"]
+
+    # Zoom a una ventana: P2 no corre en ella y no tiene carril
+    assert render_gantt(indice, start=9, end=13)[2:] == ["  P1│  █ │", "  P3│██ █│"]
+
+    # Con muestreo por bucket el resultado coincide cuando cada bucket es una unidad
+    exacto = render_gantt(indice)
+    monkeypatch.setattr(ui.gantt, "EXACT_SLICE_LIMIT", 0)
+    assert render_gantt(indice) == exacto
+
+    # Una ventana pasada el final de la ejecución muestra el eje y "sin actividad"
+    lineas = render_gantt(indice, start=100, end=200)
+    assert lineas[0] == "[100 → 200] (2 unidades por columna)"
+    assert lineas[-1].strip() == "(sin actividad)"
+
+
+def test_gantt_ventana_ociosa():
+    from schedulers.timeline_index import TimelineIndex
+    from ui.gantt import render_gantt
+
+    pm = ProcessManager()
+    pm.create_process(1, 2, 0)
+    pm.create_process(2, 3, 50)
+    scheduler = SJFScheduler(pm)
+    scheduler.run()
+    indice = TimelineIndex(scheduler.timeline)
+
+    # La CPU está ociosa entre t=2 y t=50
+    lineas = render_gantt(indice, start=10, end=40, width=30)
+    assert len(lineas) == 3
+    assert lineas[1].split() == ["10", "20", "30"]
+    assert lineas[2].strip() == "(sin actividad)"
+
+
+def test_gantt_viewer_agrupa_slices_por_pixel():
+    pytest.importorskip("tkinter")
+    from schedulers.timeline_index import TimelineIndex
+    from ui.scheduler_gui import lane_runs, tick_step
+
+    scheduler = RoundRobinScheduler(cargar(procesos_ejemplo), quantum=2)
+    scheduler.run()
+    indice = TimelineIndex(scheduler.timeline)
+
+    # Un pixel por unidad de tiempo: un rectángulo por slice
+    assert lane_runs(indice, 1, 0, 16, 16) == [(0, 2), (6, 8), (11, 12)]
+    # Sólo se dibuja la ventana visible
+    assert lane_runs(indice, 3, 10, 14, 40) == [(0, 10), (20, 40)]
+    # Slices más angostos que un pixel se fusionan, nunca más rectángulos que pixeles
+    assert lane_runs(indice, 1, 0, 16, 2) == [(0, 2)]
+
+    # Muchos slices por pixel: se consulta el índice por columna
+    timeline = Timeline(merge=False)
+    for i in range(1000):
+        timeline.append((7, 2 * i, 2 * i + 1))
+    timeline.append((7, 5000, 6000))
+    indice = TimelineIndex(timeline)
+    assert lane_runs(indice, 7, 0, 6000, 6) == [(0, 2), (5, 6)]
+
+    assert tick_step(1000, 1000) == 100
+    assert tick_step(7, 1000) == 1
+
+
+def test_hooks_de_eventos():
+    from models.pcb import ProcessState
+    from models.telemetry import ContextSwitchCounter, StateTransitionHistogram
+
+    # Sin suscriptores cada evento es el mismo no-op
+    pm = cargar(procesos_ejemplo)
+    assert pm.hooks.dispatch is pm.hooks.idle
+    assert not pm.hooks.observed()
+
+    contador = ContextSwitchCounter()
+    histograma = StateTransitionHistogram()
+    pm.hooks.attach(contador)
+    pm.hooks.attach(histograma)
+    # El fast-forward se desactiva para no perder eventos
+    scheduler = RoundRobinScheduler(pm, quantum=2, fast_forward=True)
+    scheduler.run()
+
+    # P3 termina con dos quantums seguidos: un solo slice en el timeline pero dos despachos
+    assert contador.counts == {1: 3, 2: 2, 3: 4}
+    assert contador.total() == pm.context_switch_count()
+    assert histograma.count(ProcessState.READY, ProcessState.RUNNING) == 9
+    assert histograma.count(ProcessState.RUNNING, ProcessState.READY) == 6
+    assert histograma.count(ProcessState.RUNNING, ProcessState.TERMINATED) == 3
+    # Dos slices de 1 unidad (cubeta [1, 2)) y siete de 2 unidades (cubeta [2, 4))
+    assert histograma.dwell_histogram(ProcessState.RUNNING) == {2: 2, 4: 7}
+
+    # Idle se informa una vez por cada transición de ocupada a ociosa
+    procesos = [
+        {"pid": 1, "llegada": 0, "rafaga": 4, "prioridad": 0, "usuario": "alice"},
+        {"pid": 2, "llegada": 50, "rafaga": 2, "prioridad": 0, "usuario": "root"},
+    ]
+    pm = cargar(procesos)
+    ocioso = []
+    pm.hooks.subscribe("idle", lambda cpu, tiempo: ocioso.append((cpu, tiempo)))
+    SJFScheduler(pm).run()
+    assert ocioso == [(0, 4), (0, 52)]
+
+    with pytest.raises(ValueError):
+        pm.hooks.subscribe("fork", print)
+
+
+def test_metricas_en_linea():
+    from schedulers.metrics import LogLinearSketch, MetricsAccumulator
+
+    pm = cargar(procesos_ejemplo)
+    scheduler = RoundRobinScheduler(pm, quantum=2)
+    scheduler.run()
+    metricas = scheduler.compute_metrics()
+
+    # Espera = retorno - ráfaga: P1 12 - 5, P2 8 - 3, P3 14 - 8
+    assert metricas["avg_waiting"] == 6
+    assert metricas["avg_turnaround"] == (12 + 8 + 14) / 3
+    assert metricas["avg_response"] == 1
+    assert (metricas["p50_turnaround"], metricas["p99_turnaround"]) == (12, 14)
+    assert metricas["throughput"] == 3 / 16
+    assert metricas["cpu_utilization"] == 1.0
+    assert metricas["per_user"]["bob"]["avg_waiting"] == 5
+    tasas = [5 / 12, 3 / 8, 8 / 14]
+    assert metricas["fairness"] == pytest.approx(sum(tasas) ** 2 / (3 * sum(t * t for t in tasas)))
+
+    # Dos acumuladores combinados dan lo mismo que uno solo
+    total, a, b = MetricsAccumulator(), MetricsAccumulator(), MetricsAccumulator()
+    for i, proceso in enumerate(pm.terminated_list):
+        total.add_process(proceso)
+        (a if i % 2 else b).add_process(proceso)
+    a.merge(b)
+    assert a.metrics() == total.metrics() == metricas
+
+    # Percentiles con error relativo acotado y memoria acotada
+    sketch = LogLinearSketch()
+    valores = [(i * 7919) % 1000003 for i in range(20000)]
+    for valor in valores:
+        sketch.add(valor)
+    ordenados = sorted(valores)
+    for q in (0.5, 0.95, 0.99):
+        exacto = ordenados[int(q * len(valores)) - 1]
+        assert abs(sketch.quantile(q) - exacto) <= exacto / 128
+    assert len(sketch.counts) < 2000
+
+
+def test_rafagas_de_cpu_y_es():
+    from models.pcb import ProcessState
+    from models.telemetry import StateTransitionHistogram
+
+    pm = ProcessManager()
+    pm.create_process(1, 2, 0, 0, "alice", (("disco", 3, 1),))
+    pm.create_process(2, 2, 0, 0, "bob", (("disco", 3, 2),))
+    pm.create_process(3, 4, 1, 0, "root")
+    histograma = StateTransitionHistogram()
+    pm.hooks.attach(histograma)
+    scheduler = FCFSScheduler(pm)
+    scheduler.run()
+
+    # P2 espera en la cola del disco mientras P1 hace E/S; ambos vuelven por eventos IO_WAKEUP
+    assert list(scheduler.timeline) == [(1, 0, 2), (2, 2, 4), (3, 4, 8), (1, 8, 9), (2, 9, 11)]
+    completion = {p.pcb.pid: p.pcb.completion_time for p in pm.terminated_list}
+    assert completion == {3: 8, 1: 9, 2: 11}
+    assert pm.blocked == {}
+    disco = scheduler.devices["disco"]
+    assert (disco.busy_time, disco.served, len(disco)) == (6, 2, 0)
+    assert histograma.count(ProcessState.RUNNING, ProcessState.BLOCKED) == 2
+    assert histograma.count(ProcessState.BLOCKED, ProcessState.READY) == 2
+
+    # La espera descuenta CPU y E/S: P1 9 - 3 - 3, P2 11 - 4 - 3 (incluye la cola del disco), P3 7 - 4
+    metricas = scheduler.compute_metrics()
+    assert metricas["avg_waiting"] == (3 + 4 + 3) / 3
+    # P3 ocupa la CPU mientras los otros hacen E/S
+    assert metricas["cpu_utilization"] == 1.0
+
+
+def test_sleep_con_timing_wheel():
+    pm = ProcessManager()
+    pm.create_process(1, 2, 0, 0, "alice", (("sleep", 5, 1),))
+    pm.create_process(2, 2, 0, 0, "bob", (("sleep", 1, 1), ("sleep", 100, 2)))
+    scheduler = SRTFScheduler(pm)
+    scheduler.run()
+
+    # Los sleeps no usan cola de dispositivo: varios procesos duermen a la vez
+    assert list(scheduler.timeline) == [(1, 0, 2), (2, 2, 4), (2, 5, 6), (1, 7, 8), (2, 106, 108)]
+    completion = {p.pcb.pid: p.pcb.completion_time for p in pm.terminated_list}
+    assert completion == {1: 8, 2: 108}
+    assert "sleep" not in scheduler.devices
+    assert len(pm.timers) == 0 and pm.blocked == {}
+
+    # Un pm.sleep() previo no consume el paso "sleep" de la traza
+    pm = ProcessManager()
+    pm.create_process(1, 4, 0)
+    pm.create_process(2, 3, 0, 0, "bob", (("sleep", 10, 2),))
+    assert pm.sleep(2, 2)
+    scheduler = FCFSScheduler(pm)
+    scheduler.run()
+    assert list(scheduler.timeline) == [(1, 0, 4), (2, 4, 7), (2, 17, 19)]
+
+    # Dormir al proceso en ejecución durante la corrida conserva su slice
+    class DuermeAlLlegarP2(FCFSScheduler):
+        def on_arrival(self, process):
+            super().on_arrival(process)
+            if process.pcb.pid == 2:
+                assert self.pm.sleep(1, 3)
+
+    pm = ProcessManager()
+    pm.create_process(1, 5, 0)
+    pm.create_process(2, 10, 1)
+    scheduler = DuermeAlLlegarP2(pm)
+    scheduler.run()
+    assert list(scheduler.timeline) == [(1, 0, 1), (2, 1, 11), (1, 11, 15)]
+    assert pm.context_switch_count() == 3
+
+    # En SMP un proceso dormido con pm.sleep() no tiene CPU previa: se ubica como una llegada
+    from schedulers.smp import SMPScheduler
+
+    pm = ProcessManager()
+    for pid in (1, 2, 3):
+        pm.create_process(pid, 3, 0)
+    assert pm.sleep(2, 5)
+    smp = SMPScheduler(pm, cpus=2)
+    smp.run()
+    assert [list(cpu.timeline) for cpu in smp.cpus] == [[(1, 0, 3), (2, 5, 8)], [(3, 0, 3)]]
+    assert len(pm.timers) == 0 and pm.blocked == {}
+
+
+def test_sleep_despierta_despues_de_completions():
+    # Un sleep que vence en el mismo instante en que termina el proceso en
+    # ejecución no debe expropiarlo con 0 unidades restantes, igual que con E/S
+    for dispositivo in ("sleep", "disco"):
+        pm = ProcessManager()
+        pm.create_process(1, 4, 0, 5, "alice")
+        pm.create_process(2, 1, 0, 0, "bob", ((dispositivo, 4, 1),))
+        scheduler = PriorityScheduler(pm, preemptive=True)
+        scheduler.run()
+
+        assert list(scheduler.timeline) == [(2, 0, 1), (1, 1, 5), (2, 5, 6)]
+        completion = {p.pcb.pid: p.pcb.completion_time for p in pm.terminated_list}
+        assert completion == {1: 5, 2: 6}
+        assert pm.context_switch_count() == 3
+
+
+def test_sjf_con_es_usa_la_siguiente_rafaga():
+    pm = ProcessManager()
+    pm.create_process(1, 1, 0, 0, "alice", (("disco", 1, 1), ("disco", 1, 5)))
+    pm.create_process(2, 3, 0)
+    pm.create_process(3, 4, 0)
+    scheduler = SJFScheduler(pm)
+    scheduler.run()
+
+    # Al despertar en t=2 P1 compite con su próxima ráfaga (1), no con su total de CPU (7)
+    assert list(scheduler.timeline) == [(1, 0, 1), (2, 1, 4), (1, 4, 5), (3, 5, 9), (1, 9, 14)]
@@ -0,0 +1,259 @@
+import gzip
+import pytest
+from models.process_manager import ProcessManager
+from schedulers.round_robin import RoundRobinScheduler
+from workloads.binary import HEADER, BinaryWorkload, convert_trace
+from workloads.generator import WorkloadGenerator, write_trace
+from workloads.loader import TraceReader, TraceLoadError
+from workloads.record import ProcessRecord, read_records
+
+# === Traza con líneas inválidas ===
+
+traza = """# pid,arrival,burst,priority,user
+1,0,5,0,alice
+2,1,3,1,bob
+2,2,4,0,bob
+3,x,8,0,root
+4,2,8
+5,4,2,0,root
+"""
+
+
+def escribir(tmp_path, nombre, contenido):
+    ruta = tmp_path / nombre
+    if nombre.endswith(".gz"):
+        with gzip.open(ruta, "wt") as f:
+            f.write(contenido)
+    else:
+        ruta.write_text(contenido)
+    return str(ruta)
+
+
+def test_reader_reports_invalid_lines(tmp_path):
+    ruta = escribir(tmp_path, "traza.txt.gz", traza)
+    reader = TraceReader(ruta)
+
+    assert [row[0] for row in reader.rows()] == [1, 2, 5]
+    assert [d.line_num for d in reader.diagnostics] == [4, 5, 6]
+
+
+def test_reader_error_budget(tmp_path):
+    ruta = escribir(tmp_path, "traza.txt", traza)
+
+    with pytest.raises(TraceLoadError) as error:
+        list(TraceReader(ruta, error_budget=2).rows())
+    assert len(error.value.diagnostics) == 3
+
+
+def test_reader_reorder_window(tmp_path):
+    ruta = escribir(tmp_path, "traza.txt", "1,5,1,0,a\n2,3,1,0,a\n3,4,1,0,a\n4,1,1,0,a\n")
+    reader = TraceReader(ruta, reorder_window=2)
+
+    assert [row[0] for row in reader.rows()] == [2, 3, 1]
+    assert [d.line_num for d in reader.diagnostics] == [4]
+
+    # Sin ventana, un stream de una traza desordenada falla en vez de descartar filas
+    pm = ProcessManager()
+    pm.stream_from_file(ruta)
+    with pytest.raises(ValueError, match="Línea 2"):
+        RoundRobinScheduler(pm, quantum=2).run()
+
+
+def test_reader_limita_diagnosticos(tmp_path, monkeypatch):
+    import workloads.loader
+
+    monkeypatch.setattr(workloads.loader, "MAX_DIAGNOSTICS", 2)
+    ruta = escribir(tmp_path, "traza.txt", traza)
+    reader = TraceReader(ruta)
+    assert [row[0] for row in reader.rows()] == [1, 2, 5]
+    assert reader.invalid_lines == 3
+    assert [d.line_num for d in reader.diagnostics] == [4, 5]
+
+
+def test_stream_from_file_matches_load_from_file(tmp_path):
+    ruta = escribir(tmp_path, "traza.txt.gz", traza)
+
+    pm = ProcessManager()
+    pm.load_from_file(ruta)
+    cargado = RoundRobinScheduler(pm, quantum=2)
+    cargado.run()
+
+    pm_stream = ProcessManager()
+    pm_stream.stream_from_file(ruta)
+    stream = RoundRobinScheduler(pm_stream, quantum=2)
+    stream.run()
+
+    assert list(stream.timeline) == list(cargado.timeline)
+    assert len(pm_stream.load_diagnostics) == 3
+
+
+def test_binary_workload_roundtrip(tmp_path):
+    texto = escribir(tmp_path, "traza.txt", traza)
+    binario = str(tmp_path / "traza.oswl")
+
+    assert convert_trace(texto, binario) == 3
+    with BinaryWorkload(binario) as workload:
+        assert list(workload.rows()) == list(TraceReader(texto).rows())
+
+    pm = ProcessManager()
+    pm.load_from_file(binario)
+    assert [p.user for p in pm.ready_queue] == ["alice", "bob", "root"]
+
+    # El stream también lee el formato binario en vez de parsearlo como texto
+    pm_stream = ProcessManager()
+    pm_stream.stream_from_file(binario)
+    stream = RoundRobinScheduler(pm_stream, quantum=2)
+    stream.run()
+    assert len(pm_stream.terminated_list) == 3 and pm_stream.load_diagnostics == []
+
+
+def test_binary_workload_vacio(tmp_path):
+    from workloads.binary import write_workload
+
+    # Solo el header: cero registros
+    binario = str(tmp_path / "vacio.oswl")
+    assert write_workload(binario, []) == 0
+    with BinaryWorkload(binario) as workload:
+        assert len(workload) == 0 and list(workload.rows()) == []
+
+    # Archivo vacío o truncado: error de formato, no de mmap
+    for contenido in (b"", b"OSWL"):
+        ruta = tmp_path / "roto.oswl"
+        ruta.write_bytes(contenido)
+        with pytest.raises(ValueError, match="no es un workload binario"):
+            BinaryWorkload(str(ruta))
+
+    # Cortado en cualquier punto después del header: registros o tabla de usuarios incompletos
+    completo = str(tmp_path / "traza.oswl")
+    convert_trace(escribir(tmp_path, "traza.txt", traza), completo)
+    with open(completo, "rb") as f:
+        datos = f.read()
+    for largo in range(HEADER.size, len(datos)):
+        ruta.write_bytes(datos[:largo])
+        with pytest.raises(ValueError, match="truncad"):
+            BinaryWorkload(str(ruta))
+
+    pm = ProcessManager()
+    pm.load_from_file(str(ruta))
+    assert len(pm.ready_queue) == 0
+
+
+def test_binary_workload_feeds_process_table(tmp_path):
+    pytest.importorskip("numpy")
+    from models.process_table import ProcessTable
+
+    binario = str(tmp_path / "traza.oswl")
+    convert_trace(escribir(tmp_path, "traza.txt", traza), binario)
+    table = ProcessTable.from_file(binario)
+
+    assert table.burst.tolist() == [5, 3, 2]
+    assert not table.burst.flags.writeable
+    assert table.users == ["alice", "bob", "root"]
+
+
+def test_generator_is_reproducible(tmp_path):
+    generador = WorkloadGenerator(seed=7, arrivals="bursty", bursts="pareto", priority_weights=(1, 2, 1))
+    filas = list(generador.rows(500))
+
+    assert filas == list(WorkloadGenerator(seed=7, arrivals="bursty", bursts="pareto", priority_weights=(1, 2, 1)).rows(500))
+    assert filas != list(WorkloadGenerator(seed=8, arrivals="bursty", bursts="pareto", priority_weights=(1, 2, 1)).rows(500))
+    assert [fila[1] for fila in filas] == sorted(fila[1] for fila in filas)
+    assert {fila[3] for fila in filas} == {0, 1, 2}
+
+    # La fuente bursty conserva la tasa media pedida aunque alterne ráfagas y silencios
+    for burstiness in (2, 10):
+        llegadas = [fila[1] for fila in WorkloadGenerator(seed=1, arrivals="bursty", rate=0.5, burstiness=burstiness).rows(50000)]
+        assert len(llegadas) / llegadas[-1] == pytest.approx(0.5, rel=0.1)
+
+    ruta = str(tmp_path / "sintetica.txt.gz")
+    assert write_trace(ruta, generador.rows(500)) == 500
+    assert list(TraceReader(ruta, error_budget=0).rows()) == filas
+
+
+def test_generator_streams_into_scheduler():
+    pm = ProcessManager()
+    pm.stream_processes(WorkloadGenerator(seed=1, rate=0.05).processes(200))
+    scheduler = RoundRobinScheduler(pm, quantum=4)
+    scheduler.run()
+
+    assert len(pm.terminated_list) == 200
+
+
+def test_workload_is_shared_between_runs(tmp_path):
+    pytest.importorskip("numpy")
+    from concurrent.futures import ThreadPoolExecutor
+    from schedulers.priority import PriorityScheduler
+    from workloads.workload import Workload
+
+    workload = Workload.from_file(escribir(tmp_path, "traza.txt", traza))
+    assert len(workload) == 3 and len(workload.diagnostics) == 3
+
+    def ejecutar(backend):
+        scheduler = RoundRobinScheduler(workload.process_manager(backend), quantum=2)
+        scheduler.run()
+        return list(scheduler.timeline)
+
+    # Varias ejecuciones, seguidas o concurrentes, sobre el mismo workload
+    esperado = ejecutar("objects")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(ejecutar, ["table", "objects", "table", "auto"])) == [esperado] * 4
+
+    # Escribir una columna compartida la copia solo para esa ejecución
+    pm = workload.process_manager("table")
+    PriorityScheduler(pm).set_priority(pm.table.view(0), 7)
+    assert pm.table.priority.tolist() == [7, 1, 0]
+    assert workload.table().priority.tolist() == [0, 1, 0]
+    assert [fila[3] for fila in workload.rows()] == [0, 1, 0]
+
+
+def test_modo_retiro_memoria_constante(tmp_path):
+    from models.process import Process
+
+    filas = [(i, i // 2, 1 + i % 4, 0, "alice" if i % 3 else "bob") for i in range(1, 200)]
+
+    normal = ProcessManager()
+    normal.stream_processes(Process(pid, burst, arrival, priority, user) for pid, arrival, burst, priority, user in filas)
+    esperado = RoundRobinScheduler(normal, quantum=2)
+    esperado.run()
+
+    # Los procesos terminados se vuelcan al registro y no quedan en memoria
+    ruta = str(tmp_path / "terminados.txt.gz")
+    pm = ProcessManager()
+    pm.stream_processes(Process(pid, burst, arrival, priority, user) for pid, arrival, burst, priority, user in filas)
+    with ProcessRecord(ruta) as registro:
+        pm.retire_terminated(registro)
+        scheduler = RoundRobinScheduler(pm, quantum=2)
+        scheduler.run()
+
+    assert pm.terminated_list == []
+    assert pm.terminated_count == len(filas)
+    assert scheduler.compute_metrics() == esperado.compute_metrics()
+    assert list(read_records(ruta)) == [
+        (p.pcb.pid, p.pcb.arrival_time, p.pcb.burst_time, p.pcb.priority, p.user, p.pcb.start_time, p.pcb.completion_time)
+        for p in normal.terminated_list
+    ]
+
+
+def test_reader_pasos_de_es(tmp_path):
+    from workloads.workload import Workload
+
+    ruta = escribir(tmp_path, "traza.txt", "1,0,2,0,a,disco:3:1;red:0:2\n2,1,4,0,b\n3,1,4,0,b,disco:3\n4,2,1,0,b,\n")
+    reader = TraceReader(ruta)
+
+    assert [row[5] for row in reader.records()] == [(("disco", 3, 1), ("red", 0, 2)), (), ()]
+    assert [d.line_num for d in reader.diagnostics] == [3]
+
+    pm = ProcessManager()
+    pm.load_from_file(ruta)
+    proceso = pm.ready_queue.peek()
+    assert (proceso.pcb.burst_time, proceso.pcb.remaining_time, proceso.pcb.io_time) == (5, 2, 3)
+
+    # Los caminos solo-CPU rechazan la traza en vez de descartar las ráfagas de E/S
+    with pytest.raises(ValueError, match="Línea 1"):
+        convert_trace(ruta, str(tmp_path / "traza.oswl"))
+    with pytest.raises(ValueError, match="Línea 1"):
+        Workload.from_file(ruta)
+    pytest.importorskip("numpy")
+    from models.process_table import ProcessTable
+    with pytest.raises(ValueError, match="Línea 1"):
+        ProcessTable.from_file(ruta)
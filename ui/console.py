@@ -1,5 +1,8 @@
 import os
+import shutil
 from models.process_manager import ProcessManager
+from schedulers.timeline_index import TimelineIndex
+from ui.gantt import render_gantt
 
 class ConsoleUI:
     def __init__(self, scheduler_cls):
@@ -33,7 +36,8 @@ class ConsoleUI:
         print("  2. Ejecutar Scheduler")
         print("  3. Mostrar resultados")
         print("  4. Mostrar métricas")
-        print("  5. Volver al menú principal")
+        print("  5. Ver diagrama de Gantt (GUI)")
+        print("  6. Volver al menú principal")
         self.print_separator()
         return input("Seleccione una opción: ").strip()
 
@@ -78,22 +82,55 @@ class ConsoleUI:
             print(f"\n[ERROR] No hay resultados. Ejecuta el scheduler primero.")
             self.wait_for_user()
             return
-        
-        self.print_header("TIMELINE DE EJECUCIÓN")
-        
-        print("Diagrama de Gantt:")
-        print()
-        for pid, start, end in self.scheduler.timeline:
-            duration = end - start
-            bar = "█" * duration
-            print(f"  P{pid} │{bar}│ [{start:2d} → {end:2d}] ({duration} unidades)")
-        
-        print()
-        self.print_separator()
-        print(f"Total de eventos: {len(self.scheduler.timeline)}")
-        
-        self.wait_for_user()
-    
+
+        cpus = getattr(self.scheduler, "cpus", None)
+        if cpus:
+            charts = [(f"CPU {cpu.index}", TimelineIndex(cpu.timeline)) for cpu in cpus]
+        else:
+            charts = [("CPU", TimelineIndex(self.scheduler.timeline))]
+        width = max(20, shutil.get_terminal_size().columns - 16)
+        window = (None, None)
+
+        while True:
+            self.print_header("TIMELINE DE EJECUCIÓN")
+            print("Diagrama de Gantt:")
+            print()
+            for name, index in charts:
+                if len(charts) > 1:
+                    print(f"{name}:")
+                for line in render_gantt(index, width=width, start=window[0], end=window[1]):
+                    print(line)
+                print()
+
+            self.print_separator()
+            print(f"Total de eventos: {len(self.scheduler.timeline)}")
+
+            text = input("\nZoom: ingrese inicio,fin (Enter para volver): ").strip()
+            if not text:
+                break
+            try:
+                start, end = (int(value) for value in text.split(","))
+                if end <= start:
+                    raise ValueError
+                window = (start, end)
+            except ValueError:
+                print("[ERROR] Ingrese dos enteros inicio,fin con inicio < fin")
+                self.wait_for_user()
+
+    def show_gantt_gui(self):
+        if not self.scheduler or not self.scheduler.timeline:
+            print(f"\n[ERROR] No hay resultados. Ejecuta el scheduler primero.")
+            self.wait_for_user()
+            return
+
+        try:
+            from ui.scheduler_gui import GanttViewer
+            print("\n[INFO] Iniciando interfaz gráfica...\n")
+            GanttViewer(self.scheduler).run()
+        except Exception as e:
+            print(f"\n[ERROR] No se pudo abrir la interfaz gráfica: {e}")
+            self.wait_for_user()
+
     def show_metrics(self):
         if not self.scheduler or not self.scheduler.timeline:
             print(f"\n[ERROR] No se ha ejecutado ningún algoritmo.")
@@ -106,18 +143,37 @@ class ConsoleUI:
         
         print("Resultados de rendimiento:")
         print()
-        print(f"  • Tiempo de espera promedio:    {m['avg_waiting']:.3f} unidades")
-        print(f"  • Tiempo de retorno promedio:   {m['avg_turnaround']:.3f} unidades")
+        for name, label in (("waiting", "Tiempo de espera"), ("turnaround", "Tiempo de retorno"), ("response", "Tiempo de respuesta")):
+            print(f"  • {label + ' promedio:':<31}{m[f'avg_{name}']:.3f} unidades "
+                  f"(p50 {m[f'p50_{name}']:.1f}, p95 {m[f'p95_{name}']:.1f}, p99 {m[f'p99_{name}']:.1f})")
         print(f"  • Throughput:                    {m['throughput']:.3f} procesos/unidad")
+        if "migrations" in m:
+            for index, utilization in enumerate(m["cpu_utilization"]):
+                print(f"  • Utilización CPU {index}:            {utilization * 100:.1f}%")
+            print(f"  • Migraciones:                   {m['migrations']} (robos: {m['steals']}, empujes: {m['pushes']})")
+        else:
+            print(f"  • Utilización de CPU:            {m['cpu_utilization'] * 100:.1f}%")
+        print(f"  • Equidad entre usuarios (Jain): {m['fairness']:.3f}")
         print()
         self.print_separator()
+
+        print("\nDetalle por usuario:")
+        for user, metrics in sorted(m["per_user"].items(), key=lambda item: str(item[0])):
+            print(f"  {user}: Espera={metrics['avg_waiting']:.3f} (p95 {metrics['p95_waiting']:.1f}), "
+                  f"Retorno={metrics['avg_turnaround']:.3f} (p95 {metrics['p95_turnaround']:.1f}), "
+                  f"Respuesta={metrics['avg_response']:.3f}")
         
+        if self.pm.retire:
+            print(f"\n[INFO] {self.pm.terminated_count} procesos retirados (modo retiro, sin detalle por proceso)")
+            self.wait_for_user()
+            return
+
         # Información adicional por proceso
         print("\nDetalle por proceso:")
         for process in self.pm.terminated_list:
             pcb = process.pcb
-            waiting = pcb.start_time - pcb.arrival_time
             turnaround = pcb.completion_time - pcb.arrival_time
+            waiting = turnaround - pcb.burst_time - pcb.io_time
             print(f"  P{pcb.pid}: Espera={waiting}, Retorno={turnaround}, "
                   f"Completado en t={pcb.completion_time}")
         
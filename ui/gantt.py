@@ -0,0 +1,105 @@
+import math
+
+# Shade of a cell by the fraction of its bucket the lane was running
+SHADES = " ░▒▓█"
+# Windows with more candidate slices than this are sampled instead of aggregated exactly
+EXACT_SLICE_LIMIT = 20000
+SAMPLES_PER_BUCKET = 8
+OTHER_LANE = "otros"
+# Shown instead of the lanes when no process ran in the window
+IDLE_LINE = "(sin actividad)"
+
+
+def bucket_occupancy(index, start:int, end:int, width:int):
+    """
+    CPU time of every PID in each of the (at most width) buckets of [start, end).
+
+    Small windows add up the overlap of every slice with the buckets it
+    touches (on one CPU that is at most slices + buckets steps); windows
+    with more than EXACT_SLICE_LIMIT slices probe SAMPLES_PER_BUCKET
+    instants per bucket through the index instead, so the cost depends on
+    the number of buckets and never on the durations.
+
+    Returns:
+        (bucket length, {pid: [time per bucket]})
+    """
+    bucket = max(1, math.ceil((end - start) / width))
+    count = math.ceil((end - start) / bucket)
+    occupancy = {}
+
+    if len(index.span(start, end)) <= EXACT_SLICE_LIMIT:
+        for pid, slice_start, slice_end in index.between(start, end):
+            slice_start, slice_end = max(slice_start, start), min(slice_end, end)
+            lane = occupancy.get(pid)
+            if lane is None:
+                lane = occupancy[pid] = [0] * count
+            for b in range((slice_start - start) // bucket, (slice_end - 1 - start) // bucket + 1):
+                bucket_start = start + b * bucket
+                lane[b] += min(slice_end, bucket_start + bucket) - max(slice_start, bucket_start)
+    else:
+        weight = bucket / SAMPLES_PER_BUCKET
+        for b in range(count):
+            for sample in range(SAMPLES_PER_BUCKET):
+                time = start + b * bucket + int((sample + 0.5) * weight)
+                for pid, _, _ in index.at(time):
+                    lane = occupancy.get(pid)
+                    if lane is None:
+                        lane = occupancy[pid] = [0] * count
+                    lane[b] += weight
+
+    return bucket, occupancy
+
+
+def shade(fraction:float) -> str:
+    if fraction <= 0:
+        return SHADES[0]
+    return SHADES[min(len(SHADES) - 1, math.ceil(fraction * (len(SHADES) - 1)))]
+
+
+def render_gantt(index, width:int=60, start:int | None=None, end:int | None=None, top:int=8) -> list:
+    """
+    Render a scaled Gantt chart of a TimelineIndex as text lines.
+
+    Args:
+        index: TimelineIndex of the run
+        width: Columns of the time axis (one bucket per column)
+        start, end: Time window to show, the whole run by default
+        top: Lanes for the PIDs with most CPU time in the window, the rest share the "otros" lane
+    """
+    if not len(index):
+        return []
+    start = index.start_time if start is None else start
+    end = index.end_time if end is None else end
+    if end <= start:
+        return []
+
+    bucket, occupancy = bucket_occupancy(index, start, end, width)
+    count = math.ceil((end - start) / bucket)
+    ranked = sorted(occupancy, key=lambda pid: (-sum(occupancy[pid]), pid))
+    lanes = [(f"P{pid}", occupancy[pid]) for pid in sorted(ranked[:top])]
+    if len(ranked) > top:
+        other = [0] * count
+        for pid in ranked[top:]:
+            for b, time in enumerate(occupancy[pid]):
+                other[b] += time
+        lanes.append((OTHER_LANE, other))
+
+    label_width = max((len(label) for label, _ in lanes), default=0)
+    unit = "unidad" if bucket == 1 else "unidades"
+    lines = [f"[{start} → {end}] ({bucket} {unit} por columna)"]
+
+    axis = [" "] * count
+    free = 0
+    for column in range(0, count, 10):
+        tick = str(start + column * bucket)
+        if column >= free and column + len(tick) <= count:
+            axis[column:column + len(tick)] = tick
+            free = column + len(tick) + 1
+    lines.append(f"  {' ' * label_width} {''.join(axis)}")
+
+    if not lanes:
+        lines.append(f"  {' ' * label_width} {IDLE_LINE}")
+    for label, lane in lanes:
+        cells = "".join(shade(time / bucket) for time in lane)
+        lines.append(f"  {label.ljust(label_width)}│{cells}│")
+    return lines
@@ -0,0 +1,184 @@
+import math
+import tkinter as tk
+from tkinter import ttk
+from schedulers.timeline_index import TimelineIndex
+
+COLORS = ("#4e79a7", "#f28e2b", "#e15759", "#76b7b2", "#59a14f", "#edc948", "#b07aa1", "#ff9da7", "#9c755f", "#bab0ac")
+LABEL_WIDTH = 70
+AXIS_HEIGHT = 24
+LANE_HEIGHT = 22
+ZOOM_STEP = 1.25
+
+
+def lane_runs(index:TimelineIndex, pid:int, start:float, end:float, pixels:int) -> list:
+    """
+    Pixel runs (x0, x1) covered by a PID in the window [start, end) drawn on `pixels` columns.
+
+    Slices narrower than a pixel are widened to one pixel and merged with
+    any run they touch, so a lane never has more rectangles than pixels.
+    A lane with more slices in the window than pixels is not read slice by
+    slice: each pixel column is probed with index.occupied() instead.
+    """
+    scale = pixels / (end - start)
+    runs = []
+
+    if index.count_between(start, end, pid) <= pixels:
+        for _, slice_start, slice_end in index.between(start, end, pid):
+            x0 = int((max(slice_start, start) - start) * scale)
+            x1 = max(x0 + 1, math.ceil((min(slice_end, end) - start) * scale))
+            if runs and x0 <= runs[-1][1]:
+                runs[-1] = (runs[-1][0], max(runs[-1][1], x1))
+            else:
+                runs.append((x0, x1))
+        return runs
+
+    run_start = None
+    for x in range(pixels):
+        if index.occupied(pid, start + x / scale, start + (x + 1) / scale):
+            if run_start is None:
+                run_start = x
+        elif run_start is not None:
+            runs.append((run_start, x))
+            run_start = None
+    if run_start is not None:
+        runs.append((run_start, pixels))
+    return runs
+
+
+def tick_step(span:float, pixels:int) -> int:
+    """
+    Round time step (1, 2, 5 x 10^k) that leaves about 100 pixels between axis labels
+    """
+    raw = max(1.0, span * 100 / max(pixels, 1))
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if factor * magnitude >= raw:
+            return int(factor * magnitude)
+    return int(10 * magnitude)
+
+
+class GanttViewer:
+    """Interactive Gantt chart of a scheduler run"""
+
+    def __init__(self, scheduler, title:str="OS Simulator - Diagrama de Gantt"):
+        self.index = TimelineIndex(scheduler.timeline)
+        self.pids = self.index.pid_list()
+        self.view_start = self.index.start_time or 0
+        self.view_end = max(self.index.end_time or 1, self.view_start + 1)
+        self.first_lane = 0
+        self._drag_x = None
+
+        self.root = tk.Tk()
+        self.root.title(title)
+        self.root.geometry("1100x600")
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Initialize the canvas, the status bar and the bindings"""
+        toolbar = ttk.Frame(self.root)
+        toolbar.pack(side=tk.TOP, fill=tk.X)
+        ttk.Button(toolbar, text="Acercar +", command=lambda: self.zoom(1 / ZOOM_STEP)).pack(side=tk.LEFT, padx=2, pady=2)
+        ttk.Button(toolbar, text="Alejar -", command=lambda: self.zoom(ZOOM_STEP)).pack(side=tk.LEFT, padx=2, pady=2)
+        ttk.Button(toolbar, text="Restablecer", command=self.reset_view).pack(side=tk.LEFT, padx=2, pady=2)
+
+        self.canvas = tk.Canvas(self.root, background="white", highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
+
+        self.status = ttk.Label(self.root, text="", relief=tk.SUNKEN, anchor=tk.W)
+        self.status.pack(side=tk.BOTTOM, fill=tk.X)
+
+        self.canvas.bind("<Configure>", lambda e: self.redraw())
+        self.canvas.bind("<ButtonPress-1>", self.on_press)
+        self.canvas.bind("<B1-Motion>", self.on_drag)
+        self.canvas.bind("<MouseWheel>", self.on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self.zoom(1 / ZOOM_STEP, e.x))
+        self.canvas.bind("<Button-5>", lambda e: self.zoom(ZOOM_STEP, e.x))
+        self.canvas.bind("<Shift-MouseWheel>", lambda e: self.scroll_lanes(-1 if e.delta > 0 else 1))
+        self.root.bind("<Left>", lambda e: self.pan(-0.1))
+        self.root.bind("<Right>", lambda e: self.pan(0.1))
+        self.root.bind("<Up>", lambda e: self.scroll_lanes(-1))
+        self.root.bind("<Down>", lambda e: self.scroll_lanes(1))
+        self.root.bind("<plus>", lambda e: self.zoom(1 / ZOOM_STEP))
+        self.root.bind("<minus>", lambda e: self.zoom(ZOOM_STEP))
+        self.root.bind("<Home>", lambda e: self.reset_view())
+
+    @property
+    def plot_width(self) -> int:
+        return max(1, self.canvas.winfo_width() - LABEL_WIDTH)
+
+    @property
+    def visible_lanes(self) -> int:
+        return max(1, (self.canvas.winfo_height() - AXIS_HEIGHT) // LANE_HEIGHT)
+
+    def time_at(self, x:int) -> float:
+        return self.view_start + (x - LABEL_WIDTH) * (self.view_end - self.view_start) / self.plot_width
+
+    def redraw(self):
+        """Draw the axis and the visible lanes, only the slices inside the viewport"""
+        canvas = self.canvas
+        canvas.delete("all")
+        pixels = self.plot_width
+        span = self.view_end - self.view_start
+
+        step = tick_step(span, pixels)
+        tick = math.ceil(self.view_start / step) * step
+        while tick < self.view_end:
+            x = LABEL_WIDTH + (tick - self.view_start) * pixels / span
+            canvas.create_line(x, AXIS_HEIGHT - 6, x, canvas.winfo_height(), fill="#e0e0e0")
+            canvas.create_text(x + 2, 4, text=str(tick), anchor=tk.NW, font=("TkDefaultFont", 8))
+            tick += step
+
+        last_lane = min(len(self.pids), self.first_lane + self.visible_lanes)
+        for row, pid in enumerate(self.pids[self.first_lane:last_lane]):
+            y = AXIS_HEIGHT + row * LANE_HEIGHT
+            canvas.create_text(6, y + LANE_HEIGHT / 2, text=f"P{pid}", anchor=tk.W)
+            color = COLORS[pid % len(COLORS)]
+            for x0, x1 in lane_runs(self.index, pid, self.view_start, self.view_end, pixels):
+                canvas.create_rectangle(LABEL_WIDTH + x0, y + 3, LABEL_WIDTH + x1, y + LANE_HEIGHT - 3, fill=color, outline="")
+
+        self.status.config(text=f"  t = [{self.view_start:.0f} → {self.view_end:.0f}]   "
+                                f"Procesos {self.first_lane + 1}-{last_lane} de {len(self.pids)}   "
+                                f"Intervalos: {len(self.index)}")
+
+    def zoom(self, factor:float, x:int | None=None):
+        """Scale the time window by factor around the time under x (the center by default)"""
+        anchor = self.time_at(x) if x is not None else (self.view_start + self.view_end) / 2
+        span = max(1.0, (self.view_end - self.view_start) * factor)
+        ratio = (anchor - self.view_start) / (self.view_end - self.view_start)
+        self.view_start = anchor - span * ratio
+        self.view_end = self.view_start + span
+        self.redraw()
+
+    def pan(self, fraction:float):
+        """Move the time window by a fraction of its width"""
+        shift = (self.view_end - self.view_start) * fraction
+        self.view_start += shift
+        self.view_end += shift
+        self.redraw()
+
+    def scroll_lanes(self, rows:int):
+        self.first_lane = min(max(0, self.first_lane + rows), max(0, len(self.pids) - self.visible_lanes))
+        self.redraw()
+
+    def reset_view(self):
+        self.view_start = self.index.start_time or 0
+        self.view_end = max(self.index.end_time or 1, self.view_start + 1)
+        self.first_lane = 0
+        self.redraw()
+
+    def on_press(self, event):
+        self._drag_x = event.x
+
+    def on_drag(self, event):
+        if self._drag_x is None:
+            return
+        self.pan((self._drag_x - event.x) / self.plot_width)
+        self._drag_x = event.x
+
+    def on_wheel(self, event):
+        self.zoom(1 / ZOOM_STEP if event.delta > 0 else ZOOM_STEP, event.x)
+
+    def run(self):
+        """Start the GUI main loop"""
+        self.root.mainloop()
@@ -0,0 +1,181 @@
+import mmap
+import os
+import struct
+from models.process import Process
+from workloads.loader import TraceReader
+
+MAGIC = b"OSWL"
+VERSION = 1
+
+# magic, version, record size, record count, user table offset, user count
+HEADER = struct.Struct("<4sHHQQQ")
+# pid, arrival, burst, priority, user index
+RECORD = struct.Struct("<qqqii")
+USER_LENGTH = struct.Struct("<H")
+
+RECORD_FIELDS = (
+    ("pid", "<i8"),
+    ("arrival", "<i8"),
+    ("burst", "<i8"),
+    ("priority", "<i4"),
+    ("user", "<i4"),
+)
+
+
+def is_binary_workload(filepath:str) -> bool:
+    """
+    Check if a file starts with the binary workload magic
+    """
+    with open(filepath, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_workload(filepath:str, rows, batch_size:int=10000) -> int:
+    """
+    Write (pid, arrival, burst, priority, user) rows in the binary format.
+
+    Layout (little-endian):
+        header, count fixed-width records, then the interned user table
+        as (u16 length, utf-8 name) entries. Rows are streamed to disk in
+        batches; the header is rewritten at the end with the final counts.
+
+    Returns:
+        Number of records written
+    """
+    users = {}
+    count = 0
+    with open(filepath, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0, 0, 0))
+
+        batch = []
+        for pid, arrival, burst, priority, user in rows:
+            user_id = users.setdefault(user, len(users))
+            batch.append(RECORD.pack(pid, arrival, burst, priority, user_id))
+            if len(batch) >= batch_size:
+                f.write(b"".join(batch))
+                count += len(batch)
+                batch.clear()
+        f.write(b"".join(batch))
+        count += len(batch)
+
+        users_offset = f.tell()
+        for name in users:
+            encoded = name.encode("utf-8")
+            f.write(USER_LENGTH.pack(len(encoded)) + encoded)
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count, users_offset, len(users)))
+    return count
+
+
+def convert_trace(source:str, destination:str, error_budget:int | None=None) -> int:
+    """
+    Convert a text trace (plain or compressed) to the binary format
+    """
+    return write_workload(destination, TraceReader(source, error_budget=error_budget).rows())
+
+
+class BinaryWorkload:
+    """
+    Read-only, memory-mapped binary workload.
+    Nothing is parsed up front except the header and the user table:
+    records() exposes the records as a zero-copy NumPy structured array
+    and rows()/processes() decode them on the fly without NumPy.
+    The mapping is released by close() or at the end of a with block.
+    """
+
+    def __init__(self, filepath:str) -> None:
+        self.filepath = filepath
+        self._map = None
+        with open(filepath, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError(f"{filepath} no es un workload binario (archivo vacío o truncado)")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_header()
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_header(self) -> None:
+        """
+        Validate the header and load the user table, every offset is checked
+        against the file size so a truncated file fails here and not while reading
+        """
+        size = len(self._map)
+        magic, version, record_size, count, users_offset, user_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.filepath} no es un workload binario")
+        if version != VERSION or record_size != RECORD.size:
+            raise ValueError(f"{self.filepath}: versión {version} no soportada")
+        if HEADER.size + count * RECORD.size > size or users_offset < HEADER.size + count * RECORD.size:
+            raise ValueError(f"{self.filepath}: workload truncado, {count} registros no caben en {size} bytes")
+
+        self.count = count
+        self.users = []
+        offset = users_offset
+        for index in range(user_count):
+            if offset + USER_LENGTH.size > size:
+                raise ValueError(f"{self.filepath}: tabla de usuarios truncada en el usuario {index}")
+            (length,) = USER_LENGTH.unpack_from(self._map, offset)
+            offset += USER_LENGTH.size
+            if offset + length > size:
+                raise ValueError(f"{self.filepath}: tabla de usuarios truncada en el usuario {index}")
+            self.users.append(self._map[offset:offset + length].decode("utf-8"))
+            offset += length
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "BinaryWorkload":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmap the file. NumPy views returned by records() (and ProcessTables
+        built on them) must not be used afterwards, and have to be dropped
+        first or the mapping cannot be released.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def records(self):
+        """
+        Zero-copy NumPy view of the records (fields pid, arrival, burst, priority, user)
+        """
+        import numpy as np
+        return np.frombuffer(self._map, dtype=np.dtype(list(RECORD_FIELDS)), count=self.count, offset=HEADER.size)
+
+    def rows(self):
+        """
+        Yield (pid, arrival, burst, priority, user) tuples
+        """
+        users = self.users
+        data = memoryview(self._map)[HEADER.size:HEADER.size + self.count * RECORD.size]
+        for pid, arrival, burst, priority, user_id in RECORD.iter_unpack(data):
+            yield (pid, arrival, burst, priority, users[user_id])
+
+    def processes(self):
+        """
+        Yield a new Process for every record
+        """
+        for pid, arrival, burst, priority, user in self.rows():
+            yield Process(pid, burst, arrival, priority, user)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convierte una traza de procesos al formato binario")
+    parser.add_argument("source", help="Traza pid,arrival,burst,priority,user (puede estar comprimida)")
+    parser.add_argument("destination", help="Archivo binario de salida")
+    parser.add_argument("--error-budget", type=int, default=None, help="Líneas inválidas toleradas")
+    args = parser.parse_args()
+
+    written = convert_trace(args.source, args.destination, args.error_budget)
+    print(f"[OK] {written} procesos escritos en {args.destination}")
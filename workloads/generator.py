@@ -0,0 +1,182 @@
+import bisect
+import bz2
+import gzip
+import itertools
+import lzma
+import math
+import random
+from models.process import Process
+
+ARRIVAL_PROCESSES = ("poisson", "bursty")
+BURST_DISTRIBUTIONS = ("exponential", "pareto", "lognormal")
+
+COMPRESSED_WRITERS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+
+
+class WorkloadGenerator:
+    """
+    Seeded generator of synthetic process traces.
+    Rows are produced one at a time, so any number of processes can be
+    streamed to a file or straight into a scheduler without building
+    them in memory. The same seed and parameters always give the same trace.
+    """
+
+    def __init__(self, seed:int=0, arrivals:str="poisson", rate:float=1.0, burstiness:float=10.0,
+                 burst_length:float=50.0, bursts:str="exponential", mean_burst:float=10.0,
+                 shape:float=1.5, max_burst:int | None=None, priority_weights=(1.0,), users=None) -> None:
+        """
+        Args:
+            seed: Random seed
+            arrivals: "poisson" or "bursty" (two-state Markov-modulated Poisson)
+            rate: Mean arrivals per time unit
+            burstiness: Square root of the ratio between the ON and OFF rates of the bursty source
+            burst_length: Mean number of arrivals before the bursty source switches state
+            bursts: CPU burst distribution, "exponential", "pareto" or "lognormal"
+            mean_burst: Mean CPU burst
+            shape: Pareto alpha (> 1) or lognormal sigma
+            max_burst: Optional cap for heavy-tailed bursts
+            priority_weights: Relative weight of each priority level (index = priority)
+            users: Mapping of user name to relative weight
+        """
+        if arrivals not in ARRIVAL_PROCESSES:
+            raise ValueError(f"Proceso de llegadas desconocido: {arrivals}")
+        if bursts not in BURST_DISTRIBUTIONS:
+            raise ValueError(f"Distribución de ráfagas desconocida: {bursts}")
+        if bursts == "pareto" and shape <= 1:
+            raise ValueError("La distribución de Pareto necesita shape > 1 para tener media finita")
+
+        self.seed = seed
+        self.arrivals = arrivals
+        self.rate = rate
+        self.burstiness = burstiness
+        self.burst_length = burst_length
+        self.bursts = bursts
+        self.mean_burst = mean_burst
+        self.shape = shape
+        self.max_burst = max_burst
+        self.priority_weights = list(itertools.accumulate(priority_weights))
+        users = users or {"alice": 1.0, "bob": 1.0, "root": 1.0}
+        self.user_names = list(users)
+        self.user_weights = list(itertools.accumulate(users.values()))
+
+    def rows(self, count:int):
+        """
+        Yield count (pid, arrival, burst, priority, user) rows in arrival order
+        """
+        rng = random.Random(self.seed)
+        next_gap = self._arrival_gaps(rng)
+        next_burst = self._burst_sampler(rng)
+        priority_total = self.priority_weights[-1]
+        user_total = self.user_weights[-1]
+
+        time = 0.0
+        for pid in range(1, count + 1):
+            time += next_gap()
+            priority = bisect.bisect(self.priority_weights, rng.random() * priority_total)
+            user = self.user_names[bisect.bisect(self.user_weights, rng.random() * user_total)]
+            yield (pid, int(time), next_burst(), priority, user)
+
+    def processes(self, count:int):
+        """
+        Yield count new Process objects in arrival order
+        """
+        for pid, arrival, burst, priority, user in self.rows(count):
+            yield Process(pid, burst, arrival, priority, user)
+
+    def _arrival_gaps(self, rng):
+        if self.arrivals == "poisson":
+            return lambda: rng.expovariate(self.rate)
+
+        # Bursty: ON and OFF states with high and low rates, switching on average every burst_length arrivals.
+        # Half the arrivals come from each state, so the mean gap is the mean of 1/ON and 1/OFF;
+        # the rates c*b and c/b are scaled by c so that it is 1/rate
+        scale = self.rate * (self.burstiness + 1 / self.burstiness) / 2
+        rates = (scale * self.burstiness, scale / self.burstiness)
+        switch_probability = 1.0 / self.burst_length
+        state = [0]
+
+        def gap():
+            if rng.random() < switch_probability:
+                state[0] = 1 - state[0]
+            return rng.expovariate(rates[state[0]])
+
+        return gap
+
+    def _burst_sampler(self, rng):
+        if self.bursts == "exponential":
+            sample = lambda: rng.expovariate(1.0 / self.mean_burst)
+        elif self.bursts == "pareto":
+            scale = self.mean_burst * (self.shape - 1) / self.shape
+            sample = lambda: scale * rng.paretovariate(self.shape)
+        else:
+            mu = math.log(self.mean_burst) - self.shape ** 2 / 2
+            sample = lambda: rng.lognormvariate(mu, self.shape)
+
+        cap = self.max_burst
+        if cap is None:
+            return lambda: max(1, math.ceil(sample()))
+        return lambda: min(cap, max(1, math.ceil(sample())))
+
+
+def write_trace(filepath:str, rows, batch_size:int=10000) -> int:
+    """
+    Write rows in the pid,arrival,burst,priority,user text format.
+    Files ending in .gz, .bz2 or .xz are compressed.
+
+    Returns:
+        Number of rows written
+    """
+    opener = next((writer for suffix, writer in COMPRESSED_WRITERS.items() if filepath.endswith(suffix)), open)
+    rows = iter(rows)
+    count = 0
+    with opener(filepath, "wt", encoding="utf-8", newline="") as f:
+        f.write("# pid,arrival,burst,priority,user\n")
+        while True:
+            batch = [f"{pid},{arrival},{burst},{priority},{user}\n" for pid, arrival, burst, priority, user in itertools.islice(rows, batch_size)]
+            if not batch:
+                return count
+            f.writelines(batch)
+            count += len(batch)
+
+
+if __name__ == "__main__":
+    import argparse
+    from workloads.binary import write_workload
+
+    parser = argparse.ArgumentParser(description="Genera trazas sintéticas de procesos")
+    parser.add_argument("output", help="Archivo de salida (.gz/.bz2/.xz para comprimir, .oswl para binario)")
+    parser.add_argument("-n", "--count", type=int, default=1000, help="Número de procesos")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrivals", choices=ARRIVAL_PROCESSES, default="poisson")
+    parser.add_argument("--rate", type=float, default=1.0, help="Llegadas promedio por unidad de tiempo")
+    parser.add_argument("--burstiness", type=float, default=10.0)
+    parser.add_argument("--bursts", choices=BURST_DISTRIBUTIONS, default="exponential")
+    parser.add_argument("--mean-burst", type=float, default=10.0)
+    parser.add_argument("--shape", type=float, default=1.5, help="alpha de Pareto o sigma de lognormal")
+    parser.add_argument("--max-burst", type=int, default=None)
+    parser.add_argument("--priorities", default="1", help="Pesos por prioridad, ej. 1,2,1")
+    parser.add_argument("--users", default="alice:1,bob:1,root:1", help="Usuarios con peso, ej. alice:3,bob:1")
+    args = parser.parse_args()
+
+    generator = WorkloadGenerator(
+        seed=args.seed,
+        arrivals=args.arrivals,
+        rate=args.rate,
+        burstiness=args.burstiness,
+        bursts=args.bursts,
+        mean_burst=args.mean_burst,
+        shape=args.shape,
+        max_burst=args.max_burst,
+        priority_weights=[float(w) for w in args.priorities.split(",")],
+        users={name: float(weight) for name, weight in (item.split(":") for item in args.users.split(","))},
+    )
+    rows = generator.rows(args.count)
+    if args.output.endswith(".oswl"):
+        written = write_workload(args.output, rows)
+    else:
+        written = write_trace(args.output, rows)
+    print(f"[OK] {written} procesos escritos en {args.output}")
@@ -0,0 +1,239 @@
+import bz2
+import csv
+import gzip
+import heapq
+import itertools
+import lzma
+from models.process import Process
+
+COMPRESSED_FORMATS = (
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+)
+# Diagnostics kept when the error budget is unlimited, the rest are only counted
+MAX_DIAGNOSTICS = 1000
+
+
+class LoadDiagnostic:
+    """
+    Problem found in one line of a process trace
+    """
+
+    def __init__(self, line_num:int, message:str, text:str="") -> None:
+        self.line_num = line_num
+        self.message = message
+        self.text = text
+
+    def __str__(self) -> str:
+        return f"Línea {self.line_num}: {self.message}"
+
+
+class TraceLoadError(ValueError):
+    """
+    Raised when a trace has more invalid lines than the error budget allows
+    """
+
+    def __init__(self, diagnostics:list) -> None:
+        super().__init__(f"{len(diagnostics)} líneas inválidas, la última: {diagnostics[-1]}")
+        self.diagnostics = diagnostics
+
+
+def open_trace(filepath:str):
+    """
+    Open a trace as text, transparently decompressing gzip, bz2 or xz files
+    """
+    with open(filepath, "rb") as f:
+        magic = f.read(6)
+
+    for prefix, opener in COMPRESSED_FORMATS:
+        if magic.startswith(prefix):
+            return opener(filepath, "rt", encoding="utf-8", newline="")
+    return open(filepath, "r", encoding="utf-8", newline="")
+
+
+class TraceReader:
+    """
+    Streaming reader for traces in the pid,arrival,burst,priority,user format.
+    An optional sixth column lists the I/O steps that follow the first CPU
+    burst as device:io_time:cpu_time entries separated by ";" (for example
+    disk:4:2;net:3:1).
+    Lines are parsed in chunks with the csv module and validated one by one:
+    invalid lines are recorded in `diagnostics` and skipped until the error
+    budget is exhausted. Rows can be forced into arrival order with a
+    bounded reorder window, so processes can be fed to a scheduler lazily.
+    At most error_budget + 1 (or MAX_DIAGNOSTICS) diagnostics are kept,
+    `invalid_lines` counts all of them. Binary workloads are read straight
+    from their mapping, their records numbered like lines.
+    """
+
+    def __init__(self, filepath:str, error_budget:int | None=None, reorder_window:int | None=None,
+                 chunk_size:int=10000, sorted_input:bool=False) -> None:
+        """
+        Args:
+            filepath: Plain or gzip/bz2/xz compressed trace, or binary workload
+            error_budget: Invalid lines tolerated before raising TraceLoadError (None = unlimited)
+            reorder_window: Rows buffered to put them in arrival order (None = keep file order)
+            chunk_size: Lines parsed per chunk
+            sorted_input: Without a reorder window, raise ValueError on the first
+                          row that arrives before the previous one
+        """
+        self.filepath = filepath
+        self.error_budget = error_budget
+        self.reorder_window = reorder_window
+        self.chunk_size = chunk_size
+        self.sorted_input = sorted_input
+        self.diagnostics = []
+        self.invalid_lines = 0
+
+    def records(self):
+        """
+        Yield valid (pid, arrival, burst, priority, user, io) tuples, io being a
+        tuple of (device, io_time, cpu_time) steps (empty for CPU-only processes)
+        """
+        for line_num, row in self._numbered():
+            yield row
+
+    def rows(self):
+        """
+        Yield valid (pid, arrival, burst, priority, user) tuples, the CPU-only
+        columns used by the binary format and the ProcessTable
+
+        Raises:
+            ValueError: If a process has I/O steps, which these columns cannot hold
+        """
+        for line_num, row in self._numbered():
+            if row[5]:
+                raise ValueError(f"Línea {line_num}: el proceso {row[0]} tiene pasos de E/S, "
+                                 f"el formato binario y ProcessTable solo admiten procesos de CPU")
+            yield row[:5]
+
+    def processes(self):
+        """
+        Yield a new Process for every valid row
+        """
+        for pid, arrival, burst, priority, user, io in self.records():
+            yield Process(pid, burst, arrival, priority, user, io)
+
+    def _numbered(self):
+        rows = self._parse()
+        if self.reorder_window is not None:
+            rows = self._in_arrival_order(rows)
+        elif self.sorted_input:
+            rows = self._check_order(rows)
+        return rows
+
+    def _check_order(self, rows):
+        last_arrival = None
+        for line_num, row in rows:
+            if last_arrival is not None and row[1] < last_arrival:
+                raise ValueError(f"Línea {line_num}: llegada {row[1]} fuera de orden (la anterior es {last_arrival}), "
+                                 f"ordene la traza o use una ventana de reordenamiento")
+            last_arrival = row[1]
+            yield line_num, row
+
+    def _parse(self):
+        from workloads.binary import is_binary_workload
+
+        if is_binary_workload(self.filepath):
+            yield from self._parse_binary()
+            return
+        seen_pids = set()
+        with open_trace(self.filepath) as f:
+            lines = enumerate(csv.reader(f), 1)
+            while True:
+                chunk = list(itertools.islice(lines, self.chunk_size))
+                if not chunk:
+                    return
+                for line_num, parts in chunk:
+                    if not parts or not parts[0].strip() or parts[0].lstrip().startswith("#"):
+                        continue
+
+                    row = self._parse_row(line_num, parts)
+                    if row is None:
+                        continue
+                    if row[0] in seen_pids:
+                        self._report(line_num, f"PID duplicado {row[0]}", parts)
+                        continue
+                    seen_pids.add(row[0])
+                    yield line_num, row
+
+    def _parse_binary(self):
+        """
+        Records of a binary workload, already validated when it was written
+        """
+        from workloads.binary import BinaryWorkload
+
+        with BinaryWorkload(self.filepath) as workload:
+            rows = workload.rows()
+            try:
+                for record_num, row in enumerate(rows, 1):
+                    yield record_num, row + ((),)
+            finally:
+                # Drop the view of the mapping before it is closed
+                rows.close()
+
+    def _parse_row(self, line_num:int, parts:list):
+        if len(parts) < 5:
+            self._report(line_num, f"se esperaban 5 campos, hay {len(parts)}", parts)
+            return None
+        try:
+            pid, arrival, burst, priority = (int(value) for value in parts[:4])
+        except ValueError:
+            self._report(line_num, "pid, arrival, burst y priority deben ser enteros", parts)
+            return None
+        if arrival < 0 or burst < 0:
+            self._report(line_num, "arrival y burst no pueden ser negativos", parts)
+            return None
+        io = ()
+        if len(parts) > 5 and parts[5].strip():
+            io = self._parse_io(parts[5])
+            if io is None:
+                self._report(line_num, "pasos de E/S inválidos, formato dispositivo:e/s:cpu;...", parts)
+                return None
+        return (pid, arrival, burst, priority, parts[4].strip(), io)
+
+    @staticmethod
+    def _parse_io(text:str):
+        """
+        Parse device:io_time:cpu_time;... into steps, None if malformed
+        """
+        steps = []
+        for entry in text.split(";"):
+            fields = entry.strip().split(":")
+            if len(fields) != 3 or not fields[0]:
+                return None
+            try:
+                io_time, cpu_time = int(fields[1]), int(fields[2])
+            except ValueError:
+                return None
+            if io_time < 0 or cpu_time <= 0:
+                return None
+            steps.append((fields[0], io_time, cpu_time))
+        return tuple(steps)
+
+    def _in_arrival_order(self, rows):
+        """
+        Emit rows sorted by arrival using a heap of at most reorder_window rows
+        """
+        buffer = []
+        last_arrival = None
+        for line_num, row in rows:
+            if last_arrival is not None and row[1] < last_arrival:
+                self._report(line_num, f"llegada {row[1]} fuera de orden (ventana {self.reorder_window})", row)
+                continue
+            heapq.heappush(buffer, (row[1], line_num, row))
+            if len(buffer) > self.reorder_window:
+                last_arrival, first_line, first = heapq.heappop(buffer)
+                yield first_line, first
+        while buffer:
+            _, line_num, row = heapq.heappop(buffer)
+            yield line_num, row
+
+    def _report(self, line_num:int, message:str, parts) -> None:
+        self.invalid_lines += 1
+        limit = MAX_DIAGNOSTICS if self.error_budget is None else self.error_budget + 1
+        if len(self.diagnostics) < limit:
+            self.diagnostics.append(LoadDiagnostic(line_num, message, ",".join(str(p) for p in parts)))
+        if self.error_budget is not None and self.invalid_lines > self.error_budget:
+            raise TraceLoadError(self.diagnostics)
@@ -0,0 +1,66 @@
+from workloads.generator import COMPRESSED_WRITERS
+from workloads.loader import open_trace
+
+RECORD_HEADER = "# pid,arrival,burst,priority,user,start,completion\n"
+
+
+class ProcessRecord:
+    """
+    Streaming on-disk record of finished processes, one text line each:
+    the trace columns followed by the start and completion times.
+    Lines are buffered and written in batches; files ending in .gz, .bz2
+    or .xz are compressed. Used by the retire mode of ProcessManager.
+    """
+
+    def __init__(self, filepath:str, batch_size:int=10000) -> None:
+        opener = next((writer for suffix, writer in COMPRESSED_WRITERS.items() if filepath.endswith(suffix)), open)
+        self._file = opener(filepath, "wt", encoding="utf-8", newline="")
+        self._file.write(RECORD_HEADER)
+        self._buffer = []
+        self.batch_size = batch_size
+        self.count = 0
+
+    def write(self, process) -> None:
+        pcb = process.pcb
+        self._buffer.append(f"{pcb.pid},{pcb.arrival_time},{pcb.burst_time},{pcb.priority},{process.user},"
+                            f"{pcb.start_time},{pcb.completion_time}\n")
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_columns(self, pid, arrival, burst, priority, user, start, completion) -> None:
+        """
+        Write many processes from parallel columns (user holds the names)
+        """
+        self.flush()
+        rows = zip(pid, arrival, burst, priority, user, start, completion)
+        self._file.writelines(f"{p},{a},{b},{pr},{u},{s},{c}\n" for p, a, b, pr, u, s, c in rows)
+        self.count += len(pid)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._file.writelines(self._buffer)
+            self.count += len(self._buffer)
+            self._buffer.clear()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "ProcessRecord":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_records(filepath:str):
+    """
+    Iterate the (pid, arrival, burst, priority, user, start, completion) rows of a record
+    """
+    with open_trace(filepath) as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            pid, arrival, burst, priority, user, start, completion = line.rstrip("\n").split(",")
+            yield (int(pid), int(arrival), int(burst), int(priority), user, int(start), int(completion))
@@ -0,0 +1,113 @@
+from models.process_manager import ProcessManager
+from workloads.binary import BinaryWorkload, is_binary_workload
+from workloads.loader import TraceReader
+
+BACKENDS = ("auto", "table", "objects")
+
+
+class Workload:
+    """
+    Immutable workload spec, parsed once and shared by any number of runs.
+    Schedulers never touch it directly: every run gets its own
+    ProcessManager from process_manager(), either a ProcessTable whose
+    static columns are read-only views of the workload (copied only if a
+    run writes to them) or fresh Process objects built from the rows.
+    Runs can then follow each other, or run concurrently in threads,
+    without re-reading or deep-copying the trace.
+    """
+
+    def __init__(self, rows=(), binary:BinaryWorkload | None=None, diagnostics=()) -> None:
+        """
+        Args:
+            rows: (pid, arrival, burst, priority, user) rows
+            binary: Memory-mapped binary workload to read instead of rows
+            diagnostics: Problems reported while parsing the source trace
+        """
+        self._binary = binary
+        self._rows = () if binary is not None else tuple(rows)
+        self.diagnostics = tuple(diagnostics)
+        self._columns = None
+
+    @classmethod
+    def from_rows(cls, rows) -> "Workload":
+        return cls(rows)
+
+    @classmethod
+    def from_file(cls, filepath:str, error_budget:int | None=None) -> "Workload":
+        """
+        Parse a trace once (plain, compressed or binary workload).
+        Binary workloads stay memory-mapped, nothing is copied.
+
+        Raises:
+            TraceLoadError: If the trace has more than error_budget invalid lines
+        """
+        if is_binary_workload(filepath):
+            return cls(binary=BinaryWorkload(filepath))
+        reader = TraceReader(filepath, error_budget=error_budget)
+        return cls(reader.rows(), diagnostics=reader.diagnostics)
+
+    def __len__(self) -> int:
+        return len(self._binary) if self._binary is not None else len(self._rows)
+
+    def __enter__(self) -> "Workload":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the mapping of a binary workload; tables from table() must be dropped first
+        """
+        if self._binary is not None:
+            self._binary.close()
+
+    def rows(self):
+        """
+        Yield the (pid, arrival, burst, priority, user) rows
+        """
+        if self._binary is not None:
+            return self._binary.rows()
+        return iter(self._rows)
+
+    def table(self):
+        """
+        New ProcessTable for one run; the static columns are shared, read-only
+        """
+        from models.process_table import ProcessTable
+
+        if self._binary is not None:
+            return ProcessTable.from_binary(self._binary)
+        if self._columns is None:
+            template = ProcessTable.from_rows(self._rows)
+            columns = (template.pid, template.arrival, template.burst, template.priority, template.user)
+            for column in columns:
+                column.flags.writeable = False
+            self._columns = columns + (tuple(template.users),)
+        return ProcessTable(*self._columns)
+
+    def process_manager(self, backend:str="auto") -> ProcessManager:
+        """
+        New ProcessManager holding fresh per-run state for this workload.
+
+        Args:
+            backend: "table" (NumPy columns), "objects" (Process objects) or
+                     "auto" (table when NumPy is installed)
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend desconocido: {backend}")
+        if backend == "auto":
+            try:
+                import numpy  # noqa: F401
+            except ImportError:
+                backend = "objects"
+            else:
+                backend = "table"
+
+        pm = ProcessManager()
+        if backend == "table":
+            pm.load_table(self.table())
+        else:
+            for pid, arrival, burst, priority, user in self.rows():
+                pm.create_process(pid, burst, arrival, priority, user)
+        return pm